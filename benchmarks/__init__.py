@@ -0,0 +1,5 @@
+"""
+    benchmarks 패키지 선언
+
+    rcctl 커맨드의 성능을 로컬 클러스터에서 측정하는 스크립트 모음 (rcctl 실행에는 사용되지 않음)
+"""
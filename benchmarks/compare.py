@@ -0,0 +1,57 @@
+"""
+    두 벤치마크 결과(JSON)의 같은 조건 측정값 비교
+
+    python -m benchmarks.compare benchmarks/results/<이전>.json benchmarks/results/<이후>.json
+"""
+import argparse
+import json
+
+from benchmarks.run import case_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description="두 벤치마크 결과 비교 (summary 중앙값 기준)")
+    parser.add_argument("base", help="기준 결과 JSON")
+    parser.add_argument("target", help="비교할 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=5.0, help="이 비율(%%) 이상 차이를 개선/저하로 표시 (기본: 5)")
+    args = parser.parse_args()
+
+    base, target = load(args.base), load(args.target)
+    print(f"기준: {describe(base)}")
+    print(f"비교: {describe(target)}\n")
+
+    base_rows = {case_key(row): row for row in base["summary"]}
+    for row in target["summary"]:
+        old = base_rows.pop(case_key(row), None)
+        label = f"{row['scenario']:<9} " + ", ".join(
+            f"{k}={v}" for k, v in row.items() if k not in ("scenario", "seconds", "keys_per_sec", "runs"))
+        if old is None:
+            print(f"    {label}: 기준 결과 없음")
+            continue
+        # 처리량이 있으면 처리량(클수록 좋음), 없으면 소요 시간(작을수록 좋음) 기준
+        if "keys_per_sec" in row:
+            metric, before, after, better = "keys/s", old["keys_per_sec"], row["keys_per_sec"], 1
+        else:
+            metric, before, after, better = "초", old["seconds"], row["seconds"], -1
+        change = (after - before) / before * 100 if before else 0.0
+        mark = "  "
+        if abs(change) >= args.threshold:
+            mark = "✅" if change * better > 0 else "⚠️"
+        print(f" {mark} {label}: {before:,.3f} → {after:,.3f} {metric} ({change:+.1f}%)")
+    for row in base_rows.values():
+        print(f"    {row['scenario']}: 비교 결과 없음")
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def describe(report):
+    commit = (report.get("commit") or "?")[:8]
+    dirty = " (수정됨)" if report.get("dirty") else ""
+    return f"{commit}{dirty} {report.get('created_at')} / {report.get('redis_server') or 'redis-server ?'}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1093 @@
+"""
+    rcctl 확장성 테스트용 가짜 Redis Cluster (asyncio RESP 서버)
+
+    프로세스 하나에서 노드 수천 개를 로컬 포트로 띄우고, 모든 노드가 하나의 공유 상태(가십이 수렴한 결과)를 보도록 해
+    redis-server 없이도 큰 클러스터에서 rcctl 자체의 파싱 / 팬아웃 / 메모리 부담을 측정.
+    rcctl이 쓰는 명령(CLUSTER NODES/MEET/ADDSLOTS/SETSLOT/GETKEYSINSLOT/FORGET/RESET/REPLICATE/MYID, MIGRATE, INFO, SET 등)만 지원.
+
+    python -m benchmarks.fake_cluster --nodes 1000 --base-port 30001 --latency-ms 1 --addrs-file logs/fake-addrs.txt
+    ./rcctl --password lineplus create --replicas 1 $(cat logs/fake-addrs.txt)
+"""
+import argparse
+import asyncio
+import fnmatch
+import itertools
+import os
+import random
+import threading
+import time
+from redis.crc import key_slot
+
+from utils.redis_utils import RedisUtils
+from utils.string_utils import StringUtils
+from benchmarks.local_cluster import config_value
+
+VERSION = "7.2.0"
+DUMP_PREFIX = b"FAKEDUMP"   # DUMP 페이로드 = 접두어 + 값 (RESTORE에서 검증)
+FORGET_BAN = 60.0           # CLUSTER FORGET 후 다시 보이지 않는 시간(초)
+RUNNING_NODES = {}          # (host, port) → FakeNode, 프로세스 안의 모든 가짜 클러스터 (다른 클러스터로의 MIGRATE용)
+
+
+class CommandError(Exception):
+    """
+    클라이언트에 오류 응답(-ERR ..., -MOVED ... 등)으로 돌려줄 명령 오류. 메시지는 오류 접두어 포함
+    """
+
+
+class Status(str):
+    """
+    단순 문자열 응답 (+OK)
+    """
+
+
+OK = Status("OK")
+
+
+def encode(value, resp3=False):
+    """
+    응답 값을 RESP2(resp3=True면 RESP3)로 인코딩 (None → nil, int → 정수, str/bytes → bulk, list → 배열, dict → 맵)
+    """
+    if value is None:
+        return b"_\r\n" if resp3 else b"$-1\r\n"
+    if isinstance(value, Status):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, CommandError):
+        return b"-%s\r\n" % str(value).encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, (bytes, bytearray)):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, dict):
+        if resp3:
+            return b"%%%d\r\n" % len(value) + b"".join(encode(k, resp3) + encode(v, resp3) for k, v in value.items())
+        value = [item for pair in value.items() for item in pair]
+    return b"*%d\r\n" % len(value) + b"".join(encode(item, resp3) for item in value)
+
+
+def parse_commands(buf):
+    """
+    buf에서 완성된 RESP 배열 명령들을 꺼냄. ([인자 목록], 소비한 바이트 수) 반환
+    (덜 받은 마지막 명령은 남겨 두고 다음 read와 이어 붙여 다시 파싱)
+    """
+    commands = []
+    pos, end = 0, len(buf)
+    while pos < end:
+        if buf[pos] != ord("*"):
+            raise CommandError("ERR Protocol error: inline commands are not supported")
+        line_end = buf.find(b"\r\n", pos)
+        if line_end < 0:
+            break
+        cursor = line_end + 2
+        args = []
+        for _ in range(int(buf[pos + 1:line_end])):
+            line_end = buf.find(b"\r\n", cursor)
+            if line_end < 0:
+                break
+            start = line_end + 2
+            length = int(buf[cursor + 1:line_end])
+            if start + length + 2 > end:
+                break
+            args.append(bytes(buf[start:start + length]))
+            cursor = start + length + 2
+        else:
+            commands.append(args)
+            pos = cursor
+            continue
+        break
+    return commands, pos
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def new_node_id():
+    return os.urandom(20).hex()
+
+
+def parse_slot(arg):
+    try:
+        slot = int(arg)
+    except ValueError:
+        slot = -1
+    if not 0 <= slot < RedisUtils.TOTAL_SLOTS:
+        raise CommandError("ERR Invalid or out of range slot")
+    return slot
+
+
+class Keyspace:
+    """
+    마스터 노드 하나(와 그 리플리카들)가 공유하는 키 저장소. 값은 string(bytes)만 지원.
+    슬롯별 키 목록을 함께 유지해 GETKEYSINSLOT / COUNTKEYSINSLOT / SCAN을 슬롯 단위로 처리.
+    """
+
+    def __init__(self):
+        self.data = {}          # key → value
+        self.expires = {}       # key → 만료 시각 (ms)
+        self.slots = {}         # slot → {key: None} (삽입 순서 유지)
+        self.used_memory = 0
+        self.repl_offset = 0    # 쓰기 바이트 누적 (리플리카도 같은 값을 보므로 복제 지연은 항상 0)
+
+    def __len__(self):
+        return len(self.data)
+
+    @staticmethod
+    def memory_usage(key, value):
+        """
+        MEMORY USAGE 근사값 (키 + 값 + 객체 오버헤드)
+        """
+        return len(key) + len(value) + 50
+
+    def get(self, key):
+        expire_at = self.expires.get(key)
+        if expire_at is not None and expire_at <= now_ms():
+            self.delete(key)
+        return self.data.get(key)
+
+    def set(self, key, value, expire_at=None):
+        old = self.data.get(key)
+        if old is None:
+            self.slots.setdefault(key_slot(key), {})[key] = None
+            self.used_memory += Keyspace.memory_usage(key, value)
+        else:
+            self.used_memory += len(value) - len(old)
+        self.data[key] = value
+        if expire_at is None:
+            self.expires.pop(key, None)
+        else:
+            self.expires[key] = expire_at
+        self.repl_offset += len(key) + len(value)
+
+    def delete(self, key):
+        value = self.data.pop(key, None)
+        if value is None:
+            return False
+        self.expires.pop(key, None)
+        slot = key_slot(key)
+        keys = self.slots[slot]
+        del keys[key]
+        if not keys:
+            del self.slots[slot]
+        self.used_memory -= Keyspace.memory_usage(key, value)
+        self.repl_offset += len(key)
+        return True
+
+    def pttl(self, key):
+        if self.get(key) is None:
+            return -2
+        expire_at = self.expires.get(key)
+        return -1 if expire_at is None else max(expire_at - now_ms(), 0)
+
+    def keys_in_slot(self, slot, count):
+        return list(itertools.islice(self.slots.get(slot, ()), count))
+
+    def count_in_slot(self, slot):
+        return len(self.slots.get(slot, ()))
+
+
+class ClientState:
+    """
+    클라이언트 연결 하나의 상태 (인증 여부, HELLO로 정한 RESP 버전, 직전 명령이 ASKING인지)
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, authenticated):
+        self.id = next(ClientState._ids)
+        self.authenticated = authenticated
+        self.protocol = 2
+        self.asking = False
+
+
+class GossipState:
+    """
+    모든 가짜 노드가 공유하는 클러스터 상태 (노드 간 가십이 즉시 수렴한 것으로 단순화).
+    - 슬롯 소유자, 노드 목록, current epoch는 클러스터 전체에 하나
+    - 노드마다 아는 노드 집합(peers)은 MEET으로 합쳐지며 gossip_delay초 뒤에 반영 (같은 집합 객체를 공유)
+    - 토폴로지가 바뀔 때마다 version을 올려 CLUSTER NODES 줄 캐시를 무효화
+    """
+
+    def __init__(self, password=None, latency_ms=0.0, jitter_ms=0.0, gossip_delay=0.0):
+        self.password = password
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.gossip_delay = gossip_delay
+        self.nodes = {}         # node_id → FakeNode
+        self.by_addr = {}       # (host, port) → FakeNode
+        self.slots = [None] * RedisUtils.TOTAL_SLOTS    # slot → 소유 node_id
+        self.slot_counts = {}   # node_id → 소유 슬롯 수
+        self.current_epoch = 0
+        self.version = 0
+        self._lines = (-1, {}, {})  # (version, {node_id: CLUSTER NODES 줄}, {node_id: [(start, end)]})
+
+    def register(self, node):
+        self.nodes[node.id] = node
+        self.by_addr[(node.host, node.port)] = node
+        self.version += 1
+
+    def bump_epoch(self):
+        self.current_epoch += 1
+        return self.current_epoch
+
+    def meet(self, a, b):
+        """
+        a와 b가 속한 두 노드 그룹을 합침 (작은 집합을 큰 집합에 합치고 참조를 옮김)
+        """
+        if a.peers is b.peers:
+            return
+        small, large = sorted((a.peers, b.peers), key=len)
+        large |= small
+        for node_id in small:
+            self.nodes[node_id].peers = large
+        self.version += 1
+
+    def assign_slot(self, slot, node_id):
+        previous = self.slots[slot]
+        if previous == node_id:
+            return
+        if previous is not None:
+            self.slot_counts[previous] -= 1
+            if not self.slot_counts[previous]:
+                del self.slot_counts[previous]
+            self.nodes[previous].migrating.pop(slot, None)
+        if node_id is not None:
+            self.slot_counts[node_id] = self.slot_counts.get(node_id, 0) + 1
+        self.slots[slot] = node_id
+        self.version += 1
+
+    def move_slot(self, slot, node, target):
+        """
+        node가 받은 SETSLOT NODE: node의 MIGRATING/IMPORTING 상태를 정리하고 슬롯 소유자를 target으로 바꿈.
+        실제 클러스터처럼 소유 주장이 엇갈리면 config epoch가 큰 쪽이 이김
+        - 가져오던(IMPORTING) 슬롯을 자신에게 지정하면 합의 없이 epoch를 올려 가장 큰 epoch로 소유
+        - 그 외에는 target의 epoch가 현재 소유자보다 클 때만 반영 (아니면 가십으로 되돌려지는 것과 같음)
+        """
+        imported = node is target and node.importing.pop(slot, None) is not None
+        node.migrating.pop(slot, None)
+        owner = self.nodes.get(self.slots[slot])
+        if imported and target.config_epoch != self.current_epoch:
+            target.config_epoch = self.bump_epoch()
+        if owner is None or imported or target.config_epoch > owner.config_epoch:
+            self.assign_slot(slot, target.id)
+        self.version += 1
+
+    def set_replica(self, node, master):
+        if node.master_id in self.nodes:
+            self.nodes[node.master_id].replicas.discard(node.id)
+        node.role, node.master_id = "slave", master.id
+        node.keyspace = master.keyspace
+        master.replicas.add(node.id)
+        self.version += 1
+
+    def failover(self, replica):
+        """
+        리플리카를 마스터로 승격: 기존 마스터의 슬롯과 리플리카들을 넘겨받고 기존 마스터는 리플리카가 됨
+        """
+        master = self.nodes[replica.master_id]
+        for slot, owner in enumerate(self.slots):
+            if owner == master.id:
+                self.assign_slot(slot, replica.id)
+        replica.replicas = (master.replicas - {replica.id}) | {master.id}
+        master.replicas = set()
+        for node_id in replica.replicas:
+            self.nodes[node_id].role, self.nodes[node_id].master_id = "slave", replica.id
+        replica.role, replica.master_id = "master", None
+        replica.config_epoch = self.bump_epoch()
+        self.version += 1
+
+    def reset(self, node, hard):
+        """
+        CLUSTER RESET: 슬롯 / 복제 관계 / 아는 노드를 모두 잊고 혼자인 마스터로 되돌림 (HARD면 새 노드 ID)
+        """
+        for slot, owner in enumerate(self.slots):
+            if owner == node.id:
+                self.assign_slot(slot, None)
+        if node.master_id in self.nodes:
+            self.nodes[node.master_id].replicas.discard(node.id)
+        node.role, node.master_id = "master", None
+        node.keyspace = Keyspace()
+        node.migrating.clear()
+        node.importing.clear()
+        node.forgotten.clear()
+        node.peers.discard(node.id)
+        node.peers = {node.id}
+        if hard:
+            del self.nodes[node.id]
+            node.id = new_node_id()
+            node.config_epoch = 0
+            self.nodes[node.id] = node
+        self.version += 1
+
+    def node_lines(self):
+        """
+        노드별 CLUSTER NODES 줄(myself 표시 제외)과 소유 슬롯 범위. version마다 한 번만 생성
+        """
+        version, lines, ranges = self._lines
+        if version == self.version:
+            return lines, ranges
+        ranges = {}
+        start = 0
+        for slot in range(1, RedisUtils.TOTAL_SLOTS + 1):
+            if slot == RedisUtils.TOTAL_SLOTS or self.slots[slot] != self.slots[start]:
+                if self.slots[start] is not None:
+                    ranges.setdefault(self.slots[start], []).append((start, slot - 1))
+                start = slot
+        pong = now_ms()
+        lines = {}
+        for node in self.nodes.values():
+            master = self.nodes.get(node.master_id)
+            epoch = master.config_epoch if master else node.config_epoch
+            parts = [node.id, f"{node.host}:{node.port}@{node.port + 10000}", node.role, node.master_id or "-",
+                     "0", str(pong), str(epoch), "connected"]
+            parts += [str(s) if s == e else f"{s}-{e}" for s, e in ranges.get(node.id, ())]
+            lines[node.id] = " ".join(parts)
+        self._lines = (self.version, lines, ranges)
+        return lines, ranges
+
+
+class FakeNode:
+    """
+    가짜 클러스터 노드 하나. 명령은 cmd_<이름> / cluster_<하위 명령> 메서드로 처리
+    """
+    COMMAND_TABLE = [
+        # (이름, arity, flags, 첫 키, 마지막 키, 간격) - redis-py RedisCluster의 키 위치 파악용
+        ("get", 2, ["readonly"], 1, 1, 1),
+        ("set", -3, ["write"], 1, 1, 1),
+        ("mset", -3, ["write"], 1, -1, 2),
+        ("del", -2, ["write"], 1, -1, 1),
+        ("unlink", -2, ["write"], 1, -1, 1),
+        ("exists", -2, ["readonly"], 1, -1, 1),
+        ("type", 2, ["readonly"], 1, 1, 1),
+        ("pttl", 2, ["readonly"], 1, 1, 1),
+        ("ttl", 2, ["readonly"], 1, 1, 1),
+        ("dump", 2, ["readonly"], 1, 1, 1),
+        ("restore", -4, ["write"], 1, 1, 1),
+        ("memory", -2, ["readonly"], 0, 0, 0),
+        ("migrate", -6, ["write"], 3, 3, 1),
+        ("scan", -2, ["readonly"], 0, 0, 0),
+        ("dbsize", 1, ["readonly"], 0, 0, 0),
+        ("flushall", -1, ["write"], 0, 0, 0),
+        ("info", -1, ["loading", "stale"], 0, 0, 0),
+        ("cluster", -2, ["admin"], 0, 0, 0),
+        ("command", -1, ["loading", "stale"], 0, 0, 0),
+        ("ping", -1, ["fast"], 0, 0, 0),
+        ("auth", -2, ["noscript", "loading", "stale", "fast"], 0, 0, 0),
+        ("hello", -1, ["noscript", "loading", "stale", "fast"], 0, 0, 0),
+        ("client", -2, ["admin"], 0, 0, 0),
+        ("select", 2, ["loading", "stale", "fast"], 0, 0, 0),
+        ("asking", 1, ["fast"], 0, 0, 0),
+        ("readonly", 1, ["fast"], 0, 0, 0),
+        ("readwrite", 1, ["fast"], 0, 0, 0),
+    ]
+
+    def __init__(self, state, host, port):
+        self.state = state
+        self.host = host
+        self.port = port
+        self.id = new_node_id()
+        self.role = "master"
+        self.master_id = None
+        self.config_epoch = 0
+        self.keyspace = Keyspace()
+        self.replicas = set()   # 이 마스터를 복제하는 node_id
+        self.peers = {self.id}  # 아는 노드 (MEET으로 합쳐진 그룹이 같은 집합을 공유)
+        self.forgotten = {}     # node_id → FORGET 만료 시각
+        self.migrating = {}     # slot → 대상 node_id
+        self.importing = {}     # slot → 원본 node_id
+        self.latency_ms = None  # 노드별 주입 지연 (None이면 클러스터 기본값)
+        self.started = time.time()
+        self.stats = {"connections": 0, "clients": 0, "commands": 0, "net_in": 0, "net_out": 0, "hits": 0, "misses": 0}
+
+    @property
+    def addr(self):
+        return f"{self.host}:{self.port}"
+
+    def round_trip_delay(self):
+        """
+        응답 전에 주입할 지연(초): 노드별 지연(없으면 클러스터 기본값) + 0~jitter_ms 무작위
+        """
+        latency = self.state.latency_ms if self.latency_ms is None else self.latency_ms
+        if self.state.jitter_ms:
+            latency += random.uniform(0, self.state.jitter_ms)
+        return latency / 1000
+
+    def visible_peers(self):
+        """
+        CLUSTER NODES에 보이는 node_id 목록 (FORGET 후 FORGET_BAN초가 지나지 않은 노드 제외)
+        """
+        if self.forgotten:
+            now = time.monotonic()
+            for node_id in [n for n, until in self.forgotten.items() if until <= now]:
+                del self.forgotten[node_id]
+        return [node_id for node_id in self.peers if node_id not in self.forgotten]
+
+    def known_node(self, arg):
+        node = self.state.nodes.get(arg.decode(errors="replace"))
+        if node is None or node.id not in self.peers or node.id in self.forgotten:
+            raise CommandError(f"ERR I don't know about node {arg.decode(errors='replace')}")
+        return node
+
+    async def execute(self, client, args):
+        """
+        명령 하나를 실행해 RESP로 인코딩된 응답 반환
+        """
+        self.stats["commands"] += 1
+        name = args[0].decode(errors="replace").lower() if args else ""
+        try:
+            if not client.authenticated and name not in ("auth", "hello"):
+                raise CommandError("NOAUTH Authentication required.")
+            handler = getattr(self, f"cmd_{name}", None) if name.isalpha() else None
+            if handler is None:
+                raise CommandError(f"ERR unknown command '{name}'")
+            result = handler(client, args[1:])
+            if asyncio.iscoroutine(result):
+                result = await result
+        except CommandError as e:
+            result = e
+        except IndexError:
+            result = CommandError(f"ERR wrong number of arguments for '{name}' command")
+        except ValueError:
+            result = CommandError("ERR value is not an integer or out of range")
+        client.asking = name == "asking"
+        return encode(result, client.protocol == 3)
+
+    # 연결
+    def cmd_ping(self, client, args):
+        return args[0] if args else Status("PONG")
+
+    def cmd_auth(self, client, args):
+        self.authenticate(client, args[-1])
+        return OK
+
+    def authenticate(self, client, password):
+        if self.state.password is None:
+            raise CommandError("ERR AUTH <password> called without any password configured for the default user. "
+                               "Are you sure your configuration is correct?")
+        if password.decode(errors="replace") != self.state.password:
+            raise CommandError("WRONGPASS invalid username-password pair or user is disabled.")
+        client.authenticated = True
+
+    def cmd_hello(self, client, args):
+        protocol = int(args[0]) if args else client.protocol
+        if protocol not in (2, 3):
+            raise CommandError("NOPROTO unsupported protocol version")
+        for i, arg in enumerate(args):
+            if arg.upper() == b"AUTH":
+                self.authenticate(client, args[i + 2])
+        if not client.authenticated:
+            raise CommandError("NOAUTH HELLO must be called with the client already authenticated, "
+                               "otherwise the HELLO <proto> AUTH <user> <pass> option can be used to authenticate the client")
+        client.protocol = protocol
+        return {"server": "redis", "version": VERSION, "proto": protocol, "id": client.id, "mode": "cluster",
+                "role": self.role.replace("slave", "replica"), "modules": []}
+
+    def cmd_client(self, client, args):
+        if args[0].upper() == b"ID":
+            return client.id
+        return OK
+
+    def cmd_select(self, client, args):
+        if int(args[0]) != 0:
+            raise CommandError("ERR SELECT is not allowed in cluster mode")
+        return OK
+
+    def cmd_asking(self, client, args):
+        return OK
+
+    def cmd_readonly(self, client, args):
+        return OK
+
+    def cmd_readwrite(self, client, args):
+        return OK
+
+    def cmd_command(self, client, args):
+        if args and args[0].upper() == b"COUNT":
+            return len(FakeNode.COMMAND_TABLE)
+        if args:
+            return []
+        return [[name, arity, [Status(flag) for flag in flags], first, last, step]
+                for name, arity, flags, first, last, step in FakeNode.COMMAND_TABLE]
+
+    # 서버 정보
+    def cmd_dbsize(self, client, args):
+        return len(self.keyspace)
+
+    def cmd_flushall(self, client, args):
+        if self.role != "master":
+            raise CommandError("READONLY You can't write against a read only replica.")
+        self.keyspace.__init__()
+        return OK
+
+    def cmd_info(self, client, args):
+        sections = self.info_sections()
+        wanted = [arg.decode(errors="replace").lower() for arg in args]
+        if not wanted or {"all", "default", "everything"} & set(wanted):
+            wanted = list(sections)
+        text = []
+        for name in wanted:
+            if name in sections:
+                text.append(f"# {name.capitalize()}\r\n" + "".join(f"{k}:{v}\r\n" for k, v in sections[name].items()))
+        return "\r\n".join(text)
+
+    def info_sections(self):
+        keyspace = self.keyspace
+        replication = {"role": self.role}
+        if self.role == "master":
+            replication["connected_slaves"] = len(self.replicas)
+            for i, node_id in enumerate(sorted(self.replicas)):
+                replica = self.state.nodes[node_id]
+                replication[f"slave{i}"] = (f"ip={replica.host},port={replica.port},state=online,"
+                                            f"offset={keyspace.repl_offset},lag=0")
+        else:
+            master = self.state.nodes.get(self.master_id)
+            replication.update(master_host=master.host if master else "?", master_port=master.port if master else 0,
+                               master_link_status="up", slave_repl_offset=keyspace.repl_offset)
+        replication["master_repl_offset"] = keyspace.repl_offset
+        return {
+            "server": {"redis_version": VERSION, "redis_mode": "cluster", "process_id": os.getpid(),
+                       "tcp_port": self.port, "uptime_in_seconds": int(time.time() - self.started)},
+            "clients": {"connected_clients": self.stats["clients"]},
+            "memory": {"used_memory": keyspace.used_memory, "maxmemory": 0},
+            "stats": {"total_connections_received": self.stats["connections"],
+                      "total_commands_processed": self.stats["commands"], "instantaneous_ops_per_sec": 0,
+                      "total_net_input_bytes": self.stats["net_in"], "total_net_output_bytes": self.stats["net_out"],
+                      "expired_keys": 0, "evicted_keys": 0, "keyspace_hits": self.stats["hits"],
+                      "keyspace_misses": self.stats["misses"]},
+            "replication": replication,
+            "cluster": {"cluster_enabled": 1},
+            "keyspace": {"db0": f"keys={len(keyspace)},expires={len(keyspace.expires)},avg_ttl=0"} if len(keyspace) else {},
+        }
+
+    # 키 명령
+    def check_keys(self, client, keys):
+        """
+        키들이 이 노드에서 처리 가능한지 확인하고 아니면 CROSSSLOT / MOVED / ASK / CLUSTERDOWN 오류
+        """
+        slot = key_slot(keys[0])
+        if any(key_slot(key) != slot for key in keys[1:]):
+            raise CommandError("CROSSSLOT Keys in request don't hash to the same slot")
+        owner = self.state.slots[slot]
+        if owner is None:
+            raise CommandError("CLUSTERDOWN Hash slot not served")
+        if owner == self.id:
+            if slot in self.migrating and any(self.keyspace.get(key) is None for key in keys):
+                raise CommandError(f"ASK {slot} {self.state.nodes[self.migrating[slot]].addr}")
+            return
+        if slot in self.importing and client.asking:
+            return
+        raise CommandError(f"MOVED {slot} {self.state.nodes[owner].addr}")
+
+    def lookup(self, key):
+        value = self.keyspace.get(key)
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def cmd_get(self, client, args):
+        self.check_keys(client, args[:1])
+        return self.lookup(args[0])
+
+    def cmd_set(self, client, args):
+        key, value = args[0], args[1]
+        self.check_keys(client, [key])
+        expire_at = None
+        exists = self.keyspace.get(key) is not None
+        options = [arg.upper() for arg in args[2:]]
+        for i, option in enumerate(options):
+            if option == b"EX":
+                expire_at = now_ms() + int(args[i + 3]) * 1000
+            elif option == b"PX":
+                expire_at = now_ms() + int(args[i + 3])
+            elif option == b"KEEPTTL":
+                expire_at = self.keyspace.expires.get(key)
+        if (b"NX" in options and exists) or (b"XX" in options and not exists):
+            return None
+        self.keyspace.set(key, value, expire_at)
+        return OK
+
+    def cmd_mset(self, client, args):
+        if not args or len(args) % 2:
+            raise IndexError
+        self.check_keys(client, args[0::2])
+        for key, value in zip(args[0::2], args[1::2]):
+            self.keyspace.set(key, value)
+        return OK
+
+    def cmd_del(self, client, args):
+        if not args:
+            raise IndexError
+        self.check_keys(client, args)
+        return sum(self.keyspace.delete(key) for key in args)
+
+    cmd_unlink = cmd_del
+
+    def cmd_exists(self, client, args):
+        if not args:
+            raise IndexError
+        self.check_keys(client, args)
+        return sum(self.keyspace.get(key) is not None for key in args)
+
+    def cmd_type(self, client, args):
+        self.check_keys(client, args[:1])
+        return Status("string" if self.keyspace.get(args[0]) is not None else "none")
+
+    def cmd_pttl(self, client, args):
+        self.check_keys(client, args[:1])
+        return self.keyspace.pttl(args[0])
+
+    def cmd_ttl(self, client, args):
+        pttl = self.cmd_pttl(client, args)
+        return pttl if pttl < 0 else (pttl + 500) // 1000
+
+    def cmd_dump(self, client, args):
+        self.check_keys(client, args[:1])
+        value = self.keyspace.get(args[0])
+        return None if value is None else DUMP_PREFIX + value
+
+    def cmd_restore(self, client, args):
+        key, ttl, payload = args[0], int(args[1]), args[2]
+        self.check_keys(client, [key])
+        options = [arg.upper() for arg in args[3:]]
+        if b"REPLACE" not in options and self.keyspace.get(key) is not None:
+            raise CommandError("BUSYKEY Target key name already exists.")
+        if not payload.startswith(DUMP_PREFIX):
+            raise CommandError("ERR DUMP payload version or checksum are wrong")
+        expire_at = None
+        if ttl:
+            expire_at = ttl if b"ABSTTL" in options else now_ms() + ttl
+        self.keyspace.set(key, payload[len(DUMP_PREFIX):], expire_at)
+        return OK
+
+    def cmd_memory(self, client, args):
+        if args[0].upper() != b"USAGE":
+            raise CommandError(f"ERR unknown subcommand '{args[0].decode(errors='replace')}'. Try MEMORY HELP.")
+        self.check_keys(client, args[1:2])
+        value = self.keyspace.get(args[1])
+        return None if value is None else Keyspace.memory_usage(args[1], value)
+
+    def cmd_scan(self, client, args):
+        """
+        SCAN cursor [MATCH p] [COUNT n] [TYPE t]: 커서는 다음에 볼 슬롯 번호, 슬롯 단위로 끊어 반환
+        """
+        cursor, pattern, count, key_type = int(args[0]), None, 10, None
+        for i in range(1, len(args) - 1, 2):
+            option = args[i].upper()
+            if option == b"MATCH":
+                pattern = args[i + 1]
+            elif option == b"COUNT":
+                count = int(args[i + 1])
+            elif option == b"TYPE":
+                key_type = args[i + 1].lower()
+        keys = []
+        slot = cursor
+        while slot < RedisUtils.TOTAL_SLOTS and len(keys) < count:
+            keys += self.keyspace.slots.get(slot, ())
+            slot += 1
+        if pattern is not None:
+            keys = [key for key in keys if fnmatch.fnmatchcase(key, pattern)]
+        if key_type not in (None, b"string"):
+            keys = []
+        return [str(slot if slot < RedisUtils.TOTAL_SLOTS else 0), keys]
+
+    async def cmd_migrate(self, client, args):
+        """
+        MIGRATE host port key|"" db timeout [COPY] [REPLACE] [AUTH pw | AUTH2 user pw] [KEYS k...]
+        대상이 같은 프로세스의 가짜 노드이면 (다른 가짜 클러스터 포함) 대상 노드의 지연만큼 기다린 뒤 키를 직접 옮김
+        """
+        host, port, key, timeout = args[0].decode(errors="replace"), int(args[1]), args[2], int(args[4])
+        copy = replace = False
+        password = None
+        keys = [key] if key else []
+        i = 5
+        while i < len(args):
+            option = args[i].upper()
+            if option == b"COPY":
+                copy = True
+            elif option == b"REPLACE":
+                replace = True
+            elif option == b"AUTH":
+                password, i = args[i + 1], i + 1
+            elif option == b"AUTH2":
+                password, i = args[i + 2], i + 2
+            elif option == b"KEYS":
+                if key:
+                    raise CommandError("ERR When using MIGRATE KEYS option, the key argument must be set to the empty string")
+                keys = args[i + 1:]
+                break
+            else:
+                raise CommandError("ERR syntax error")
+            i += 1
+
+        if not any(self.keyspace.get(key) is not None for key in keys):
+            return Status("NOKEY")
+        target = RUNNING_NODES.get((host, port))
+        if target is None:
+            raise CommandError("IOERR error or timeout connecting to the client")
+        delay = target.round_trip_delay()
+        if delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise CommandError("IOERR error or timeout reading to target instance")
+        if delay:
+            await asyncio.sleep(delay)
+        if target.state.password is not None and (password or b"").decode(errors="replace") != target.state.password:
+            raise CommandError("ERR Target instance replied with error: NOAUTH Authentication required.")
+        if target.role != "master":
+            raise CommandError("ERR Target instance replied with error: READONLY You can't write against a read only replica.")
+
+        # 지연을 기다리는 동안 바뀌었을 수 있으므로 다시 조회
+        present = [key for key in keys if self.keyspace.get(key) is not None]
+        if not replace and any(target.keyspace.get(key) is not None for key in present):
+            raise CommandError("BUSYKEY Target key name already exists.")
+        for key in present:
+            target.keyspace.set(key, self.keyspace.data[key], self.keyspace.expires.get(key))
+            if not copy:
+                self.keyspace.delete(key)
+        return OK
+
+    # CLUSTER 하위 명령
+    def cmd_cluster(self, client, args):
+        sub = args[0].decode(errors="replace").lower()
+        handler = getattr(self, f"cluster_{sub}", None) if sub.isalpha() else None
+        if handler is None:
+            raise CommandError(f"ERR unknown subcommand '{sub}'. Try CLUSTER HELP.")
+        return handler(client, args[1:])
+
+    def cluster_myid(self, client, args):
+        return self.id
+
+    def cluster_keyslot(self, client, args):
+        return key_slot(args[0])
+
+    def cluster_info(self, client, args):
+        visible = set(self.visible_peers())
+        assigned = sum(count for node_id, count in self.state.slot_counts.items() if node_id in visible)
+        master = self.state.nodes.get(self.master_id)
+        fields = {
+            "cluster_state": "ok" if assigned == RedisUtils.TOTAL_SLOTS else "fail",
+            "cluster_slots_assigned": assigned,
+            "cluster_slots_ok": assigned,
+            "cluster_slots_pfail": 0,
+            "cluster_slots_fail": 0,
+            "cluster_known_nodes": len(visible),
+            "cluster_size": sum(1 for node_id, count in self.state.slot_counts.items() if node_id in visible and count),
+            "cluster_current_epoch": self.state.current_epoch,
+            "cluster_my_epoch": master.config_epoch if master else self.config_epoch,
+        }
+        return "".join(f"{k}:{v}\r\n" for k, v in fields.items())
+
+    def cluster_nodes(self, client, args):
+        lines, _ = self.state.node_lines()
+        myself = lines[self.id].split(" ", 3)
+        myself[2] = "myself," + myself[2]
+        own = " ".join(myself)
+        own += "".join(f" [{slot}->-{peer}]" for slot, peer in self.migrating.items())
+        own += "".join(f" [{slot}-<-{peer}]" for slot, peer in self.importing.items())
+        return "\n".join(own if node_id == self.id else lines[node_id] for node_id in self.visible_peers()) + "\n"
+
+    def cluster_slots(self, client, args):
+        _, ranges = self.state.node_lines()
+        result = []
+        for node_id in self.visible_peers():
+            node = self.state.nodes[node_id]
+            entries = [[node.host, node.port, node.id]]
+            entries += [[r.host, r.port, r.id] for r in map(self.state.nodes.get, sorted(node.replicas)) if r]
+            result += [[start, end, *entries] for start, end in ranges.get(node_id, ())]
+        return sorted(result)
+
+    def cluster_meet(self, client, args):
+        host, port = args[0].decode(errors="replace"), int(args[1])
+        if not 0 < port < 65536:
+            raise CommandError(f"ERR Invalid node address specified: {host}:{port}")
+        target = self.state.by_addr.get((host, port))
+        if target is not None:
+            # 가짜 클러스터 밖의 주소는 실제 Redis처럼 OK만 응답하고 무시 (핸드셰이크 실패)
+            if self.state.gossip_delay:
+                asyncio.get_running_loop().call_later(self.state.gossip_delay, self.state.meet, self, target)
+            else:
+                self.state.meet(self, target)
+        return OK
+
+    def cluster_forget(self, client, args):
+        node_id = args[0].decode(errors="replace")
+        if node_id == self.id:
+            raise CommandError("ERR I tried hard but I can't forget myself...")
+        if node_id == self.master_id:
+            raise CommandError("ERR Can't forget my master!")
+        self.known_node(args[0])
+        self.forgotten[node_id] = time.monotonic() + FORGET_BAN
+        self.state.version += 1
+        return OK
+
+    def cluster_reset(self, client, args):
+        hard = bool(args) and args[0].upper() == b"HARD"
+        if self.role == "master" and len(self.keyspace):
+            raise CommandError("ERR CLUSTER RESET can't be called with master nodes containing keys")
+        self.state.reset(self, hard)
+        return OK
+
+    def cluster_replicate(self, client, args):
+        master = self.known_node(args[0])
+        if master is self:
+            raise CommandError("ERR Can't replicate myself")
+        if master.role != "master":
+            raise CommandError("ERR I can only replicate a master, not a replica.")
+        if self.role == "master" and (self.state.slot_counts.get(self.id) or len(self.keyspace)):
+            raise CommandError("ERR To set a master the node must be empty and without assigned slots.")
+        self.state.set_replica(self, master)
+        return OK
+
+    def cluster_failover(self, client, args):
+        if self.role == "master":
+            raise CommandError("ERR You should send CLUSTER FAILOVER to a replica")
+        self.state.failover(self)
+        return OK
+
+    def cluster_addslots(self, client, args):
+        if not args:
+            raise IndexError
+        self.add_slots([parse_slot(arg) for arg in args])
+        return OK
+
+    def cluster_addslotsrange(self, client, args):
+        if not args or len(args) % 2:
+            raise IndexError
+        slots = []
+        for start, end in zip(args[0::2], args[1::2]):
+            start, end = parse_slot(start), parse_slot(end)
+            if start > end:
+                raise CommandError(f"ERR start slot number {start} is greater than end slot number {end}")
+            slots += range(start, end + 1)
+        self.add_slots(slots)
+        return OK
+
+    def add_slots(self, slots):
+        for slot in slots:
+            if self.state.slots[slot] is not None:
+                raise CommandError(f"ERR Slot {slot} is already busy")
+        for slot in slots:
+            self.state.assign_slot(slot, self.id)
+        if not self.config_epoch:
+            # 실제 클러스터의 epoch 충돌 해결처럼 마스터마다 서로 다른 epoch를 가짐
+            self.config_epoch = self.state.bump_epoch()
+
+    def cluster_setslot(self, client, args):
+        slot, action = parse_slot(args[0]), args[1].upper()
+        owner = self.state.slots[slot]
+        if action == b"MIGRATING":
+            if owner != self.id:
+                raise CommandError(f"ERR I'm not the owner of hash slot {slot}")
+            self.migrating[slot] = self.known_node(args[2]).id
+        elif action == b"IMPORTING":
+            if owner == self.id:
+                raise CommandError(f"ERR I'm already the owner of hash slot {slot}")
+            self.importing[slot] = self.known_node(args[2]).id
+        elif action == b"STABLE":
+            self.migrating.pop(slot, None)
+            self.importing.pop(slot, None)
+        elif action == b"NODE":
+            target = self.known_node(args[2])
+            if owner == self.id and target is not self and self.keyspace.count_in_slot(slot):
+                raise CommandError(f"ERR Can't assign hashslot {slot} to a different node while I still hold keys for this hash slot.")
+            self.state.move_slot(slot, self, target)
+        else:
+            raise CommandError("ERR Invalid CLUSTER SETSLOT action or number of arguments. Try CLUSTER HELP")
+        self.state.version += 1
+        return OK
+
+    def cluster_countkeysinslot(self, client, args):
+        return self.keyspace.count_in_slot(parse_slot(args[0]))
+
+    def cluster_getkeysinslot(self, client, args):
+        slot, count = parse_slot(args[0]), int(args[1])
+        if count < 0:
+            raise CommandError("ERR Invalid number of keys")
+        return self.keyspace.keys_in_slot(slot, count)
+
+
+class FakeCluster:
+    """
+    FakeNode count개를 백그라운드 스레드의 이벤트 루프 하나에서 띄우는 가짜 클러스터 (LocalCluster와 같은 방식으로 사용).
+    - 노드만 띄우며 클러스터 구성은 하지 않음. with 블록을 벗어나면 모든 노드 종료
+    - base_port가 없으면 OS가 고른 빈 포트 사용
+    - latency_ms / jitter_ms: 왕복마다(한 번에 읽은 명령 묶음, 파이프라인 포함) 응답 전에 주입할 지연. 노드별 지연은 set_latency
+    - gossip_delay: MEET 후 두 노드 그룹이 서로를 알게 되기까지의 시간(초)
+    rcctl과 같은 프로세스에서 돌면 측정 시간에 가짜 서버의 처리 시간도 포함됨 (GIL 공유).
+    분리해서 재려면 python -m benchmarks.fake_cluster 로 따로 띄우고 rcctl을 실행.
+    """
+
+    def __init__(self, count, host="127.0.0.1", base_port=None, password=None, latency_ms=0.0, jitter_ms=0.0,
+                 gossip_delay=0.0):
+        self.count = count
+        self.host = host
+        self.base_port = base_port
+        self.password = password
+        self.state = GossipState(password, latency_ms, jitter_ms, gossip_delay)
+        self.nodes = []
+        self._loop = None
+        self._thread = None
+        self._servers = []
+        self._tasks = set()
+
+    @property
+    def ports(self):
+        return [node.port for node in self.nodes]
+
+    @property
+    def addrs(self):
+        return [node.addr for node in self.nodes]
+
+    def node(self, addr):
+        return self.state.by_addr[StringUtils.parse_node(addr)]
+
+    def set_latency(self, latency_ms, addrs=None):
+        """
+        addrs 노드들(기본: 전체)의 주입 지연 변경. latency_ms=None이면 클러스터 기본값으로 되돌림
+        """
+        for node in (self.node(addr) for addr in addrs) if addrs else self.nodes:
+            node.latency_ms = latency_ms
+
+    def start(self):
+        raise_open_file_limit(self.count * 4 + 256)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-cluster", daemon=True)
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self._start_servers(), self._loop).result()
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    async def _start_servers(self):
+        for i in range(self.count):
+            node = FakeNode(self.state, self.host, 0)
+            port = self.base_port + i if self.base_port else 0
+            try:
+                server = await asyncio.start_server(lambda r, w, node=node: self._serve(node, r, w), self.host, port,
+                                                    backlog=1024)
+            except OSError as e:
+                raise RuntimeError(f"가짜 노드 {self.host}:{port} 를 띄우지 못했습니다: {e}")
+            node.port = server.sockets[0].getsockname()[1]
+            self._servers.append(server)
+            self.nodes.append(node)
+            self.state.register(node)
+            RUNNING_NODES[(node.host, node.port)] = node
+
+    async def _serve(self, node, reader, writer):
+        self._tasks.add(asyncio.current_task())
+        client = ClientState(authenticated=self.password is None)
+        node.stats["connections"] += 1
+        node.stats["clients"] += 1
+        buf = bytearray()
+        try:
+            while True:
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+                node.stats["net_in"] += len(data)
+                buf += data
+                try:
+                    commands, consumed = parse_commands(buf)
+                except (CommandError, ValueError) as e:
+                    writer.write(encode(e if isinstance(e, CommandError) else CommandError("ERR Protocol error")))
+                    break
+                del buf[:consumed]
+                if not commands:
+                    continue
+                replies = [await node.execute(client, args) for args in commands]
+                delay = node.round_trip_delay()
+                if delay:
+                    await asyncio.sleep(delay)
+                out = b"".join(replies)
+                node.stats["net_out"] += len(out)
+                writer.write(out)
+                await writer.drain()
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass
+        finally:
+            node.stats["clients"] -= 1
+            self._tasks.discard(asyncio.current_task())
+            writer.close()
+
+    def stop(self):
+        """
+        모든 노드의 리스닝 소켓과 클라이언트 연결을 닫고 이벤트 루프 종료
+        """
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    async def _close(self):
+        for server in self._servers:
+            server.close()
+        for node in self.nodes:
+            RUNNING_NODES.pop((node.host, node.port), None)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._servers.clear()
+
+    def dbsize(self):
+        """
+        모든 마스터의 키 수 합계 (리플리카는 마스터와 저장소를 공유하므로 제외)
+        """
+        return sum(len(node.keyspace) for node in self.nodes if node.role == "master")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def raise_open_file_limit(needed):
+    """
+    노드마다 리스닝 소켓 + 클라이언트 연결이 필요하므로 열 수 있는 파일 수 제한을 가능한 만큼 올림
+    """
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY and soft < needed:
+            target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 Redis Cluster 노드 실행 (rcctl 확장성 테스트용)")
+    parser.add_argument("--nodes", type=int, default=1000, help="띄울 노드 수 (기본: 1000)")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--base-port", type=int, default=30001, help="시작 포트, 0이면 OS가 고른 빈 포트 (기본: 30001)")
+    parser.add_argument("--password", default=config_value("config/redis-9001.conf", "requirepass"),
+                        help="노드 비밀번호 (기본: config/redis-9001.conf 의 requirepass)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="왕복마다 주입할 지연 ms (기본: 0)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연에 더할 0~N ms 무작위 값 (기본: 0)")
+    parser.add_argument("--gossip-delay", type=float, default=0.0, help="MEET 전파에 걸리는 시간(초) (기본: 0)")
+    parser.add_argument("--addrs-file", help="노드 주소를 한 줄에 하나씩 기록할 파일")
+    args = parser.parse_args()
+
+    cluster = FakeCluster(args.nodes, args.host, args.base_port, args.password, args.latency_ms, args.jitter_ms,
+                          args.gossip_delay).start()
+    if args.addrs_file:
+        os.makedirs(os.path.dirname(args.addrs_file) or ".", exist_ok=True)
+        with open(args.addrs_file, "w") as f:
+            f.write("\n".join(cluster.addrs) + "\n")
+    print(f"🧪 가짜 노드 {args.nodes:,}개 실행 중: {cluster.addrs[0]} ~ {cluster.addrs[-1]} "
+          f"(지연 {args.latency_ms}ms ±{args.jitter_ms}ms, Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cluster.stop()
+
+
+if __name__ == "__main__":
+    main()
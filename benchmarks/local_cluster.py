@@ -0,0 +1,143 @@
+import os
+import shutil
+import subprocess
+import time
+import redis
+
+
+def config_value(path, name):
+    """
+    redis 설정 파일에서 name 항목의 값 (없으면 None)
+    """
+    with open(path) as f:
+        for line in f:
+            words = line.split()
+            if len(words) >= 2 and words[0] == name:
+                return words[1]
+    return None
+
+
+class LocalCluster:
+    """
+    config/ 의 redis 설정 파일을 템플릿으로 로컬 redis-server 노드들을 띄우고 정리하는 벤치마크용 클러스터.
+    - 템플릿의 설정(cluster-enabled, cluster-node-timeout, appendonly, requirepass 등)은 그대로 사용
+    - 포트, 데이터 디렉토리(dir), cluster-config-file, logfile, bind, daemonize만 노드별로 덮어씀
+      (프로세스를 직접 관리하기 위해 daemonize no, 실행마다 깨끗한 상태를 위해 workdir/<port> 아래에 기록)
+    - 노드만 띄우며 클러스터 구성은 하지 않음 (create 자체가 측정 대상)
+    with 블록을 벗어나면 모든 노드를 종료하고 workdir를 지움.
+    """
+
+    def __init__(self, ports, workdir, template="config/redis-9001.conf", redis_server="redis-server", host="127.0.0.1"):
+        self.ports = list(ports)
+        self.workdir = os.path.abspath(workdir)
+        self.redis_server = redis_server
+        self.host = host
+        with open(template) as f:
+            self.template = f.read().splitlines()
+        self.password = config_value(template, "requirepass")
+        self.procs = {}
+
+    @property
+    def addrs(self):
+        return [f"{self.host}:{port}" for port in self.ports]
+
+    def render_config(self, port):
+        """
+        템플릿에서 노드별 항목만 바꾼 설정 파일 내용
+        """
+        node_dir = os.path.join(self.workdir, str(port))
+        overrides = {
+            "port": str(port),
+            "dir": node_dir,
+            "cluster-config-file": "nodes.conf",
+            "logfile": "redis.log",
+            "daemonize": "no",
+            "bind": self.host,
+        }
+        lines = []
+        for line in self.template:
+            words = line.split()
+            if words and words[0] in overrides:
+                line = f"{words[0]} {overrides.pop(words[0])}"
+            lines.append(line)
+        lines += [f"{name} {value}" for name, value in overrides.items()]
+        return "\n".join(lines) + "\n"
+
+    def start(self, timeout=15.0):
+        """
+        모든 노드를 띄우고 PING에 응답할 때까지 대기
+        """
+        shutil.rmtree(self.workdir, ignore_errors=True)
+        try:
+            for port in self.ports:
+                node_dir = os.path.join(self.workdir, str(port))
+                os.makedirs(node_dir)
+                conf_path = os.path.join(node_dir, "redis.conf")
+                with open(conf_path, "w") as f:
+                    f.write(self.render_config(port))
+                try:
+                    self.procs[port] = subprocess.Popen([self.redis_server, conf_path],
+                                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except FileNotFoundError:
+                    raise RuntimeError(f"redis-server 실행 파일을 찾을 수 없습니다: {self.redis_server}")
+            deadline = time.time() + timeout
+            for port in self.ports:
+                self._wait_ready(port, deadline)
+        except Exception:
+            # 일부만 뜬 노드와 로그는 원인 확인을 위해 남김
+            self.stop(keep=True)
+            raise
+        return self
+
+    def _wait_ready(self, port, deadline):
+        client = redis.Redis(host=self.host, port=port, password=self.password, socket_connect_timeout=1)
+        try:
+            while True:
+                if self.procs[port].poll() is not None:
+                    raise RuntimeError(f"redis-server {port} 가 시작 직후 종료되었습니다 "
+                                       f"(로그: {os.path.join(self.workdir, str(port), 'redis.log')})")
+                try:
+                    client.ping()
+                    return
+                except redis.exceptions.RedisError:
+                    if time.time() > deadline:
+                        raise RuntimeError(f"redis-server {port} 가 제한 시간 안에 응답하지 않습니다.")
+                    time.sleep(0.05)
+        finally:
+            client.close()
+
+    def stop(self, keep=False):
+        """
+        모든 노드를 SHUTDOWN NOSAVE로 종료 (응답이 없으면 kill). keep=False이면 workdir 삭제
+        """
+        for port, proc in self.procs.items():
+            if proc.poll() is None:
+                try:
+                    redis.Redis(host=self.host, port=port, password=self.password, socket_timeout=2).shutdown(nosave=True)
+                except redis.exceptions.RedisError:
+                    pass
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+        self.procs.clear()
+        if not keep:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def dbsize(self):
+        """
+        모든 노드의 DBSIZE 합계
+        """
+        total = 0
+        for port in self.ports:
+            client = redis.Redis(host=self.host, port=port, password=self.password)
+            total += client.dbsize()
+            client.close()
+        return total
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,254 @@
+"""
+    rcctl 벤치마크 실행기
+
+    config/ 템플릿으로 로컬 redis-server 클러스터를 띄워 rcctl 커맨드를 프로세스 안에서 직접 호출하고,
+    소요 시간 / 처리량을 커밋 정보와 함께 JSON으로 저장. (레포 루트에서 실행)
+    --fake 이면 redis-server 대신 가짜 클러스터(benchmarks/fake_cluster.py)로 큰 노드 수에서 rcctl 자체 부담을 측정.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --scenarios reshard,populate --keys 200000 --repeat 3
+    python -m benchmarks.run --scenarios create,check --node-counts 6,9,12,18
+    python -m benchmarks.run --fake --scenarios create,check --node-counts 100,500,1000 --fake-latency-ms 0.5
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from command import create, check, populate_test_data, reshard
+from utils.redis_utils import RedisUtils, ConnectionRegistry
+from utils.slot_utils import SlotMap
+from utils.string_utils import StringUtils
+from benchmarks.local_cluster import LocalCluster, config_value
+from benchmarks.fake_cluster import FakeCluster
+
+SCENARIOS = ("create", "check", "populate", "reshard")
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def main():
+    args = parse_args()
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        print(f"❌ 알 수 없는 시나리오: {', '.join(sorted(unknown))} (가능: {', '.join(SCENARIOS)})")
+        sys.exit(1)
+
+    results = []
+    try:
+        if "create" in scenarios or "check" in scenarios:
+            for nodes in parse_ints(args.node_counts):
+                results += bench_create_check(args, nodes, "create" in scenarios, "check" in scenarios)
+        if "populate" in scenarios or "reshard" in scenarios:
+            results += bench_populate_reshard(args, "populate" in scenarios, "reshard" in scenarios)
+    except (BenchmarkError, RuntimeError) as e:
+        print(f"❌ 벤치마크 실패: {e}")
+        sys.exit(1)
+
+    report = {
+        **environment_info(args),
+        "params": {k: v for k, v in vars(args).items() if k not in ("output", "verbose")},
+        "results": results,
+        "summary": summarize(results),
+    }
+    output = args.output or default_output_path(report["commit"])
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print_summary(report["summary"])
+    print(f"\n📝 결과 저장: {output}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="rcctl 커맨드 벤치마크 (로컬 redis-server 클러스터)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"실행할 시나리오 (기본: {','.join(SCENARIOS)})")
+    parser.add_argument("--node-counts", default="6,9,12", help="create / check를 측정할 노드 수 목록, 6 이상 (기본: 6,9,12)")
+    parser.add_argument("--masters", type=int, default=6, help="populate / reshard용 클러스터의 마스터 수, 6 이상 (기본: 6)")
+    parser.add_argument("--keys", type=int, default=100000, help="populate로 저장할 키 수 (기본: 100000)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="populate --batch-size (기본: 1000)")
+    parser.add_argument("--workers", type=int, default=1, help="populate --workers (기본: 1)")
+    parser.add_argument("--reshard-slots", type=int, default=1000, help="reshard로 이동할 슬롯 수 (기본: 1000)")
+    parser.add_argument("--pipeline", type=int, default=10, help="reshard --pipeline (기본: 10)")
+    parser.add_argument("--parallel", type=int, default=1, help="reshard --parallel (기본: 1)")
+    parser.add_argument("--repeat", type=int, default=1, help="측정 반복 횟수, 결과에는 모든 측정값과 중앙값 기록 (기본: 1)")
+    parser.add_argument("--base-port", type=int, default=17001, help="띄울 노드의 시작 포트 (기본: 17001, 버스 포트는 +10000)")
+    parser.add_argument("--template", default="config/redis-9001.conf", help="노드 설정 템플릿 (기본: config/redis-9001.conf)")
+    parser.add_argument("--redis-server", default="redis-server", help="redis-server 실행 파일 (기본: PATH의 redis-server)")
+    parser.add_argument("--workdir", default="logs/bench-cluster", help="노드 데이터 / 로그 디렉토리 (기본: logs/bench-cluster)")
+    parser.add_argument("--fake", action="store_true", help="redis-server 대신 프로세스 안의 가짜 클러스터 사용")
+    parser.add_argument("--fake-latency-ms", type=float, default=0.0, help="--fake 노드의 왕복 지연 ms (기본: 0)")
+    parser.add_argument("--fake-jitter-ms", type=float, default=0.0, help="--fake 노드 지연에 더할 0~N ms 무작위 값 (기본: 0)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--verbose", action="store_true", help="rcctl 커맨드 출력(진행바 포함)을 그대로 표시")
+    return parser.parse_args()
+
+
+def parse_ints(text):
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def local_cluster(args, count):
+    if args.fake:
+        return FakeCluster(count, base_port=args.base_port, password=config_value(args.template, "requirepass"),
+                           latency_ms=args.fake_latency_ms, jitter_ms=args.fake_jitter_ms)
+    return LocalCluster(range(args.base_port, args.base_port + count), args.workdir, args.template, args.redis_server)
+
+
+def measure(verbose, func, *func_args, **func_kwargs):
+    """
+    func 실행 시간(초) 측정. verbose가 아니면 커맨드 출력을 숨기고, 커맨드가 sys.exit로 끝나면 BenchmarkError
+    """
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if not verbose:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+            stack.enter_context(contextlib.redirect_stderr(devnull))
+        started = time.perf_counter()
+        try:
+            func(*func_args, **func_kwargs)
+        except SystemExit as e:
+            raise BenchmarkError(f"{func.__name__} 가 종료 코드 {e.code}로 끝났습니다 (--verbose로 출력 확인)")
+        return time.perf_counter() - started
+
+
+def bench_create_check(args, nodes, run_create, run_check):
+    """
+    노드 nodes개를 새로 띄워 create 소요 시간, 이어서 같은 클러스터의 check 소요 시간 측정 (반복마다 새 클러스터)
+    """
+    results = []
+    for run in range(args.repeat):
+        print(f"⏱️ create / check: 노드 {nodes}개 ({run + 1}/{args.repeat})")
+        with local_cluster(args, nodes) as cluster:
+            seconds = measure(args.verbose, create, cluster.addrs, 0, cluster.password)
+            if run_create:
+                results.append(record("create", run, seconds, nodes=nodes))
+            if run_check:
+                seconds = measure(args.verbose, check, cluster.addrs[0], cluster.password)
+                results.append(record("check", run, seconds, nodes=nodes))
+        ConnectionRegistry.reset()
+    return results
+
+
+def bench_populate_reshard(args, run_populate, run_reshard):
+    """
+    마스터 --masters개 클러스터에 --keys개를 populate 하고 (처리량 측정),
+    첫 마스터의 슬롯 --reshard-slots개를 마지막 마스터로 reshard (이동 키 처리량 측정)
+    """
+    results = []
+    for run in range(args.repeat):
+        print(f"⏱️ populate / reshard: 마스터 {args.masters}개, 키 {args.keys:,}개 ({run + 1}/{args.repeat})")
+        with local_cluster(args, args.masters) as cluster:
+            measure(args.verbose, create, cluster.addrs, 0, cluster.password)
+            seconds = measure(args.verbose, populate_test_data, cluster.addrs[0], cluster.password, args.keys,
+                              args.batch_size, args.workers)
+            stored = cluster.dbsize()
+            if stored != args.keys:
+                raise BenchmarkError(f"populate 후 키 수가 {stored:,}개입니다 (기대: {args.keys:,}개)")
+            if run_populate:
+                results.append(record("populate", run, seconds, nodes=args.masters, keys=args.keys,
+                                      batch_size=args.batch_size, workers=args.workers))
+            if run_reshard:
+                results.append(bench_reshard(args, cluster, run))
+        ConnectionRegistry.reset()
+    return results
+
+
+def bench_reshard(args, cluster, run):
+    access = cluster.addrs[0]
+    conn = RedisUtils.connect_node(cluster.host, cluster.ports[0], cluster.password)
+    slot_map = SlotMap.from_cluster_nodes(RedisUtils.get_cluster_nodes(conn))
+    from_id, to_id = slot_map.owner(0), slot_map.owner(RedisUtils.TOTAL_SLOTS - 1)
+    from_conn = RedisUtils.connect_node(*StringUtils.parse_node(slot_map.addrs[from_id]), cluster.password)
+    before = from_conn.dbsize()
+    with tempfile.TemporaryDirectory() as journal_dir:
+        seconds = measure(args.verbose, reshard, from_id, to_id, args.reshard_slots, args.pipeline, access, cluster.password,
+                          args.parallel, journal_path=os.path.join(journal_dir, "reshard.journal"))
+    moved = before - from_conn.dbsize()
+    return record("reshard", run, seconds, nodes=args.masters, keys=moved, slots=args.reshard_slots,
+                  pipeline=args.pipeline, parallel=args.parallel)
+
+
+def record(scenario, run, seconds, **fields):
+    entry = {"scenario": scenario, "run": run, "seconds": round(seconds, 4), **fields}
+    if "keys" in fields:
+        entry["keys_per_sec"] = round(fields["keys"] / seconds, 1) if seconds > 0 else 0.0
+    return entry
+
+
+def case_key(entry):
+    """
+    같은 조건의 측정을 묶는 키 (시나리오 + run / seconds / keys_per_sec 외의 조건)
+    """
+    return tuple(sorted((k, v) for k, v in entry.items() if k not in ("run", "seconds", "keys_per_sec")))
+
+
+def summarize(results):
+    """
+    같은 조건의 반복 측정을 중앙값으로 요약
+    """
+    groups = {}
+    for entry in results:
+        groups.setdefault(case_key(entry), []).append(entry)
+    summary = []
+    for entries in groups.values():
+        row = {k: v for k, v in entries[0].items() if k not in ("run", "seconds", "keys_per_sec")}
+        row["seconds"] = round(statistics.median(e["seconds"] for e in entries), 4)
+        if "keys_per_sec" in entries[0]:
+            row["keys_per_sec"] = round(statistics.median(e["keys_per_sec"] for e in entries), 1)
+        row["runs"] = len(entries)
+        summary.append(row)
+    return summary
+
+
+def print_summary(summary):
+    print("\n📊 벤치마크 결과 (중앙값)")
+    for row in summary:
+        detail = ", ".join(f"{k}={v}" for k, v in row.items() if k not in ("scenario", "seconds", "keys_per_sec", "runs"))
+        throughput = f", {row['keys_per_sec']:,.0f} keys/s" if "keys_per_sec" in row else ""
+        print(f"    - {row['scenario']:<9} {row['seconds']:>9.3f}초{throughput}  ({detail}, {row['runs']}회)")
+
+
+def environment_info(args):
+    """
+    결과 비교에 필요한 실행 환경 정보 (커밋, 변경 여부, 파이썬 / redis-server 버전, 플랫폼)
+    """
+    if args.fake:
+        server = f"fake (latency {args.fake_latency_ms}ms ±{args.fake_jitter_ms}ms)"
+    else:
+        server = command_output([args.redis_server, "--version"])
+    return {
+        "commit": git_output("rev-parse", "HEAD"),
+        "dirty": bool(git_output("status", "--porcelain", "--untracked-files=no")),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "redis_server": server,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def git_output(*git_args):
+    return command_output(["git", *git_args])
+
+
+def command_output(cmd):
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def default_output_path(commit):
+    return os.path.join("benchmarks", "results", f"{time.strftime('%Y%m%d-%H%M%S')}-{(commit or 'nogit')[:8]}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,13 @@ from .check import check
 from .populate_test_data import populate_test_data
 from .reshard import reshard
 from .del_node import del_node
+from .rebalance import rebalance
+from .bench import bench
+from .monitor import monitor
+from .analyze import analyze
+from .dump import dump
+from .restore import restore
+from .copy_cluster import copy_cluster
 
 __all__ = [
     "create",
@@ -17,5 +24,12 @@ __all__ = [
     "check",
     "populate_test_data",
     "reshard",
-    "del_node"
+    "del_node",
+    "rebalance",
+    "bench",
+    "monitor",
+    "analyze",
+    "dump",
+    "restore",
+    "copy_cluster"
 ]
\ No newline at end of file
@@ -1,11 +1,9 @@
 import sys
-import time
 import redis
 from utils.string_utils import StringUtils
 from utils.redis_utils import RedisUtils
-from tqdm import tqdm
 
-def add_node(new_node, existing_node, password, master_id=None):
+def add_node(new_node, existing_node, password, master_id=None, wait_timeout=30.0):
     """
     Redis Cluster에 새로운 노드를 추가하는 함수
 
@@ -14,6 +12,7 @@ def add_node(new_node, existing_node, password, master_id=None):
     - existing_node (str): 클러스터에 이미 참여중인 노드 주소 (ip:port)
     - password (str): Redis 인증 비밀번호
     - master_id (str, optional): 새 노드를 리플리카로 지정할 마스터 노드 ID (없으면 마스터로 유지)
+    - wait_timeout (float): MEET 후 클러스터 상태가 수렴할 때까지 기다릴 최대 시간(초)
     """
     # 노드 주소 파싱
     new_host, new_port = StringUtils.parse_node(new_node)
@@ -24,7 +23,7 @@ def add_node(new_node, existing_node, password, master_id=None):
     new_redis = RedisUtils.connect_node(new_host, new_port, password)
 
     # 기존 클러스터 노드에 새 노드 MEET 요청으로 클러스터에 합류
-    join_cluster(exist_redis, new_host, new_port)
+    join_cluster(exist_redis, new_node, new_host, new_port, password, wait_timeout)
 
     # master_id가 있으면 리플리카로 설정, 없으면 마스터로 유지
     if master_id:
@@ -37,10 +36,16 @@ def add_node(new_node, existing_node, password, master_id=None):
     print(f"🎉 노드 추가 완료: {new_node} (Node ID: {node_id})\n")
 
 
-def join_cluster(exist_redis, new_host, new_port):
+def join_cluster(exist_redis, new_node, new_host, new_port, password, wait_timeout=30.0):
     """
-    클러스터 참여 중인 노드에 MEET 명령어를 보내 새 노드를 클러스터에 참여시킴
+    클러스터 참여 중인 노드에 MEET 명령어를 보내 새 노드를 클러스터에 참여시킨 뒤,
+    기존 노드들과 새 노드가 모두 서로를 인식할 때까지 대기
     """
+    nodes_dict = RedisUtils.get_cluster_nodes(exist_redis)
+    known_nodes = len([addr for addr in nodes_dict if addr != new_node])
+    cluster_addrs = [addr for addr in RedisUtils.reachable_nodes(nodes_dict) if addr != new_node]
+    was_ok = RedisUtils.cluster_info(exist_redis).get("cluster_state") == "ok"
+
     print("\n🔗 기존 클러스터 노드에 MEET 요청 중...")
     try:
         RedisUtils.cluster_meet(exist_redis, new_host, new_port)
@@ -49,10 +54,15 @@ def join_cluster(exist_redis, new_host, new_port):
         print(f"❌ MEET 요청 실패: {e}")
         sys.exit(1)
 
-    # 명령 전파를 위한 잠시 대기
-    print("\n⌛ MEET 명령 전파 대기 중 (약 2초)...")
-    for _ in tqdm(range(20), desc="    - 대기중", ncols=70):
-        time.sleep(0.1)
+    # 새 노드가 모든 노드에 전파될 때까지 대기 (기존 클러스터가 ok였다면 ok 상태까지 확인)
+    # fail/noaddr/disconnected 노드는 응답을 기다리지 않고, 인식 노드 수에만 포함
+    print("\n⌛ MEET 명령 전파 대기 중...")
+    if len(cluster_addrs) < known_nodes:
+        print(f"    - 장애/연결 끊김 노드 {known_nodes - len(cluster_addrs)}개는 응답 대기에서 제외")
+    if not RedisUtils.wait_for_convergence(cluster_addrs + [new_node], password, expected_nodes=known_nodes + 1,
+                                           require_ok=was_ok, timeout=wait_timeout):
+        print("❌ 새 노드가 클러스터에 전파되지 않았습니다. --wait-timeout을 늘려 다시 시도해 주세요.")
+        sys.exit(1)
     print()
 
 
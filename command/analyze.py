@@ -0,0 +1,289 @@
+import json
+import sys
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from redis.crc import key_slot
+from tqdm import tqdm
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from utils.topk_utils import TopK, SpaceSaving
+from command.reshard import format_bytes
+
+
+def analyze(access_node, password, count=1000, top=20, samples=5, tag_capacity=1000, max_keys=None, hot_share=1.0,
+            json_path=None):
+    """
+    클러스터 키 분포 분석 메인 함수.
+    - 모든 마스터를 동시에 SCAN 하고, SCAN 배치마다 MEMORY USAGE / TYPE을 파이프라인 한 번으로 조회
+    - 메모리 고정 집계: 가장 큰 키 top-K(최소 힙), 슬롯별 키 수/바이트 배열, 해시 태그별 바이트(Space-Saving)
+    - 이동 비용이 큰 슬롯, 해시 태그 쏠림, 마스터 간 바이트 불균형과 rebalance 가중치 제안 출력
+
+    (인자)
+    - count (int): SCAN COUNT (배치 크기)
+    - top (int): 출력할 큰 키 / 비싼 슬롯 / 해시 태그 수
+    - samples (int): MEMORY USAGE SAMPLES (중첩 타입의 원소 샘플 수, 0이면 전체)
+    - tag_capacity (int): 해시 태그 추적 카운터 수
+    - max_keys (int, optional): 마스터별 최대 분석 키 수 (없으면 전체)
+    - hot_share (float): 전체 바이트 중 이 비율(%) 이상을 차지하는 해시 태그를 쏠림으로 표시
+    - json_path (str, optional): 분석 결과를 저장할 JSON 파일
+    """
+    validate_analyze_options(count, top, samples, tag_capacity, max_keys)
+    host, port = StringUtils.parse_node(access_node)
+    PrintUtils.info(f"{access_node}를 통해 클러스터 토폴로지 조회 중...")
+    with Stats.phase("토폴로지 조회"):
+        r = RedisUtils.connect_node(host, port, password)
+        slot_map = SlotMap.from_cluster_nodes(RedisUtils.get_cluster_nodes(r))
+    masters = sorted(addr for addr in set(slot_map.owner_addrs()) if addr)
+    if not masters:
+        PrintUtils.error("슬롯을 보유한 마스터 노드가 없습니다.")
+        sys.exit(1)
+
+    print(f"🔎 마스터 {len(masters)}개 동시 SCAN 시작 (COUNT {count}, MEMORY USAGE SAMPLES {samples})")
+    started = time.time()
+    with Stats.phase("SCAN 및 크기 조회"), ThreadPoolExecutor(max_workers=len(masters)) as executor:
+        futures = [
+            executor.submit(scan_master, addr, password, count, top, samples, tag_capacity, max_keys, pos)
+            for pos, addr in enumerate(masters)
+        ]
+        scans = {addr: future.result() for addr, future in zip(masters, futures)}
+    elapsed = time.time() - started
+
+    total = KeyspaceScan(top, tag_capacity)
+    for scan in scans.values():
+        total.merge(scan)
+    print(f"\n✅ 키 {total.keys:,}개, {format_bytes(total.bytes)} 분석 완료 ({elapsed:.1f}초)")
+
+    print_masters(scans, total, slot_map)
+    print_types(total)
+    print_big_keys(total, slot_map)
+    print_slot_histogram(total)
+    expensive = print_expensive_slots(total, slot_map, top)
+    hot_tags = print_hot_tags(total, top, hot_share)
+    weights = print_rebalance_advice(scans, total, slot_map)
+
+    if json_path:
+        write_report(json_path, scans, total, slot_map, expensive, hot_tags, weights)
+
+
+def validate_analyze_options(count, top, samples, tag_capacity, max_keys):
+    errors = []
+    if count < 1 or top < 1 or tag_capacity < 1:
+        errors.append("--count, --top, --tag-capacity 값은 1 이상이어야 합니다.")
+    if samples < 0:
+        errors.append("--samples 값은 0 이상이어야 합니다.")
+    if max_keys is not None and max_keys < 1:
+        errors.append("--max-keys 값은 1 이상이어야 합니다.")
+    if errors:
+        PrintUtils.error("유효성 검사 실패:")
+        for err in errors:
+            print(f" - {err}")
+        sys.exit(1)
+
+
+class KeyspaceScan:
+    """
+    SCAN 결과 집계 (마스터 하나 또는 전체). 키 수와 관계없이 메모리 사용량 고정
+    - slot_keys / slot_bytes: 슬롯별 키 수 / 바이트 (길이 16384 배열)
+    - biggest: 가장 큰 키 top-K [(bytes, (key, type, slot))]
+    - tags: 해시 태그별 바이트 (Space-Saving)
+    """
+
+    def __init__(self, top, tag_capacity):
+        self.keys = 0
+        self.bytes = 0
+        self.types = Counter()
+        self.slot_keys = array("q", [0]) * RedisUtils.TOTAL_SLOTS
+        self.slot_bytes = array("q", [0]) * RedisUtils.TOTAL_SLOTS
+        self.biggest = TopK(top)
+        self.tags = SpaceSaving(tag_capacity)
+
+    def record(self, key, size, key_type):
+        slot = key_slot(key.encode())
+        self.keys += 1
+        self.bytes += size
+        self.types[key_type] += 1
+        self.slot_keys[slot] += 1
+        self.slot_bytes[slot] += size
+        self.biggest.add(size, (key, key_type, slot))
+        tag = hash_tag(key)
+        if tag is not None:
+            self.tags.add(tag, size)
+
+    def merge(self, other):
+        self.keys += other.keys
+        self.bytes += other.bytes
+        self.types.update(other.types)
+        for slot in range(RedisUtils.TOTAL_SLOTS):
+            self.slot_keys[slot] += other.slot_keys[slot]
+            self.slot_bytes[slot] += other.slot_bytes[slot]
+        self.biggest.merge(other.biggest)
+        self.tags.merge(other.tags)
+
+
+def hash_tag(key):
+    """
+    클러스터 해시 태그 ({...} 안의 비어있지 않은 첫 부분). 없으면 None
+    """
+    start = key.find("{")
+    if start < 0:
+        return None
+    end = key.find("}", start + 1)
+    if end <= start + 1:
+        return None
+    return key[start + 1:end]
+
+
+def scan_master(addr, password, count, top, samples, tag_capacity, max_keys, position):
+    """
+    마스터 하나를 SCAN 하며 배치마다 MEMORY USAGE / TYPE 파이프라인으로 KeyspaceScan 집계
+    """
+    conn = RedisUtils.connect_node(*StringUtils.parse_node(addr), password)
+    scan = KeyspaceScan(top, tag_capacity)
+    limit = min(conn.dbsize(), max_keys) if max_keys else conn.dbsize()
+    cursor = 0
+    with tqdm(total=limit, desc=f"    - {addr}", unit="key", position=position) as bar:
+        while True:
+            cursor, keys = conn.scan(cursor, count=count)
+            if max_keys:
+                keys = keys[:max_keys - scan.keys]
+            if keys:
+                for key, (size, key_type) in zip(keys, RedisUtils.memory_usage_and_types(conn, keys, samples)):
+                    if size is not None:
+                        scan.record(key, size, key_type)
+                bar.update(len(keys))
+            if cursor == 0 or (max_keys and scan.keys >= max_keys):
+                break
+    return scan
+
+
+def print_masters(scans, total, slot_map):
+    """
+    마스터별 키 수, 바이트, 슬롯 수와 전체 대비 비율
+    """
+    print("\n📊 마스터별 분포:")
+    counts = slot_map.counts()
+    owners = {addr: node_id for node_id, addr in slot_map.addrs.items()}
+    for addr, scan in scans.items():
+        node_id = owners[addr]
+        print(f"    - {addr} ({node_id[:8]}): 키 {scan.keys:,}개, {format_bytes(scan.bytes)} "
+              f"({share(scan.bytes, total.bytes):.1f}%), 슬롯 {counts[node_id]}개 ({share(counts[node_id], RedisUtils.TOTAL_SLOTS):.1f}%)")
+
+
+def print_types(total):
+    print("\n🧩 타입별 키 수: " + ", ".join(f"{key_type} {n:,}" for key_type, n in total.types.most_common()))
+
+
+def print_big_keys(total, slot_map):
+    print(f"\n🐘 가장 큰 키 top {total.biggest.k}:")
+    for size, (key, key_type, slot) in total.biggest.items():
+        print(f"    - {format_bytes(size):>10}  {key_type:<6} 슬롯 {slot:<5} {slot_map.owner_addr(slot)}  {key}")
+
+
+def print_slot_histogram(total):
+    """
+    키가 있는 슬롯의 바이트 분포 (2의 거듭제곱 구간) 및 슬롯별 키 수 / 바이트 백분위
+    """
+    used = [slot for slot in range(RedisUtils.TOTAL_SLOTS) if total.slot_keys[slot]]
+    print(f"\n📈 슬롯별 분포 (키가 있는 슬롯 {len(used):,}개):")
+    if not used:
+        return
+    for label, values in (("키 수", sorted(total.slot_keys[s] for s in used)), ("바이트", sorted(total.slot_bytes[s] for s in used))):
+        p50, p90, p99 = (values[min(len(values) - 1, int(len(values) * p))] for p in (0.5, 0.9, 0.99))
+        fmt = format_bytes if label == "바이트" else (lambda v: f"{v:,}")
+        print(f"    - {label}: p50 {fmt(p50)}, p90 {fmt(p90)}, p99 {fmt(p99)}, max {fmt(values[-1])}")
+    buckets = Counter(total.slot_bytes[s].bit_length() for s in used)
+    width = max(buckets.values())
+    for bits in sorted(buckets):
+        low = format_bytes(1 << (bits - 1)) if bits else "0B"
+        print(f"      {low:>10} ~ : {'█' * max(1, round(40 * buckets[bits] / width))} {buckets[bits]:,}")
+
+
+def print_expensive_slots(total, slot_map, top):
+    """
+    바이트가 큰(이동 비용이 큰) 슬롯 top 출력. [(slot, bytes, keys)] 반환
+    """
+    heap = TopK(top)
+    for slot in range(RedisUtils.TOTAL_SLOTS):
+        if total.slot_bytes[slot]:
+            heap.add(total.slot_bytes[slot], slot)
+    expensive = [(slot, size, total.slot_keys[slot]) for size, slot in heap.items()]
+    avg = total.bytes / max(1, sum(1 for s in range(RedisUtils.TOTAL_SLOTS) if total.slot_keys[s]))
+    print(f"\n💸 이동 비용이 큰 슬롯 top {len(expensive)} (키가 있는 슬롯 평균 {format_bytes(avg)}):")
+    for slot, size, keys in expensive:
+        print(f"    - 슬롯 {slot:<5} {format_bytes(size):>10} (평균의 {size / avg if avg else 0:,.1f}배), 키 {keys:,}개, {slot_map.owner_addr(slot)}")
+    return expensive
+
+
+def print_hot_tags(total, top, hot_share):
+    """
+    바이트 기준 상위 해시 태그 출력. 추정 오차를 뺀 하한이 전체의 hot_share% 이상이면 쏠림으로 표시. [(tag, bytes, error)] 반환
+    """
+    tags = total.tags.top(top)
+    print(f"\n🔥 해시 태그 상위 {len(tags)}개 (바이트 기준, 태그가 있는 키 {format_bytes(total.tags.total)}):")
+    for tag, size, error in tags:
+        ratio = share(size, total.bytes)
+        mark = "⚠️ " if share(size - error, total.bytes) >= hot_share else ""
+        slot = key_slot(tag.encode())
+        bound = f" (오차 ≤ {format_bytes(error)})" if error else ""
+        print(f"    - {mark}{{{tag}}} → 슬롯 {slot}: {format_bytes(size)}{bound}, 전체의 {ratio:.2f}%")
+    if any(share(size - error, total.bytes) >= hot_share for _, size, error in tags):
+        print("    ⚠️ 표시된 태그는 한 슬롯에 묶여 있어 리샤딩으로 분산할 수 없습니다. 키 설계(태그 분할)를 검토하세요.")
+    return tags
+
+
+def print_rebalance_advice(scans, total, slot_map):
+    """
+    마스터 간 바이트 불균형과, 슬롯당 바이트가 마스터마다 같다고 가정했을 때 바이트를 균등하게 만드는
+    rebalance 가중치(슬롯 수 / 바이트, 평균 1로 정규화) 제안. {node_id: weight} 반환
+    """
+    counts = slot_map.counts()
+    owners = {addr: node_id for node_id, addr in slot_map.addrs.items() if addr in scans}
+    avg = total.bytes / len(scans) if scans else 0
+    deviation = max((abs(scan.bytes - avg) / avg * 100 for scan in scans.values()), default=0) if avg else 0
+    print(f"\n⚖️ 마스터 간 바이트 편차: 최대 {deviation:.1f}% (평균 {format_bytes(avg)})")
+    if deviation < 10 or not all(scan.bytes for scan in scans.values()):
+        print("    - 바이트 기준으로 균형 상태입니다." if deviation < 10 else "    - 데이터가 없는 마스터가 있어 가중치를 계산하지 않습니다.")
+        return {}
+
+    density = {owners[addr]: counts[owners[addr]] / scan.bytes for addr, scan in scans.items()}
+    mean = sum(density.values()) / len(density)
+    weights = {node_id: round(value / mean, 2) for node_id, value in density.items()}
+    print("    - 슬롯 수가 아닌 바이트를 맞추려면 다음 가중치로 rebalance를 실행하세요:")
+    print("      ./rcctl --password <password> rebalance " + " ".join(f"--weight {n}={w:g}" for n, w in sorted(weights.items())) + " <ip:port>")
+    print("    - 이동 비용이 큰 슬롯은 --strategy fewest-keys / contiguous 로 reshard 하면 피할 수 있습니다.")
+    return weights
+
+
+def share(part, whole):
+    return 100.0 * part / whole if whole else 0.0
+
+
+def write_report(path, scans, total, slot_map, expensive, hot_tags, weights):
+    """
+    분석 결과를 JSON으로 저장 (슬롯별 값은 키가 있는 슬롯만)
+    """
+    report = {
+        "keys": total.keys,
+        "bytes": total.bytes,
+        "types": dict(total.types),
+        "masters": {addr: {"keys": scan.keys, "bytes": scan.bytes} for addr, scan in scans.items()},
+        "biggest_keys": [
+            {"key": key, "type": key_type, "bytes": size, "slot": slot, "owner": slot_map.owner_addr(slot)}
+            for size, (key, key_type, slot) in total.biggest.items()
+        ],
+        "expensive_slots": [{"slot": slot, "bytes": size, "keys": keys} for slot, size, keys in expensive],
+        "hot_tags": [{"tag": tag, "bytes": size, "error": error, "slot": key_slot(tag.encode())} for tag, size, error in hot_tags],
+        "suggested_weights": weights,
+        "slots": {
+            str(slot): {"keys": total.slot_keys[slot], "bytes": total.slot_bytes[slot]}
+            for slot in range(RedisUtils.TOTAL_SLOTS) if total.slot_keys[slot]
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n📝 분석 결과 저장: {path}")
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import sys
+import time
+import redis.asyncio as aioredis
+from redis.crc import key_slot
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.histogram_utils import LatencyHistogram
+from utils.slot_utils import SlotMap
+
+
+def bench(access_node, password, clients=50, duration=10, get_ratio=0.8, pipeline=1, value_size=64, keyspace=100000, seed=0):
+    """
+    클러스터 성능 측정 메인 함수.
+    - CLUSTER NODES로 마스터 목록을 조회하고, 각 마스터가 소유한 슬롯으로 가는 키만 해당 마스터에 직접 전송
+    - clients개의 asyncio 클라이언트를 마스터에 고르게 배정해 duration초 동안 GET/SET 혼합 부하 발생
+    - 마스터별 처리량과 p50/p99/p999 지연 시간(HDR 히스토그램, 메모리 고정) 출력
+
+    (인자)
+    - get_ratio (float): 전체 명령 중 GET 비율 (나머지는 SET)
+    - pipeline (int): 요청 한 번에 보낼 명령 수 (1이면 파이프라인 없이 명령마다 왕복)
+    - value_size (int): SET 값 크기 (bytes)
+    - keyspace (int): 마스터별로 사용할 키 개수
+    """
+    validate_bench_options(clients, duration, get_ratio, pipeline, value_size, keyspace)
+    host, port = StringUtils.parse_node(access_node)
+    PrintUtils.info(f"{access_node}를 통해 클러스터 토폴로지 조회 중...")
+    r = RedisUtils.connect_node(host, port, password)
+    nodes_dict = RedisUtils.get_cluster_nodes(r)
+
+    masters = get_master_tags(nodes_dict)
+    if not masters:
+        PrintUtils.error("슬롯을 보유한 마스터 노드가 없습니다.")
+        sys.exit(1)
+
+    print(f"🏁 마스터 {len(masters)}개, 클라이언트 {clients}개, {duration}초 측정 시작 "
+          f"(GET {get_ratio:.0%} / SET {1 - get_ratio:.0%}, pipeline {pipeline}, value {value_size}B)")
+    results = asyncio.run(run_bench(masters, password, clients, duration, get_ratio, pipeline, value_size, keyspace, seed))
+    print_report(results, duration)
+
+
+def validate_bench_options(clients, duration, get_ratio, pipeline, value_size, keyspace):
+    errors = []
+    if clients < 1:
+        errors.append("--clients 값은 1 이상이어야 합니다.")
+    if duration <= 0:
+        errors.append("--duration 값은 0보다 커야 합니다.")
+    if not 0 <= get_ratio <= 1:
+        errors.append("--get-ratio 값은 0 이상 1 이하여야 합니다.")
+    if pipeline < 1 or value_size < 1 or keyspace < 1:
+        errors.append("--pipeline, --value-size, --keyspace 값은 1 이상이어야 합니다.")
+    if errors:
+        PrintUtils.error("유효성 검사 실패:")
+        for err in errors:
+            print(f" - {err}")
+        sys.exit(1)
+
+
+def get_master_tags(nodes_dict, tags_per_master=16):
+    """
+    슬롯을 보유한 마스터별로, 해당 마스터의 슬롯으로 해시되는 해시 태그 목록 생성.
+    {addr: [tag, ...]} 반환 (키는 "bench:{tag}:N" 형식으로 만들어 항상 해당 마스터로 전송)
+    """
+    slot_map = SlotMap.from_cluster_nodes(nodes_dict)
+
+    tags = {addr: [] for addr in set(slot_map.owner_addrs()) if addr}
+    n = 0
+    while any(len(t) < tags_per_master for t in tags.values()) and n < RedisUtils.TOTAL_SLOTS * 64:
+        tag = f"b{n}"
+        owner = slot_map.owner_addr(key_slot(tag.encode()))
+        if owner and len(tags[owner]) < tags_per_master:
+            tags[owner].append(tag)
+        n += 1
+    return tags
+
+
+async def run_bench(masters, password, clients, duration, get_ratio, pipeline, value_size, keyspace, seed):
+    """
+    마스터별 클라이언트 태스크를 실행하고 {addr: (명령 수, 오류 수, LatencyHistogram)} 반환
+    """
+    addrs = sorted(masters)
+    stats = {addr: {"ops": 0, "errors": 0, "hist": LatencyHistogram()} for addr in addrs}
+    value = "x" * value_size
+    deadline = time.perf_counter() + duration
+
+    async def client(idx, addr):
+        host, port = StringUtils.parse_node(addr)
+        conn = aioredis.Redis(host=host, port=port, password=password, single_connection_client=True)
+        rng = random.Random(f"{seed}:{idx}")
+        tags = masters[addr]
+        stat = stats[addr]
+        try:
+            while time.perf_counter() < deadline:
+                ops = [(rng.random() < get_ratio, f"bench:{{{rng.choice(tags)}}}:{rng.randrange(keyspace)}") for _ in range(pipeline)]
+                started = time.perf_counter()
+                try:
+                    if pipeline == 1:
+                        is_get, key = ops[0]
+                        await (conn.get(key) if is_get else conn.set(key, value))
+                    else:
+                        pipe = conn.pipeline(transaction=False)
+                        for is_get, key in ops:
+                            if is_get:
+                                pipe.get(key)
+                            else:
+                                pipe.set(key, value)
+                        await pipe.execute()
+                except Exception:
+                    stat["errors"] += pipeline
+                    continue
+                stat["hist"].record((time.perf_counter() - started) * 1_000_000)
+                stat["ops"] += pipeline
+        finally:
+            await conn.aclose()
+
+    await asyncio.gather(*(client(i, addrs[i % len(addrs)]) for i in range(clients)))
+    return stats
+
+
+def print_report(stats, duration):
+    """
+    마스터별 / 전체 처리량과 지연 시간 백분위 출력 (지연 시간은 요청(왕복) 단위, ms)
+    """
+    total = LatencyHistogram()
+    total_ops = total_errors = 0
+    print("\n📊 [벤치마크 결과] (지연 시간 단위: ms, 요청 왕복 기준)")
+    print(f"  {'master':<22}{'ops/sec':>12}{'p50':>9}{'p99':>9}{'p999':>9}{'max':>9}{'errors':>9}")
+    for addr, stat in stats.items():
+        hist = stat["hist"]
+        total.merge(hist)
+        total_ops += stat["ops"]
+        total_errors += stat["errors"]
+        print_row(addr, stat["ops"] / duration, hist, stat["errors"])
+    print_row("TOTAL", total_ops / duration, total, total_errors)
+
+
+def print_row(label, ops_per_sec, hist, errors):
+    p50, p99, p999, max_ms = (value / 1000 for value in (hist.percentile(50), hist.percentile(99), hist.percentile(99.9), hist.max))
+    print(f"  {label:<22}{ops_per_sec:>12,.0f}{p50:>9.2f}{p99:>9.2f}{p999:>9.2f}{max_ms:>9.2f}{errors:>9,}")
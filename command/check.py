@@ -1,43 +1,49 @@
 import sys
 import redis
-import ast
 from utils.string_utils import StringUtils
 from utils.print_utils import PrintUtils
 from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
 
 
-def check(access_node, password):
+def check(access_node, password, connect_timeout=2.0, read_timeout=5.0, workers=32):
     """
     Redis 클러스터 상태 점검의 메인 함수.
     1단계부터 4단계까지 클러스터 노드 정보 파싱, 슬롯 커버리지, 연결 상태, 노드간 정보 일치성 검사를 수행.
+    - connect_timeout / read_timeout: 노드별 연결 / 응답 대기 제한 시간(초)
+    - workers: 노드 정보를 동시에 조회할 최대 노드 수
     """ 
-    # redis 연결 객체
-    r = connect_base_node(access_node, password)
-    # 클러스터에 포함된 노드 정보 추출 dict
-    nodes_dict = fetch_cluster_nodes(r)
+    with Stats.phase("기준 노드 조회"):
+        # redis 연결 객체
+        r = connect_base_node(access_node, password, connect_timeout, read_timeout)
+        # 클러스터에 포함된 노드 정보 추출 dict
+        nodes_dict = fetch_cluster_nodes(r)
     # 비교 위해 정규화 (불필요한 node 정보 제거)
     print("\n CLUSTER NODES로 노드 정보 정규화(불필요한 필드 제거, 정렬 등)...\n ")
     normalized_nodes = normalize_nodes(nodes_dict)
 
 
     # 1. 슬롯 커버리지 체크
-    slot_check = check_slot_coverage(normalized_nodes)
+    slot_check = check_slot_coverage(SlotMap.from_cluster_nodes(nodes_dict))
     # 2. 연결 상태 체크(cluster_nodes로 얻은 정보에서 connection 확인)
     connected_check = check_node_connections(normalized_nodes)
     # 3. 모든 노드가 동일한 CLUSTER NODES를 반환하는가 체크
-    cluster_consistency = check_cluster_consistency(normalized_nodes, password, nodes_dict)
+    with Stats.phase("노드 간 일치성 검사"):
+        cluster_consistency, unreachable = check_cluster_consistency(
+            normalized_nodes, password, nodes_dict, connect_timeout, read_timeout, workers)
 
     # 결과 출력
-    print_summary(slot_check, connected_check, cluster_consistency, r)
+    print_summary(slot_check, connected_check, cluster_consistency, r, unreachable)
 
 
-def connect_base_node(access_node, password):
+def connect_base_node(access_node, password, connect_timeout=None, read_timeout=None):
     """
     기준 노드에 연결하여 Redis 인스턴스를 반환한다.
     """
     host, port = StringUtils.parse_node(access_node)
     print(f"🔍 기준 노드 {access_node} 에 연결 중...")
-    return RedisUtils.connect_node(host, port, password)
+    return RedisUtils.connect_node(host, port, password, connect_timeout, read_timeout)
 
 
 def fetch_cluster_nodes(redis_client):
@@ -99,42 +105,22 @@ def slots_to_str(slots):
     return sorted(result)
 
 
-def check_slot_coverage(normalized_nodes):
+def check_slot_coverage(slot_map):
     """
-    모든 노드의 슬롯 커버리지를 합쳐 0~16383 슬롯이 전부 커버되는지 검사.
+    슬롯 맵으로 0~16383 슬롯이 전부 커버되는지 검사.
     누락된 슬롯이 있으면 False, 모두 있으면 True 반환.
+    여러 노드가 주장하는 슬롯, MIGRATING/IMPORTING 상태 슬롯은 경고로 출력.
     """
     print("📦 [첫 번째] 슬롯 커버리지 확인 중...\n")
 
-    all_slots = set()
+    if slot_map.overlaps:
+        print(f"⚠️ 여러 노드가 소유를 주장하는 슬롯: {StringUtils.format_slot_ranges(slot_map.overlaps)}")
+    if slot_map.open_slots:
+        print(f"⚠️ 이동 중(MIGRATING/IMPORTING)인 슬롯: {StringUtils.format_slot_ranges(slot_map.open_slots)}")
 
-    for addr, info in normalized_nodes.items():
-        for slot_range in info["slots"]:
-            # slot_range 가 문자열로 표현된 리스트 형태면 ast.literal_eval 로 변환 시도
-            if isinstance(slot_range, str) and slot_range.startswith("["):
-                try:
-                    slot_range = ast.literal_eval(slot_range)
-                except Exception:
-                    print(f"⚠️ 슬롯 파싱 실패: {slot_range}")
-                    continue
-
-            if isinstance(slot_range, list):
-                if len(slot_range) == 2:
-                    all_slots.update(range(int(slot_range[0]), int(slot_range[1]) + 1))
-                elif len(slot_range) == 1:
-                    all_slots.add(int(slot_range[0]))
-            elif isinstance(slot_range, str) and "-" in slot_range:
-                start, end = map(int, slot_range.split("-"))
-                all_slots.update(range(start, end + 1))
-            else:
-                try:
-                    all_slots.add(int(slot_range))
-                except ValueError:
-                    print(f"⚠️ 처리할 수 없는 슬롯: {slot_range}")
-
-    missing_slots = set(range(16384)) - all_slots
+    missing_slots = slot_map.unassigned()
     if missing_slots:
-        print(f"⚠️ 할당되지 않은 슬롯 존재: 총 {len(missing_slots)}개 슬롯가 할당되지 않았습니다.\n")
+        print(f"⚠️ 할당되지 않은 슬롯 존재: 총 {len(missing_slots)}개 슬롯가 할당되지 않았습니다. ({StringUtils.format_slot_ranges(missing_slots)})\n")
         return False
     else:
         print("✅ 모든 슬롯이 정상적으로 할당되어 있습니다.\n")
@@ -160,45 +146,50 @@ def check_node_connections(normalized_nodes):
     return connected_check
 
 
-def check_cluster_consistency(normalized_nodes, password, nodes_dict):
+def check_cluster_consistency(normalized_nodes, password, nodes_dict, connect_timeout=2.0, read_timeout=5.0, workers=32):
     """
-    각 노드에 접속해 CLUSTER NODES 정보를 가져와 기준 정보(normalized_nodes)와 비교.
-    일치하지 않으면 그 노드 주소를 리스트에 추가해 반환.
+    모든 노드에 동시에 접속해(RedisUtils.broadcast) CLUSTER NODES 정보를 가져와 기준 정보(normalized_nodes)와 비교.
+    - 노드별 조회 시간(ms) 출력
+    - 접속/조회에 실패한 노드는 종료하지 않고 실패 목록에 모아 요약에 표시
+    (일치 여부, 접속 실패 노드 [(addr, 오류)]) 반환
     """
     print("🧩 [세 번째] CLUSTER NODES 정보 일치 여부 검사 중...\n")
 
-    inconsistent_nodes = []
+    addrs = list(normalized_nodes)
+    results = RedisUtils.broadcast(addrs, (RedisUtils.CLUSTER_NODES,), password, timeout=read_timeout,
+                                   concurrency=max(1, workers), connect_timeout=connect_timeout)
 
-    for addr, info in normalized_nodes.items():
-        h, p = StringUtils.parse_node(addr)
-        node_r = RedisUtils.connect_node(h, p, password)
-        try:
-            cluster_nodes_at_node = RedisUtils.cluster_nodes(node_r)
-            if isinstance(cluster_nodes_at_node, dict):
-                normalized_at_node = normalize_nodes(cluster_nodes_at_node)
-
-                if normalized_at_node != normalized_nodes:
-                    inconsistent_nodes.append(addr)
-            else:
-                raw = node_r.execute_command("CLUSTER NODES")
-                if str(raw).strip() != str(nodes_dict).strip():
-                    inconsistent_nodes.append(addr)
-        except Exception as e:
-            print(f"⚠️ 노드 {addr} 에서 비교 실패: {e}")
+    inconsistent_nodes = []
+    unreachable = []
+    for result in results:
+        addr, cluster_nodes_at_node, error, elapsed = result.addr, result.value, result.error, result.elapsed
+        if error is not None:
+            print(f"❌ 노드 {addr} 조회 실패 ({elapsed * 1000:.1f}ms): {error}")
+            unreachable.append((addr, error))
+            continue
+        print(f"    - 노드 {addr} 조회 완료 ({elapsed * 1000:.1f}ms)")
+        if isinstance(cluster_nodes_at_node, dict):
+            if normalize_nodes(cluster_nodes_at_node) != normalized_nodes:
+                inconsistent_nodes.append(addr)
+        elif str(cluster_nodes_at_node).strip() != str(nodes_dict).strip():
             inconsistent_nodes.append(addr)
+    print()
 
     if inconsistent_nodes:
         print(f"❌ CLUSTER NODES 정보가 일치하지 않는 노드: {len(inconsistent_nodes)}개")
         for addr in inconsistent_nodes:
             print(f" - {addr}")
-        return False
+        return False, unreachable
+    elif unreachable:
+        print(f"⚠️ 응답한 노드 {len(addrs) - len(unreachable)}개의 CLUSTER NODES 정보는 일치합니다. (조회 실패 {len(unreachable)}개)")
+        return True, unreachable
     else:
         print("✅ 모든 노드가 동일한 CLUSTER NODES 정보를 가지고 있습니다.")
-        return True
+        return True, unreachable
 
 
 import pprint
-def print_summary(slot_check, connected_check, cluster_consistency, r):
+def print_summary(slot_check, connected_check, cluster_consistency, r, unreachable=()):
     """
     점검 결과를 요약하여 출력한다.
     """
@@ -206,7 +197,10 @@ def print_summary(slot_check, connected_check, cluster_consistency, r):
     print(f" - 슬롯 커버리지: {'✅ 정상' if slot_check else '⚠️ 누락 있음'}")
     print(f" - 노드 연결 상태: {'✅ 모두 연결됨' if connected_check else '❌ 연결 끊긴 노드 있음'}")
     print(f" - CLUSTER NODES 일치성: {'✅ 일치함' if cluster_consistency else '❌ 불일치함'}")
-    if slot_check and connected_check and cluster_consistency:
+    print(f" - 노드 접속: {'✅ 모두 응답함' if not unreachable else f'❌ 응답 없는 노드 {len(unreachable)}개'}")
+    for addr, error in unreachable:
+        print(f"    - {addr}: {error}")
+    if slot_check and connected_check and cluster_consistency and not unreachable:
         print("\n🎉 클러스터 상태는 정상입니다.")
     else:
         print("\n⚠️ 클러스터에 이상이 있습니다. 조치가 필요합니다.")
@@ -0,0 +1,225 @@
+import os
+import redis
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.journal_utils import SlotJournal
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from command.reshard import rate, print_failures
+from command.restore import restore_batch, zip_longest_slots
+
+
+def copy_cluster(src_node, dst_node, password, dst_password=None, slots=None, batch=100, parallel=4, window=4,
+                 method="migrate", replace=False, resume=False, journal_path=None):
+    """
+    한 클러스터의 키를 다른 클러스터로 복사하는 메인 함수.
+    - 슬롯 단위로 소스 마스터에서 키를 읽고, 대상 클러스터에서 그 슬롯을 소유한 마스터로 batch개씩 전송
+    - method=migrate: 소스 노드가 대상 노드로 직접 MIGRATE COPY (키 데이터가 이 CLI를 거치지 않음)
+    - method=restore: 소스에서 DUMP / PTTL 파이프라인으로 읽어 대상에 RESTORE 파이프라인 (소스가 대상에 접속할 수 없을 때)
+    - 대상 노드마다 동시에 진행 중인 배치 수를 window개로 제한
+    - 완료된 슬롯은 저널에 기록되어 --resume 시 건너뜀
+
+    (인자)
+    - dst_password (str, optional): 대상 클러스터 비밀번호 (기본: password)
+    - slots (str, optional): 복사할 슬롯 범위 ("0-100,200", 기본: 전체)
+    - batch (int): MIGRATE / RESTORE 한 번에 보낼 키 수
+    - parallel (int): 소스 마스터마다 동시에 복사할 슬롯 수
+    - window (int): 대상 노드마다 동시에 보낼 수 있는 배치 수
+    - replace (bool): 대상에 이미 있는 키를 덮어쓸지 여부 (기본: 건너뜀)
+    - resume (bool): 저널을 읽어 중단된 복사를 이어서 수행 (slots 무시)
+    - journal_path (str, optional): 저널 파일 경로 (기본: logs/copy-<src>-<dst>.journal)
+    """
+    if batch < 1 or parallel < 1 or window < 1:
+        PrintUtils.error("--batch, --parallel, --window 값은 1 이상이어야 합니다.")
+        sys.exit(1)
+    dst_password = dst_password or password
+    journal_path = journal_path or default_journal_path(src_node, dst_node)
+
+    with Stats.phase("토폴로지 조회"):
+        src_map = load_slot_map(src_node, password, "소스")
+        dst_map = load_slot_map(dst_node, dst_password, "대상")
+    if set(src_map.node_ids) & set(dst_map.node_ids):
+        PrintUtils.error("소스와 대상이 같은 클러스터입니다. 클러스터 안에서의 이동은 reshard를 사용하세요.")
+        sys.exit(1)
+
+    if resume:
+        journal = load_journal(journal_path, src_node, dst_node)
+    else:
+        planned = StringUtils.parse_slot_ranges(slots) if slots else range(RedisUtils.TOTAL_SLOTS)
+        planned = [slot for slot in planned if src_map.owner_addr(slot)]
+        journal = SlotJournal.create(journal_path, {"src": src_node, "dst": dst_node}, planned)
+    pending = journal.pending()
+    if not pending:
+        PrintUtils.success("복사할 슬롯이 없습니다.")
+        journal.close()
+        return
+
+    unowned = [slot for slot in pending if not src_map.owner_addr(slot) or not dst_map.owner_addr(slot)]
+    if unowned:
+        PrintUtils.error(f"소스 또는 대상 클러스터에 소유 노드가 없는 슬롯: {StringUtils.format_slot_ranges(unowned)}")
+        journal.close()
+        sys.exit(1)
+
+    try:
+        with Stats.phase("키 수 조회"):
+            key_counts = count_keys(pending, src_map, password)
+        total_keys = sum(key_counts.values())
+        sources = sorted({src_map.owner_addr(slot) for slot in pending})
+        targets = sorted({dst_map.owner_addr(slot) for slot in pending})
+        print(f"📤 슬롯 {len(pending)}개, 키 {total_keys:,}개 복사: 소스 마스터 {len(sources)}개 → 대상 마스터 {len(targets)}개 "
+              f"({method}, 배치 {batch}, 소스당 동시 슬롯 {parallel}, 대상당 동시 배치 {window}"
+              f"{', REPLACE' if replace else ''})")
+        print(f"📝 저널: {journal_path}")
+
+        started = time.time()
+        with Stats.phase("키 복사"):
+            copied, busy, expired, failures = copy_slots(pending, key_counts, src_map, dst_map, password, dst_password, batch,
+                                                parallel, window, method, replace, journal)
+        elapsed = time.time() - started
+    finally:
+        journal.close()
+
+    print(f"\n✅ 복사 완료: 키 {copied:,}개, {elapsed:.1f}초 ({rate(copied, elapsed):,.0f} keys/s)")
+    if busy:
+        PrintUtils.warn(f"대상에 이미 있어 건너뛴 키: {busy:,}개 (덮어쓰려면 --replace)")
+    if expired:
+        PrintUtils.info(f"복사 도중 만료되어 건너뛴 키: {expired:,}개")
+    if failures:
+        print_failures(failures)
+        print(f"💡 실패한 슬롯은 --resume 으로 다시 복사할 수 있습니다 (저널: {journal_path})")
+        sys.exit(1)
+
+
+def load_slot_map(access_node, password, label):
+    PrintUtils.info(f"{label} 클러스터 {access_node} 토폴로지 조회 중...")
+    r = RedisUtils.connect_node(*StringUtils.parse_node(access_node), password)
+    return SlotMap.from_cluster_nodes(RedisUtils.get_cluster_nodes(r))
+
+
+def default_journal_path(src_node, dst_node):
+    """
+    소스/대상 접속 노드 주소로 기본 저널 경로 생성
+    """
+    return os.path.join("logs", f"copy-{src_node.replace(':', '_')}-{dst_node.replace(':', '_')}.journal")
+
+
+def load_journal(journal_path, src_node, dst_node):
+    if not os.path.exists(journal_path):
+        PrintUtils.error(f"저널 파일을 찾을 수 없습니다: {journal_path}")
+        sys.exit(1)
+    journal = SlotJournal.load(journal_path)
+    if journal.meta.get("src") != src_node or journal.meta.get("dst") != dst_node:
+        PrintUtils.error(f"저널의 소스/대상({journal.meta.get('src')} -> {journal.meta.get('dst')})이 요청과 다릅니다.")
+        sys.exit(1)
+    print(f"↩️ 저널 {journal_path} 에서 이어서 진행: 계획된 슬롯 {len(journal.planned)}개, "
+          f"이미 완료 {len(journal.done)}개")
+    return journal
+
+
+def count_keys(slots, src_map, password):
+    """
+    소스 마스터별로 슬롯 키 수를 파이프라인으로 조회. {slot: 키 수} 반환
+    """
+    by_owner = {}
+    for slot in slots:
+        by_owner.setdefault(src_map.owner_addr(slot), []).append(slot)
+    counts = {}
+    for addr, owned in by_owner.items():
+        conn = RedisUtils.connect_node(*StringUtils.parse_node(addr), password)
+        counts.update(RedisUtils.count_keys_in_slots(conn, owned))
+    return counts
+
+
+def copy_slots(slots, key_counts, src_map, dst_map, password, dst_password, batch, parallel, window, method, replace,
+               journal):
+    """
+    슬롯들을 소스 마스터마다 최대 parallel 개씩 동시에 복사.
+    - 소스 마스터별 슬롯 목록을 번갈아 제출해 모든 소스 마스터를 동시에 읽음
+    - 대상 노드마다 BoundedSemaphore(window)로 동시에 진행 중인 배치 수 제한
+    - 슬롯의 모든 배치가 끝나면 메인 스레드에서 저널에 완료 기록
+    (복사한 키 수, 이미 있어 건너뛴 키 수, 만료되어 건너뛴 키 수, [(slot, 오류)]) 반환
+    """
+    src_conns, dst_conns, windows, by_source = {}, {}, {}, {}
+    for slot in slots:
+        src_addr, dst_addr = src_map.owner_addr(slot), dst_map.owner_addr(slot)
+        if src_addr not in src_conns:
+            src_conns[src_addr] = RedisUtils.connect_node(*StringUtils.parse_node(src_addr), password, decode_responses=False)
+        if dst_addr not in dst_conns:
+            dst_conns[dst_addr] = RedisUtils.connect_node(*StringUtils.parse_node(dst_addr), dst_password,
+                                                          decode_responses=False)
+            windows[dst_addr] = threading.BoundedSemaphore(window)
+        by_source.setdefault(src_addr, []).append(slot)
+    order = [slot for group in zip_longest_slots(by_source.values()) for slot in group]
+
+    def run(slot):
+        src_addr, dst_addr = src_map.owner_addr(slot), dst_map.owner_addr(slot)
+        return copy_slot(src_conns[src_addr], dst_conns[dst_addr], dst_addr, windows[dst_addr], slot, key_counts[slot],
+                         dst_password, batch, method, replace, bar)
+
+    copied = busy = expired = 0
+    failures = []
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=parallel * len(by_source)) as executor, \
+            tqdm(total=sum(key_counts[slot] for slot in slots), desc="복사 진행", unit="key") as bar:
+        futures = {executor.submit(run, slot): slot for slot in order}
+        for future in as_completed(futures):
+            slot = futures[future]
+            try:
+                ok, skipped, gone = future.result()
+                copied += ok
+                busy += skipped
+                expired += gone
+                journal.mark_done(slot)
+            except Exception as e:
+                failures.append((slot, e))
+                tqdm.write(f"❌ 슬롯 {slot} 복사 실패: {e}")
+            bar.set_postfix(keys_per_sec=f"{rate(bar.n, time.time() - started):,.0f}", slots=len(journal.done),
+                            busy=busy, failed=len(failures))
+    return copied, busy, expired, sorted(failures, key=lambda f: f[0])
+
+
+def copy_slot(src_conn, dst_conn, dst_addr, window, slot, count, dst_password, batch, method, replace, bar):
+    """
+    한 슬롯의 키를 batch개씩 대상 노드로 복사. (복사한 키 수, 건너뛴 키 수, 만료되어 건너뛴 키 수) 반환
+    """
+    copied = busy = expired = 0
+    if not count:
+        return copied, busy, expired
+    dst_host, dst_port = StringUtils.parse_node(dst_addr)
+    keys = RedisUtils.get_raw_keys_in_slot(src_conn, slot, count)
+    for i in range(0, len(keys), batch):
+        chunk = keys[i:i + batch]
+        with window:
+            if method == "restore":
+                records = RedisUtils.dump_keys(src_conn, chunk)
+                ok, skipped, gone = restore_batch(dst_conn, records, replace) if records else (0, 0, 0)
+            else:
+                ok, skipped = migrate_copy_batch(src_conn, dst_conn, dst_host, dst_port, chunk, dst_password, replace)
+                gone = 0
+        copied, busy, expired = copied + ok, busy + skipped, expired + gone
+        bar.update(len(chunk))
+    return copied, busy, expired
+
+
+def migrate_copy_batch(src_conn, dst_conn, dst_host, dst_port, keys, dst_password, replace):
+    """
+    키 묶음을 다중 키 MIGRATE COPY 한 번으로 복사.
+    대상에 이미 있는 키 때문에 BUSYKEY로 실패하면, 대상에 없는 키만 골라 다시 MIGRATE COPY.
+    (복사한 키 수, 건너뛴 키 수) 반환
+    """
+    try:
+        RedisUtils.migrate_keys(src_conn, dst_host, dst_port, keys, dst_password, 60000, copy=True, replace=replace)
+        return len(keys), 0
+    except redis.exceptions.ResponseError as e:
+        if replace or "BUSYKEY" not in str(e):
+            raise
+    missing = [key for key, exists in zip(keys, RedisUtils.exists_keys(dst_conn, keys)) if not exists]
+    if missing:
+        RedisUtils.migrate_keys(src_conn, dst_host, dst_port, missing, dst_password, 60000, copy=True)
+    return len(missing), len(keys) - len(missing)
@@ -1,38 +1,65 @@
-import redis
 import sys
-import time
 from utils.string_utils import StringUtils
 from utils.print_utils import PrintUtils
 from utils.redis_utils import RedisUtils
-from tqdm import tqdm
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
 
-def create(nodes, replicas, password):
+def create(nodes, replicas, password, wait_timeout=30.0):
     """
     Redis Cluster 생성 메인 함수
-    - 노드 연결 및 클러스터 토폴로지 구성
+    - 노드 연결 확인 및 클러스터 토폴로지 구성
     - 마스터/리플리카 역할 분리 및 슬롯 할당
     - 리플리카에 마스터 할당(복제 설정)
+    각 단계의 명령은 노드 수와 관계없이 broadcast로 동시에 전송하고, 단계별 소요 시간을 마지막에 출력
+    MEET 전파와 최종 안정화는 고정 시간 대신 클러스터 상태가 수렴할 때까지(최대 wait_timeout초) 대기
     """
     one_set = replicas + 1  # 마스터 1 + 리플리카 수 = 한 세트
     num_masters = len(nodes) // one_set
     validate_master_count(num_masters, len(nodes))
+    timings = []
 
     print("\n--- 1. 노드 연결 및 클러스터 토폴로지 구성 ---")
-    conns = [RedisUtils.connect_node(*StringUtils.parse_node(n), password) for n in nodes]
-    perform_cluster_meet(conns)
+    with Stats.phase("노드 연결 확인") as phase:
+        versions = check_nodes(nodes, password)
+    timings.append((phase.name, phase.wall))
+
+    with Stats.phase("CLUSTER MEET") as phase:
+        perform_cluster_meet(nodes, password)
+    timings.append((phase.name, phase.wall))
+
+    print("\n⌛ MEET 전파 대기 중...")
+    with Stats.phase("MEET 전파 대기") as phase:
+        if not RedisUtils.wait_for_convergence(nodes, password, require_ok=False, timeout=wait_timeout):
+            print("❌ 모든 노드가 서로를 인식하지 못해 생성을 중단합니다. --wait-timeout을 늘려 다시 시도해 주세요.")
+            sys.exit(1)
+    timings.append((phase.name, phase.wall))
 
     print("\n--- 2. 마스터/리플리카 분리 및 슬롯 할당 ---")
-    master_nodes, replica_nodes = split_and_print_nodes(conns, num_masters)
-    assign_slots_to_masters(master_nodes, RedisUtils.TOTAL_SLOTS, num_masters)
+    master_nodes, replica_nodes = split_and_print_nodes(nodes, num_masters)
+    with Stats.phase("슬롯 할당") as phase:
+        assign_slots_to_masters(master_nodes, RedisUtils.TOTAL_SLOTS, num_masters, password, versions)
+    timings.append((phase.name, phase.wall))
 
     print("\n--- 3. 리플리카에 마스터 할당 (복제 설정) ---")
-    master_ids = get_master_nodes_ids(master_nodes)
-    assign_replicas_to_masters(replica_nodes, master_ids, master_nodes)
+    with Stats.phase("CLUSTER MYID") as phase:
+        master_ids = get_master_nodes_ids(master_nodes, password)
+    timings.append((phase.name, phase.wall))
+
+    with Stats.phase("CLUSTER REPLICATE") as phase:
+        assign_replicas_to_masters(replica_nodes, master_ids, master_nodes, password)
+    timings.append((phase.name, phase.wall))
 
     print("\n⌛ 클러스터 안정화 대기 중...")
-    for _ in tqdm(range(20), desc="    - 대기중", ncols=70):
-        time.sleep(0.1)
-    print("\n🎉 클러스터 생성 완료! 🎉")
+    with Stats.phase("안정화 대기") as phase:
+        converged = RedisUtils.wait_for_convergence(nodes, password, require_ok=True, timeout=wait_timeout)
+    timings.append((phase.name, phase.wall))
+
+    print_timings(timings)
+    if converged:
+        print("\n🎉 클러스터 생성 완료! 🎉")
+    else:
+        print("\n⚠️ 클러스터 생성 명령은 완료했지만 상태가 아직 수렴하지 않았습니다. check로 확인해 주세요.")
 
 
 def validate_master_count(num_masters, total_nodes):
@@ -44,85 +71,153 @@ def validate_master_count(num_masters, total_nodes):
         sys.exit(1)
 
 
-def perform_cluster_meet(nodes):
+def check_nodes(nodes, password):
     """
-    첫 번째 노드에 나머지 노드들 MEET 명령 전송해 클러스터 연결 형성
+    모든 노드에 INFO server를 동시에 보내 연결을 확인하고, 노드별 redis_version을 {addr: (major, minor)}로 반환
+    하나라도 응답하지 않으면 실패 노드를 출력하고 종료
     """
-    print("[노드 간 MEET 요청]")
-    first_node = nodes[0]
-    for n in nodes[1:]:
-        host = n.connection_pool.connection_kwargs["host"]
-        port = n.connection_pool.connection_kwargs["port"]
-        try:
-            RedisUtils.cluster_meet(first_node, host, port)
-            print(f"    - {host}:{port} MEET 요청 성공")
-        except redis.exceptions.ResponseError as e:
-            print(f"❌ MEET 실패: {e}")
-    
-    print("\n⌛ MEET 전파 대기 중...")
-    for _ in tqdm(range(20), desc="    - 대기중", ncols=70):
-        time.sleep(0.1)
-    print()
+    print("[노드 연결 확인]")
+    versions = {}
+    failed = []
+    for result in RedisUtils.broadcast(nodes, ("INFO", "server"), password):
+        if result.ok:
+            versions[result.addr] = parse_version(result.value.get("redis_version", "0"))
+        else:
+            failed.append(result)
+    if failed:
+        for result in failed:
+            print(f"❌ {result.addr} 연결 실패: {result.error}")
+        sys.exit(1)
+    print(f"    - 노드 {len(nodes)}개 연결 확인 완료")
+    return versions
+
+
+def parse_version(version):
+    """
+    "7.2.4" 형태의 버전 문자열을 (7, 2) 튜플로 변환
+    """
+    parts = str(version).split(".")
+    try:
+        return int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
+    except ValueError:
+        return 0, 0
 
 
-def split_and_print_nodes(conns, num_masters):
+def perform_cluster_meet(nodes, password):
     """
-    연결 리스트를 마스터/리플리카로 분리 후 정보 출력
+    나머지 노드들이 첫 번째 노드에 MEET 하도록 명령을 동시에 전송해 클러스터 연결 형성
     """
-    master_nodes = conns[:num_masters]
-    replica_nodes = conns[num_masters:]
+    print("\n[노드 간 MEET 요청]")
+    first_host, first_port = StringUtils.parse_node(nodes[0])
+    for result in RedisUtils.broadcast(nodes[1:], (RedisUtils.CLUSTER_MEET, first_host, first_port), password):
+        if result.ok:
+            print(f"    - {result.addr} MEET 요청 성공")
+        else:
+            print(f"❌ {result.addr} MEET 실패: {result.error}")
+
+
+def split_and_print_nodes(nodes, num_masters):
+    """
+    노드 주소 리스트를 마스터/리플리카로 분리 후 정보 출력
+    """
+    master_nodes = nodes[:num_masters]
+    replica_nodes = nodes[num_masters:]
     print("\n마스터 노드:")
-    PrintUtils.print_nodes_info(master_nodes, "마스터")
+    PrintUtils.print_addrs_info(master_nodes, "마스터")
     print("\n리플리카 노드:")
-    PrintUtils.print_nodes_info(replica_nodes, "리플리카")
+    PrintUtils.print_addrs_info(replica_nodes, "리플리카")
     return master_nodes, replica_nodes
 
 
-def assign_slots_to_masters(master_nodes, total_slots, num_masters):
+def assign_slots_to_masters(master_nodes, total_slots, num_masters, password, versions):
     """
-    슬롯(0~16383)을 마스터 노드에 균등 분배 후 할당
+    슬롯(0~16383)을 마스터 노드에 균등 분배 후 모든 마스터에 동시에 할당
+    - Redis 7.0 이상 노드는 CLUSTER ADDSLOTSRANGE(범위 1개), 그 외 노드는 CLUSTER ADDSLOTS(슬롯 개별 나열)
+    - ADDSLOTSRANGE를 모르는 노드(unknown subcommand)는 ADDSLOTS로 다시 시도
     """
     print("\n[슬롯 할당]")
+    plan = plan_slot_assignment(master_nodes, total_slots, num_masters)
+    use_range = {addr: versions.get(addr, (0, 0)) >= (7, 0) for addr in master_nodes}
+    ranges = {addr: [] for addr in master_nodes}
+    for start, end, owner in plan.ranges():
+        ranges[owner].append((start, end))
+
+    def slot_command(addr):
+        if use_range[addr]:
+            return (RedisUtils.CLUSTER_ADDSLOTSRANGE, *(bound for start_end in ranges[addr] for bound in start_end))
+        return (RedisUtils.CLUSTER_ADDSLOTS, *(slot for start, end in ranges[addr] for slot in range(start, end + 1)))
+
+    results = RedisUtils.broadcast(master_nodes, slot_command, password)
+    retry = [r.addr for r in results if not r.ok and use_range[r.addr] and "unknown" in str(r.error).lower()]
+    if retry:
+        print(f"    - ⚠️ ADDSLOTSRANGE 미지원 노드 {len(retry)}개 → ADDSLOTS로 재시도")
+        for addr in retry:
+            use_range[addr] = False
+        retried = {r.addr: r for r in RedisUtils.broadcast(retry, slot_command, password)}
+        results = [retried.get(r.addr, r) for r in results]
+
+    for result in results:
+        start, end = ranges[result.addr][0]
+        command = "ADDSLOTSRANGE" if use_range[result.addr] else "ADDSLOTS"
+        if result.ok:
+            print(f"    - {result.addr} → 슬롯 {start} ~ {end} 할당 완료 ({command})")
+        elif "already busy" in str(result.error):
+            print(f"    - ⚠️ {result.addr}: 이미 슬롯 할당됨, 건너뜀")
+        else:
+            print(f"❌ {result.addr} 슬롯 할당 실패: {result.error}")
+            sys.exit(1)
+
+
+def plan_slot_assignment(master_nodes, total_slots, num_masters):
+    """
+    마스터 주소를 소유자로 하는 슬롯 맵 계획 생성 (앞쪽 마스터부터 나머지 슬롯을 1개씩 더 배정)
+    """
+    plan = SlotMap()
     slots_per_master = total_slots // num_masters
     remain = total_slots % num_masters
     current_slot = 0
-
     for i, master in enumerate(master_nodes):
         count = slots_per_master + (1 if i < remain else 0)
-        slots = list(range(current_slot, current_slot + count))
-        try:
-            RedisUtils.cluster_add_slots(master, slots)
-            print(f"    - {PrintUtils.node_str(master)} → 슬롯 {slots[0]} ~ {slots[-1]} 할당 완료")
-        except redis.exceptions.ResponseError as e:
-            if "already busy" in str(e):
-                print(f"    - ⚠️ {PrintUtils.node_str(master)}: 이미 슬롯 할당됨, 건너뜀")
-            else:
-                raise e
+        plan.assign(current_slot, current_slot + count - 1, master)
         current_slot += count
+    return plan
 
 
-def get_master_nodes_ids(master_nodes):
+def get_master_nodes_ids(master_nodes, password):
     """
-    마스터 노드들의 클러스터 ID 조회
+    마스터 노드들의 클러스터 ID를 동시에 조회
     """
     master_ids = []
     print("\n[마스터 노드 ID 조회]")
-    for i, master in enumerate(master_nodes):
-        master_id = RedisUtils.cluster_myid(master)
-        master_ids.append(master_id)
-        print(f"    {i+1}. {PrintUtils.node_str(master)} → ID: {master_id}")
+    for i, result in enumerate(RedisUtils.broadcast(master_nodes, (RedisUtils.CLUSTER_MYID,), password)):
+        if not result.ok:
+            print(f"❌ {result.addr} ID 조회 실패: {result.error}")
+            sys.exit(1)
+        master_ids.append(result.value)
+        print(f"    {i+1}. {result.addr} → ID: {result.value}")
     return master_ids
 
 
-def assign_replicas_to_masters(replica_nodes, master_ids, master_nodes):
+def assign_replicas_to_masters(replica_nodes, master_ids, master_nodes, password):
     """
-    각 리플리카 노드를 마스터에 연결해 복제 관계 설정
+    각 리플리카 노드를 마스터에 연결해 복제 관계 설정 (모든 리플리카에 동시에 REPLICATE 전송)
     """
     print("\n[리플리카 복제 설정]")
-    for idx, replica in enumerate(replica_nodes):
-        master_id = master_ids[idx % len(master_ids)]
-        try:
-            RedisUtils.cluster_replica(replica, master_id)
-            print(f"    - {PrintUtils.node_str(replica)} → {PrintUtils.node_str(master_nodes[idx % len(master_nodes)])}에 복제 설정 완료")
-        except redis.exceptions.ResponseError as e:
-            print(f"❌ 복제 설정 실패: {e}")
\ No newline at end of file
+    master_of = {addr: idx % len(master_ids) for idx, addr in enumerate(replica_nodes)}
+    results = RedisUtils.broadcast(replica_nodes, lambda addr: (RedisUtils.CLUSTER_REPLICATE, master_ids[master_of[addr]]), password)
+    for result in results:
+        if result.ok:
+            print(f"    - {result.addr} → {master_nodes[master_of[result.addr]]}에 복제 설정 완료")
+        else:
+            print(f"❌ {result.addr} 복제 설정 실패: {result.error}")
+
+
+def print_timings(timings):
+    """
+    단계별 소요 시간과 비율 출력
+    """
+    total = sum(elapsed for _, elapsed in timings) or 1e-9
+    print("\n[단계별 소요 시간]")
+    for name, elapsed in timings:
+        print(f"    - {name:<18} {elapsed * 1000:>9.1f} ms ({elapsed / total * 100:5.1f}%)")
+    print(f"    - {'합계':<18} {total * 1000:>9.1f} ms")
@@ -1,15 +1,27 @@
+import heapq
 import sys
+import time
 import redis
 from utils.string_utils import StringUtils
 from utils.print_utils import PrintUtils
 from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from command.rebalance import get_masters, run_round
+from command.reshard import print_failures, rate
 
-def del_node(access_node, node_id_to_remove, password):
+# FORGET한 노드는 60초 동안 블랙리스트에 있어 gossip으로 다시 추가되지 않음
+FORGET_BLACKLIST_SECONDS = 60
+
+def del_node(access_node, node_id_to_remove, password, drain=False, pipeline=10, parallel=1, wait_timeout=30.0):
     """
     클러스터에서 특정 노드를 삭제하는 메인 함수
     - access_node: 클러스터에 접속하기 위한 임의 노드 (ip:port)
     - node_id_to_remove: 삭제할 node's ID
     - password: Redis 인증 비밀번호
+    - drain: 삭제 대상 마스터의 슬롯을 나머지 마스터에 분산 이동하고, 리플리카를 다른 마스터로 옮긴 뒤 삭제
+    - pipeline, parallel: drain 시 슬롯 이동 옵션 (reshard와 동일)
+    - wait_timeout: drain 후 FORGET 전에 클러스터 상태 수렴을 기다릴 최대 시간(초)
     """
     host, port = StringUtils.parse_node(access_node)
     PrintUtils.info(f"1. {host}:{port} 노드에 연결 중...\n")
@@ -17,7 +29,11 @@ def del_node(access_node, node_id_to_remove, password):
 
     nodes_dict = get_cluster_nodes(connection)
     validate_node_exists(nodes_dict, node_id_to_remove)
-    forget_node_from_cluster(password, nodes_dict, node_id_to_remove)
+    if drain:
+        with Stats.phase("drain"):
+            nodes_dict = drain_node(connection, access_node, nodes_dict, node_id_to_remove, password, pipeline, parallel, wait_timeout)
+    with Stats.phase("FORGET 및 RESET"):
+        forget_node_from_cluster(password, nodes_dict, node_id_to_remove)
 
     PrintUtils.success("노드 삭제 작업 완료. 클러스터 상태를 확인하세요.\n")
 
@@ -43,6 +59,145 @@ def validate_node_exists(nodes_dict, node_id):
     PrintUtils.success(f"삭제할 노드 ID {node_id}가 클러스터에 존재합니다.\n")
 
 
+def drain_node(connection, access_node, nodes_dict, node_id, password, pipeline=10, parallel=1, wait_timeout=30.0):
+    """
+    삭제 대상 마스터를 비움
+    1. 보유 슬롯을 나머지 마스터에 슬롯 수가 고르게 되도록 나누고, 대상별 이동을 동시에 수행
+    2. 대상 노드의 리플리카를 리플리카가 적은 마스터부터 CLUSTER REPLICATE로 옮김
+    3. 모든 노드가 같은 epoch/슬롯 정보를 가지고, 옮긴 리플리카의 새 마스터가 모든 노드에 반영될 때까지 대기 후 최신 토폴로지 반환
+    """
+    masters = get_masters(nodes_dict)
+    if node_id not in masters:
+        PrintUtils.info("삭제 대상 노드가 마스터가 아니므로 슬롯 이동 없이 진행합니다.\n")
+        return nodes_dict
+    remaining = {n: addr for n, addr in masters.items() if n != node_id}
+    if not remaining:
+        PrintUtils.error("슬롯을 넘겨받을 다른 마스터가 없습니다.\n")
+        sys.exit(1)
+
+    slot_map = SlotMap.from_cluster_nodes(nodes_dict)
+    slots = slot_map.slots_of(node_id)
+    if slots:
+        moves = plan_drain(slots, {n: slot_map.count_of(n) for n in remaining}, node_id)
+        print_drain_plan(moves, masters)
+        started = time.time()
+        total_keys, failures = run_round(moves, masters, pipeline, password, parallel)
+        elapsed = time.time() - started
+        if failures:
+            print_failures(failures)
+            PrintUtils.error("슬롯이 남아있어 노드를 삭제하지 않습니다. 문제를 해결한 뒤 다시 실행하세요.\n")
+            sys.exit(1)
+        PrintUtils.success(f"슬롯 {len(slots)}개, 키 {total_keys:,}개 이동 완료 ({elapsed:.1f}초, 평균 {rate(total_keys, elapsed):,.0f} keys/sec)\n")
+
+    new_master = rehome_replicas(nodes_dict, node_id, remaining, password)
+
+    print("⌛ 슬롯/복제 변경 전파 대기 중...")
+    RedisUtils.wait_for_convergence(RedisUtils.reachable_nodes(nodes_dict), password, expected_nodes=len(nodes_dict),
+                                    require_ok=False, timeout=wait_timeout)
+    if new_master:
+        wait_for_replica_masters(nodes_dict, new_master, password, wait_timeout)
+    print()
+    return RedisUtils.get_cluster_nodes(connection)
+
+
+def plan_drain(slots, counts, node_id):
+    """
+    slots를 슬롯 수가 가장 적은 마스터부터 1개씩 채우는 방식으로 나눈 뒤,
+    마스터별로 연속 구간이 되도록 앞에서부터 잘라 [(node_id, dst_id, [slot, ...])] 반환
+    """
+    heap = [(count, dst) for dst, count in counts.items()]
+    heapq.heapify(heap)
+    share = dict.fromkeys(counts, 0)
+    for _ in slots:
+        count, dst = heapq.heappop(heap)
+        share[dst] += 1
+        heapq.heappush(heap, (count + 1, dst))
+
+    moves = []
+    start = 0
+    for dst in sorted(share, key=lambda d: counts[d]):
+        if share[dst]:
+            moves.append((node_id, dst, slots[start:start + share[dst]]))
+            start += share[dst]
+    return moves
+
+
+def print_drain_plan(moves, masters):
+    """
+    대상 마스터별 슬롯 이동 계획 출력
+    """
+    total = sum(len(m[2]) for m in moves)
+    print(f"📝 drain 계획: 슬롯 {total}개를 마스터 {len(moves)}개로 동시 이동")
+    for src, dst, slots in moves:
+        print(f"    - {masters[src]} -> {masters[dst]}: 슬롯 {len(slots)}개 ({StringUtils.format_slot_ranges(slots)})")
+    print()
+
+
+def rehome_replicas(nodes_dict, node_id, remaining, password):
+    """
+    삭제 대상 마스터의 리플리카를 리플리카 수가 가장 적은 마스터로 CLUSTER REPLICATE (모든 리플리카에 동시에 전송)
+    {리플리카 주소: 새 마스터 ID} 반환
+    """
+    orphans = [addr for addr, info in nodes_dict.items() if info.get("master_id") == node_id]
+    if not orphans:
+        return {}
+    replica_counts = {n: 0 for n in remaining}
+    for info in nodes_dict.values():
+        if info.get("master_id") in replica_counts:
+            replica_counts[info["master_id"]] += 1
+    new_master = {}
+    for addr in orphans:
+        dst = min(replica_counts, key=lambda n: (replica_counts[n], remaining[n]))
+        new_master[addr] = dst
+        replica_counts[dst] += 1
+
+    PrintUtils.transition(f"리플리카 {len(orphans)}개를 다른 마스터로 이동 중...")
+    for result in RedisUtils.broadcast(orphans, lambda addr: (RedisUtils.CLUSTER_REPLICATE, new_master[addr]), password):
+        if result.ok:
+            PrintUtils.success(f"{result.addr} → {remaining[new_master[result.addr]]}의 리플리카로 변경")
+        else:
+            PrintUtils.error(f"{result.addr} 리플리카 이동 실패: {result.error}")
+            sys.exit(1)
+    print()
+    return new_master
+
+
+def wait_for_replica_masters(nodes_dict, new_master, password, timeout=30.0, interval=0.1):
+    """
+    옮긴 리플리카의 새 마스터가 모든 노드의 CLUSTER NODES에 반영될 때까지 대기.
+    epoch/슬롯 수만으로는 복제 관계 변경을 알 수 없고, 반영 전에 FORGET 단계로 넘어가면
+    아직 삭제 대상을 마스터로 보는 노드 때문에 작업이 중단되므로 FORGET 전에 확인.
+    timeout(초) 안에 반영되지 않으면 남은 노드를 출력하고 종료
+    """
+    expected = {nodes_dict[addr]["node_id"]: master_id for addr, master_id in new_master.items()}
+    addrs = RedisUtils.reachable_nodes(nodes_dict)
+    started = time.perf_counter()
+    deadline = started + timeout
+    while True:
+        lagging = []
+        results = RedisUtils.broadcast(addrs, (RedisUtils.CLUSTER_NODES,), password, timeout=min(5.0, timeout), retries=0)
+        for result in results:
+            if not result.ok:
+                lagging.append((result.addr, f"응답 없음 ({result.error})"))
+                continue
+            masters = {info["node_id"]: info.get("master_id") for info in result.value.values()}
+            stale = [replica for replica, master_id in expected.items() if masters.get(replica) != master_id]
+            if stale:
+                lagging.append((result.addr, f"리플리카 {len(stale)}개의 새 마스터 미반영"))
+        if not lagging:
+            print(f"    - 리플리카 {len(expected)}개의 새 마스터 반영 완료 ({time.perf_counter() - started:.2f}초)")
+            return
+        if time.perf_counter() + interval > deadline:
+            break
+        time.sleep(interval)
+
+    PrintUtils.error(f"{timeout}초 안에 리플리카의 새 마스터가 모든 노드에 반영되지 않았습니다 (미반영 노드 {len(lagging)}개)")
+    for addr, reason in lagging[:10]:
+        print(f"    - {addr}: {reason}")
+    print("슬롯 이동은 완료되었으므로 --wait-timeout을 늘려 del-node를 다시 실행하세요.\n")
+    sys.exit(1)
+
+
 def get_remove_target_node_connection(password, nodes_dict, node_id):
     """
     삭제 대상 노드의 Redis 연결과 주소 반환
@@ -60,28 +215,35 @@ def forget_node_from_cluster(password, nodes_dict, node_id_to_remove):
     모든 노드에서 해당 노드를 FORGET 처리하고,
     삭제 대상 노드는 CLUSTER RESET 하여 클러스터에서 완전히 분리
     """
-    # 1. 삭제 대상 노드가 마스터일 경우, 복제본 노드가 있는지 확인
+    # 1. 삭제 대상 노드가 슬롯을 가지고 있거나 복제본 노드가 있는지 확인
+    owned = SlotMap.from_cluster_nodes(nodes_dict).count_of(node_id_to_remove)
+    if owned:
+        PrintUtils.error(
+            f"삭제 대상 노드({node_id_to_remove})가 슬롯 {owned}개를 가지고 있습니다.\n"
+            "--drain 옵션으로 슬롯을 다른 마스터에 옮긴 뒤 삭제하거나, reshard 후 다시 시도하세요.\n"
+        )
+        sys.exit(1)
     dependent_replicas = [addr for addr, info in nodes_dict.items() if info.get("master_id") == node_id_to_remove]
     if dependent_replicas:
         PrintUtils.warn(
             f"⚠️ 삭제 대상 노드({node_id_to_remove})는 다음 노드들의 마스터입니다:\n"
             + "\n".join([f"   - {addr}" for addr in dependent_replicas]) +
-            "\n\n복제본 노드를 먼저 제거하거나 재구성 후 다시 시도하세요.\n"
+            "\n\n복제본 노드를 먼저 제거하거나 재구성(--drain) 후 다시 시도하세요.\n"
         )
         sys.exit(1)
 
-    # 2. 클러스터 내 모든 노드에 FORGET 명령 전파
+    # 2. 클러스터 내 모든 노드에 FORGET 명령 동시 전파 (삭제 대상 노드는 나중에 처리)
+    #    FORGET 후 60초가 지나면 아직 FORGET하지 않은 노드의 gossip으로 다시 추가되므로 한 번에 전송
     PrintUtils.step("클러스터 모든 노드에 FORGET 명령 전달 중...\n")
-    for addr, info in nodes_dict.items():
-        if info['node_id'] == node_id_to_remove:
-            continue  # 삭제 대상 노드는 나중에 처리
-        host, port = StringUtils.parse_node(addr)
-        node_conn = RedisUtils.connect_node(host, port, password)
-        try:
-            RedisUtils.cluster_forget(node_conn, node_id_to_remove)
-            PrintUtils.success(f"{addr} 에서 {node_id_to_remove} FORGET 성공")
-        except redis.exceptions.RedisError as e:
-            PrintUtils.warn(f"{addr} 에서 {node_id_to_remove} FORGET 실패: {e}")
+    others = [addr for addr, info in nodes_dict.items() if info['node_id'] != node_id_to_remove]
+    started = time.time()
+    for result in RedisUtils.broadcast(others, (RedisUtils.CLUSTER_FORGET, node_id_to_remove), password):
+        if result.ok:
+            PrintUtils.success(f"{result.addr} 에서 {node_id_to_remove} FORGET 성공")
+        else:
+            PrintUtils.warn(f"{result.addr} 에서 {node_id_to_remove} FORGET 실패: {result.error}")
+    if time.time() - started > FORGET_BLACKLIST_SECONDS:
+        PrintUtils.warn(f"FORGET 전파에 {FORGET_BLACKLIST_SECONDS}초 이상 걸려 일부 노드에서 다시 추가되었을 수 있습니다. check로 확인하세요.")
 
     # 3. 삭제 대상 노드는 RESET 하여 클러스터에서 완전 분리
     print()
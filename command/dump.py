@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from utils.dump_utils import DumpWriter
+from command.reshard import format_bytes, rate
+
+CHUNK_BYTES = 1 << 20  # 청크 하나의 최대 원본 크기 (이보다 커지면 같은 슬롯이라도 새 청크로 기록)
+
+
+def dump(access_node, password, output, slots=None, batch=100, compress_level=6):
+    """
+    클러스터 데이터를 슬롯 인덱스가 있는 dump 파일로 저장하는 메인 함수.
+    - 슬롯을 보유한 모든 마스터를 동시에 읽고, 슬롯마다 GETKEYSINSLOT → DUMP / PTTL 파이프라인으로 수집
+    - 레코드는 슬롯별 청크로 묶어 (선택적으로 zlib 압축) 기록하고, 파일 끝에 슬롯 → 청크 위치 인덱스를 씀
+    - 마스터마다 독립적으로 읽으므로 특정 시점의 스냅샷은 아님 (dump 도중 변경된 키는 포함 여부가 보장되지 않음)
+
+    (인자)
+    - output (str): 저장할 dump 파일 경로
+    - slots (str, optional): 저장할 슬롯 범위 ("0-100,200", 기본: 전체)
+    - batch (int): DUMP / PTTL 파이프라인 한 번에 보낼 키 수
+    - compress_level (int): zlib 압축 수준 (0이면 압축하지 않음)
+    """
+    if batch < 1:
+        PrintUtils.error("--batch 값은 1 이상이어야 합니다.")
+        sys.exit(1)
+    if not 0 <= compress_level <= 9:
+        PrintUtils.error("--compress-level 값은 0~9 사이여야 합니다.")
+        sys.exit(1)
+
+    host, port = StringUtils.parse_node(access_node)
+    PrintUtils.info(f"{access_node}를 통해 클러스터 토폴로지 조회 중...")
+    with Stats.phase("토폴로지 조회"):
+        r = RedisUtils.connect_node(host, port, password)
+        slot_map = SlotMap.from_cluster_nodes(RedisUtils.get_cluster_nodes(r))
+
+    selected = set(StringUtils.parse_slot_ranges(slots)) if slots else set(range(RedisUtils.TOTAL_SLOTS))
+    plan = {}
+    for slot in sorted(selected):
+        addr = slot_map.owner_addr(slot)
+        if addr:
+            plan.setdefault(addr, []).append(slot)
+    unowned = [slot for slot in selected if not slot_map.owner_addr(slot)]
+    if unowned:
+        PrintUtils.warn(f"소유 노드가 없어 건너뛰는 슬롯: {StringUtils.format_slot_ranges(unowned)}")
+    if not plan:
+        PrintUtils.error("저장할 슬롯을 보유한 마스터 노드가 없습니다.")
+        sys.exit(1)
+
+    print(f"💾 마스터 {len(plan)}개에서 슬롯 {sum(map(len, plan.values()))}개 동시 dump 시작 "
+          f"(배치 {batch}, 압축 수준 {compress_level}) → {output}")
+    writer = DumpWriter(output, compress_level)
+    started = time.time()
+    try:
+        with Stats.phase("DUMP 수집"), ThreadPoolExecutor(max_workers=len(plan)) as executor:
+            futures = {
+                executor.submit(dump_master, writer, addr, master_slots, password, batch, pos): addr
+                for pos, (addr, master_slots) in enumerate(sorted(plan.items()))
+            }
+            for future in as_completed(futures):
+                future.result()
+        with Stats.phase("인덱스 기록"):
+            writer.close({"source": access_node, "masters": sorted(plan), "requested_slots": slots or "0-16383"})
+    except (Exception, KeyboardInterrupt) as e:
+        writer.abort()
+        PrintUtils.error(f"dump 실패: {e} (미완성 파일: {output}.part)")
+        sys.exit(1)
+    elapsed = time.time() - started
+
+    ratio = writer.stored_bytes / writer.raw_bytes * 100 if writer.raw_bytes else 100.0
+    print(f"\n✅ dump 완료: 키 {writer.keys:,}개, 슬롯 {len(writer.slots)}개, {elapsed:.1f}초 "
+          f"({rate(writer.keys, elapsed):,.0f} keys/s)")
+    print(f"    - 파일: {output} ({format_bytes(os.path.getsize(output))}, "
+          f"원본 {format_bytes(writer.raw_bytes)} 대비 {ratio:.1f}%)")
+
+
+def dump_master(writer, addr, slots, password, batch, position):
+    """
+    마스터 하나가 보유한 슬롯을 차례로 읽어 writer에 청크로 기록.
+    - 바이너리 키/DUMP 페이로드를 그대로 다루기 위해 응답을 디코딩하지 않는 클라이언트 사용
+    - 슬롯 키는 COUNTKEYSINSLOT 만큼 GETKEYSINSLOT 으로 한 번에 받고, batch개씩 DUMP / PTTL 파이프라인
+    """
+    conn = RedisUtils.connect_node(*StringUtils.parse_node(addr), password, decode_responses=False)
+    counts = RedisUtils.count_keys_in_slots(conn, slots)
+    with tqdm(total=sum(counts.values()), desc=f"    - {addr}", unit="key", position=position) as bar:
+        for slot in slots:
+            if not counts[slot]:
+                continue
+            keys = RedisUtils.get_raw_keys_in_slot(conn, slot, counts[slot])
+            records, size = [], 0
+            for i in range(0, len(keys), batch):
+                for record in RedisUtils.dump_keys(conn, keys[i:i + batch]):
+                    records.append(record)
+                    size += len(record[0]) + len(record[2])
+                if size >= CHUNK_BYTES:
+                    writer.add_chunk(slot, records)
+                    records, size = [], 0
+                bar.update(min(batch, len(keys) - i))
+            writer.add_chunk(slot, records)
@@ -0,0 +1,329 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import redis
+import redis.asyncio as aioredis
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+
+
+def monitor(access_node, password, interval=1.0, count=None, output_format="ndjson", listen="127.0.0.1:9121",
+            nodes_every=10, output=None, timeout=None):
+    """
+    클러스터 상태를 주기적으로 수집해 NDJSON 스트림 또는 Prometheus 텍스트 엔드포인트로 내보내는 메인 함수.
+    - 모든 노드에 노드별 연결을 하나씩 유지하고, interval초마다 CLUSTER INFO + INFO stats/memory/replication을
+      파이프라인 한 번(노드당 왕복 1회)으로 동시에 조회
+    - CLUSTER NODES(슬롯 소유/이동 중 슬롯)는 nodes_every 회마다 한 번만 조회
+    - 이전 수집값과의 차이로 ops/sec, 네트워크 처리량, 메모리 증가율, 복제 지연(bytes)을 계산
+
+    (인자)
+    - count (int, optional): 수집 횟수 (없으면 Ctrl+C까지 계속)
+    - output_format (str): ndjson(수집마다 JSON 한 줄) 또는 prometheus(listen 주소의 /metrics로 최신값 제공)
+    - output (str, optional): NDJSON을 기록할 파일 (없으면 표준 출력)
+    - timeout (float, optional): 노드별 응답 제한 시간(초) (기본: interval)
+    """
+    validate_monitor_options(interval, count, output_format, nodes_every)
+    host, port = StringUtils.parse_node(access_node)
+    r = RedisUtils.connect_node(host, port, password)
+    nodes_dict = RedisUtils.get_cluster_nodes(r)
+    addrs = sorted(addr for addr, info in nodes_dict.items() if "noaddr" not in info["flags"])
+    PrintUtils.info(f"노드 {len(addrs)}개를 {interval}초 간격으로 모니터링합니다. (형식: {output_format}, 종료: Ctrl+C)")
+
+    if output_format == "prometheus":
+        exporter = PrometheusExporter(*StringUtils.parse_node(listen))
+        sink = exporter.update
+        PrintUtils.info(f"Prometheus 엔드포인트: http://{listen}/metrics")
+    else:
+        exporter = None
+        stream = open(output, "a") if output else sys.stdout
+        sink = lambda snapshot: write_ndjson(stream, snapshot)
+
+    try:
+        asyncio.run(run_monitor(addrs, password, interval, count, nodes_every, timeout or interval, sink))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if exporter:
+            exporter.shutdown()
+        elif output:
+            stream.close()
+
+
+def validate_monitor_options(interval, count, output_format, nodes_every):
+    errors = []
+    if interval <= 0:
+        errors.append("--interval 값은 0보다 커야 합니다.")
+    if count is not None and count < 1:
+        errors.append("--count 값은 1 이상이어야 합니다.")
+    if output_format not in ("ndjson", "prometheus"):
+        errors.append(f"알 수 없는 --format: {output_format} (ndjson, prometheus)")
+    if nodes_every < 1:
+        errors.append("--nodes-every 값은 1 이상이어야 합니다.")
+    if errors:
+        PrintUtils.error("유효성 검사 실패:")
+        for err in errors:
+            print(f" - {err}")
+        sys.exit(1)
+
+
+async def run_monitor(addrs, password, interval, count, nodes_every, timeout, sink):
+    """
+    interval초마다 모든 노드를 동시에 수집해 sink(snapshot)로 전달 (수집 시간과 관계없이 고정 주기)
+    """
+    clients = {addr: open_client(addr, password, timeout) for addr in addrs}
+    previous = {}
+    open_slots = {}  # addr → 마지막 CLUSTER NODES 수집 때의 (MIGRATING 슬롯 수, IMPORTING 슬롯 수)
+    tick = 0
+    next_at = time.monotonic()
+    try:
+        while count is None or tick < count:
+            with_nodes = tick % nodes_every == 0
+            polled_at = time.time()
+            raw = await asyncio.gather(*(poll_node(clients[addr], with_nodes, timeout) for addr in addrs))
+            samples = dict(zip(addrs, raw))
+            snapshot = build_snapshot(polled_at, samples, previous, open_slots)
+            previous = {addr: sample for addr, sample in samples.items() if "error" not in sample}
+            sink(snapshot)
+            tick += 1
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+    finally:
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+
+def open_client(addr, password, timeout):
+    """
+    노드별로 계속 재사용할 비동기 단일 연결 클라이언트 (재시도 없이 실패를 바로 보고)
+    """
+    host, port = StringUtils.parse_node(addr)
+    return aioredis.Redis(
+        host=host,
+        port=port,
+        password=password,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+        retry=Retry(NoBackoff(), 0),
+        single_connection_client=True,
+        decode_responses=True,
+    )
+
+
+async def poll_node(client, with_nodes, timeout):
+    """
+    노드 하나의 CLUSTER INFO, INFO stats/memory/replication(, CLUSTER NODES)을 파이프라인 한 번으로 조회
+    """
+    started = time.perf_counter()
+    pipe = client.pipeline(transaction=False)
+    pipe.execute_command(RedisUtils.CLUSTER_INFO)
+    pipe.info("stats")
+    pipe.info("memory")
+    pipe.info("replication")
+    if with_nodes:
+        pipe.execute_command(RedisUtils.CLUSTER_NODES)
+    try:
+        results = await asyncio.wait_for(pipe.execute(), timeout)
+    except (redis.exceptions.RedisError, asyncio.TimeoutError, OSError) as e:
+        return {"error": str(e) or "timeout"}
+    sample = {
+        "mono": time.monotonic(),
+        "latency_ms": (time.perf_counter() - started) * 1000,
+        "cluster": results[0],
+        "info": {**results[1], **results[2], **results[3]},
+    }
+    if with_nodes:
+        sample["nodes"] = results[4]
+    return sample
+
+
+def build_snapshot(polled_at, samples, previous, open_slots):
+    """
+    노드별 수집값과 직전 수집값으로 한 시점의 스냅샷(dict) 생성
+    - open_slots: addr → (MIGRATING, IMPORTING 슬롯 수). 이번에 CLUSTER NODES를 수집한 노드는 갱신하고,
+      수집하지 않은 틱에는 마지막 값을 그대로 사용 (--nodes-every 사이에도 지표가 사라지지 않도록)
+    """
+    offsets = {}
+    for addr, sample in samples.items():
+        if "error" not in sample and sample["info"].get("role") == "master":
+            offsets[addr] = int(sample["info"].get("master_repl_offset", 0))
+
+    nodes = []
+    migrating = 0
+    for addr, sample in samples.items():
+        if "error" in sample:
+            nodes.append({"addr": addr, "up": 0, "error": sample["error"]})
+            continue
+        node = node_metrics(addr, sample, previous.get(addr), offsets)
+        if "nodes" in sample:
+            open_slots[addr] = open_slot_counts(sample["nodes"])
+        if addr in open_slots:
+            node["migrating_slots"], node["importing_slots"] = open_slots[addr]
+            migrating += node["migrating_slots"]
+        nodes.append(node)
+
+    up = [n for n in nodes if n["up"]]
+    cluster = {
+        "nodes": len(nodes),
+        "nodes_up": len(up),
+        "state_ok": sum(1 for n in up if n["cluster_state"] == "ok"),
+        "epochs": len({n["current_epoch"] for n in up}),
+        "ops_per_sec": round(sum(n.get("ops_per_sec", 0) for n in up), 1),
+        "used_memory": sum(n["used_memory"] for n in up),
+        "max_repl_lag_bytes": max((n.get("repl_lag_bytes", 0) for n in up), default=0),
+    }
+    if open_slots:
+        cluster["migrating_slots"] = migrating
+    return {"ts": round(polled_at, 3), "cluster": cluster, "nodes": nodes}
+
+
+def node_metrics(addr, sample, prev, offsets):
+    """
+    노드 하나의 지표. prev가 있으면 초당 변화량(ops/sec, 네트워크, 메모리 증가율)도 포함
+    - 리플리카의 복제 지연(bytes): 같은 시점 마스터의 master_repl_offset - 리플리카의 slave_repl_offset
+    """
+    info = sample["info"]
+    cluster = sample["cluster"]
+    node = {
+        "addr": addr,
+        "up": 1,
+        "role": info.get("role"),
+        "poll_ms": round(sample["latency_ms"], 2),
+        "cluster_state": cluster.get("cluster_state"),
+        "current_epoch": int(cluster.get("cluster_current_epoch", 0)),
+        "known_nodes": int(cluster.get("cluster_known_nodes", 0)),
+        "used_memory": int(info.get("used_memory", 0)),
+        "total_commands": int(info.get("total_commands_processed", 0)),
+    }
+    if info.get("role") == "slave":
+        master = f"{info.get('master_host')}:{info.get('master_port')}"
+        node["master"] = master
+        node["master_link_up"] = int(info.get("master_link_status") == "up")
+        if master in offsets:
+            node["repl_lag_bytes"] = max(0, offsets[master] - int(info.get("slave_repl_offset", 0)))
+
+    if prev:
+        elapsed = max(sample["mono"] - prev["mono"], 1e-9)
+        old = prev["info"]
+        node["ops_per_sec"] = round(rate(info, old, "total_commands_processed", elapsed), 1)
+        node["net_in_bytes_per_sec"] = round(rate(info, old, "total_net_input_bytes", elapsed), 1)
+        node["net_out_bytes_per_sec"] = round(rate(info, old, "total_net_output_bytes", elapsed), 1)
+        node["memory_growth_bytes_per_sec"] = round(rate(info, old, "used_memory", elapsed), 1)
+        node["evicted_per_sec"] = round(rate(info, old, "evicted_keys", elapsed), 1)
+    return node
+
+
+def rate(info, old, field, elapsed):
+    """
+    INFO 필드의 초당 변화량 (재시작으로 카운터가 줄어들면 0)
+    """
+    delta = int(info.get(field, 0)) - int(old.get(field, 0))
+    if field != "used_memory" and delta < 0:
+        return 0.0
+    return delta / elapsed
+
+
+def open_slot_counts(nodes_dict):
+    """
+    노드 자신의 CLUSTER NODES 줄(myself)에 있는 (MIGRATING 슬롯 수, IMPORTING 슬롯 수)
+    """
+    for info in nodes_dict.values():
+        if "myself" in info["flags"]:
+            states = [m.get("state") for m in info.get("migrations", [])]
+            return states.count("migrating"), states.count("importing")
+    return 0, 0
+
+
+def write_ndjson(stream, snapshot):
+    stream.write(json.dumps(snapshot, ensure_ascii=False) + "\n")
+    stream.flush()
+
+
+class PrometheusExporter:
+    """
+    최신 스냅샷을 Prometheus 텍스트 형식으로 제공하는 로컬 HTTP 서버 (GET /metrics)
+    """
+
+    GAUGES = (
+        ("up", "노드 응답 여부"),
+        ("poll_ms", "수집 파이프라인 왕복 시간(ms)"),
+        ("current_epoch", "cluster_current_epoch"),
+        ("known_nodes", "cluster_known_nodes"),
+        ("used_memory", "used_memory(bytes)"),
+        ("ops_per_sec", "초당 처리 명령 수"),
+        ("net_in_bytes_per_sec", "초당 수신 바이트"),
+        ("net_out_bytes_per_sec", "초당 송신 바이트"),
+        ("memory_growth_bytes_per_sec", "초당 메모리 증가량"),
+        ("evicted_per_sec", "초당 eviction 키 수"),
+        ("repl_lag_bytes", "리플리카 복제 지연(bytes)"),
+        ("master_link_up", "리플리카의 마스터 링크 상태"),
+        ("migrating_slots", "MIGRATING 상태 슬롯 수"),
+        ("importing_slots", "IMPORTING 상태 슬롯 수"),
+    )
+    CLUSTER_GAUGES = {
+        "nodes": "수집 대상 노드 수",
+        "nodes_up": "응답한 노드 수",
+        "state_ok": "cluster_state가 ok인 노드 수",
+        "epochs": "노드들이 보고한 서로 다른 cluster_current_epoch 수",
+        "ops_per_sec": "전체 노드의 초당 처리 명령 수 합계",
+        "used_memory": "전체 노드의 used_memory(bytes) 합계",
+        "max_repl_lag_bytes": "리플리카 복제 지연(bytes) 최댓값",
+        "migrating_slots": "전체 노드의 MIGRATING 상태 슬롯 수 합계",
+    }
+
+    def __init__(self, host, port):
+        self._body = b""
+        self._lock = threading.Lock()
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                with exporter._lock:
+                    body = exporter._body
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def update(self, snapshot):
+        body = PrometheusExporter.render(snapshot).encode()
+        with self._lock:
+            self._body = body
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def render(snapshot):
+        """
+        스냅샷을 Prometheus 텍스트 노출 형식으로 변환
+        """
+        lines = []
+        for name, help_text in PrometheusExporter.GAUGES:
+            rows = [n for n in snapshot["nodes"] if name in n]
+            if not rows:
+                continue
+            lines.append(f"# HELP rcctl_node_{name} {help_text}")
+            lines.append(f"# TYPE rcctl_node_{name} gauge")
+            for n in rows:
+                lines.append(f'rcctl_node_{name}{{node="{n["addr"]}",role="{n.get("role", "")}"}} {n[name]}')
+        for name, value in snapshot["cluster"].items():
+            lines.append(f"# HELP rcctl_cluster_{name} {PrometheusExporter.CLUSTER_GAUGES.get(name, name)}")
+            lines.append(f"# TYPE rcctl_cluster_{name} gauge")
+            lines.append(f"rcctl_cluster_{name} {value}")
+        return "\n".join(lines) + "\n"
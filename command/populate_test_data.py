@@ -1,17 +1,39 @@
 import sys
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+from redis.crc import key_slot
 from tqdm import tqdm
 from utils.string_utils import StringUtils
 from utils.print_utils import PrintUtils
 from utils.redis_utils import RedisUtils
+from utils.workload_utils import WorkloadGenerator
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
 
 
-def populate_test_data(node_addr, password, num_keys=1000):
+def populate_test_data(node_addr, password, num_keys=1000, batch_size=1000, workers=1, workload=None):
+    """
+    테스트 데이터 생성 메인 함수
+    - workload: WorkloadGenerator (없으면 기존 key:NNNNNNNNNN → val:NNNNNNNNNN 문자열)
+    """
     # 요구사항 따라 생성할 키 수 검증
     validate_key_count(num_keys)
-    # 레디스 클러스터에 접속
-    r = connect_to_cluster(node_addr, password)
-    # 더미 데이터 생성
-    generate_dummy_data_no_batch(r, num_keys)
+    validate_batch_options(batch_size, workers)
+    workload = workload or WorkloadGenerator(num_keys)
+
+    if batch_size == 1 and workers == 1 and workload.is_legacy():
+        # 레디스 클러스터에 접속
+        r = connect_to_cluster(node_addr, password)
+        # 더미 데이터 생성
+        generate_dummy_data_no_batch(r, num_keys)
+        return
+
+    # 슬롯별 소유 마스터 조회 후 마스터마다 파이프라인으로 일괄 저장
+    with Stats.phase("슬롯 소유 정보 조회"):
+        slot_owners = load_slot_owners(node_addr, password)
+    with Stats.phase("데이터 저장"):
+        generate_dummy_data_batch(slot_owners, password, num_keys, batch_size, workers, workload)
 
 
 
@@ -25,6 +47,15 @@ def validate_key_count(num_keys):
         sys.exit(1)
 
 
+def validate_batch_options(batch_size, workers):
+    """
+    --batch-size, --workers 값이 1 이상인지 검증.
+    """
+    if batch_size < 1 or workers < 1:
+        print("❌ --batch-size, --workers 값은 1 이상이어야 합니다.")
+        sys.exit(1)
+
+
 def connect_to_cluster(node_addr, password):
     """
     지정된 노드 주소로 Redis Cluster에 연결 시도.
@@ -42,6 +73,23 @@ def connect_to_cluster(node_addr, password):
         sys.exit(1)
 
 
+def load_slot_owners(node_addr, password):
+    """
+    CLUSTER NODES로 슬롯(0~16383)마다 소유 마스터 주소를 담은 리스트 생성.
+    할당되지 않은 슬롯은 None.
+    """
+    host, port = StringUtils.parse_node(node_addr)
+    print(f"🔍 {node_addr}를 통해 슬롯 소유 정보 조회 중...")
+    r = RedisUtils.connect_node(host, port, password)
+    nodes_dict = RedisUtils.get_cluster_nodes(r)
+
+    slot_owners = SlotMap.from_cluster_nodes(nodes_dict).owner_addrs()
+
+    if None in slot_owners:
+        PrintUtils.warn(f"할당되지 않은 슬롯이 {slot_owners.count(None)}개 있습니다. 해당 슬롯의 키는 저장되지 않습니다.")
+    return slot_owners
+
+
 def generate_dummy_data_no_batch(r, num_keys):
     print(f"⏳ 총 {num_keys:,} 개의 더미 데이터(string 키-값)을 생성합니다...")
 
@@ -54,3 +102,142 @@ def generate_dummy_data_no_batch(r, num_keys):
             print(f"\n⚠️ 에러 발생 (key: {key}): {e}")
 
     print(f"\n🎉 더미 데이터 생성 완료! 총 {num_keys}개 키가 저장되었습니다.")
+
+
+def generate_dummy_data_batch(slot_owners, password, num_keys, batch_size, workers, workload):
+    """
+    쓰기 범위를 batch_size 단위로 나눠 저장.
+    - 배치 안의 TTL 없는 string 키는 해시 슬롯별로 묶어 슬롯마다 MSET 한 번,
+      그 외 타입은 키마다 명령을 쌓아 소유 마스터마다 파이프라인 한 번(왕복 1회)으로 전송
+    - workers > 1 이면 배치를 프로세스 풀에 나눠 동시에 처리 (프로세스마다 마스터 연결을 따로 생성)
+    """
+    print(f"⏳ 총 {num_keys:,} 개의 더미 데이터를 생성합니다... (batch-size: {batch_size}, workers: {workers})")
+    print(f"    - 워크로드: {workload.describe()}")
+    tasks = [(start, min(start + batch_size, num_keys + 1)) for start in range(1, num_keys + 1, batch_size)]
+
+    written = 0
+    failed = 0
+    started = time.time()
+    with tqdm(total=num_keys, desc="📦 Redis에 저장 중", unit="key") as bar:
+        if workers == 1:
+            init_batch_worker(slot_owners, password, workload)
+            results = map(write_batch, tasks)
+            pool = None
+        else:
+            pool = Pool(workers, initializer=init_batch_worker, initargs=(slot_owners, password, workload, Stats.enabled))
+            results = pool.imap_unordered(write_batch, tasks)
+        try:
+            for ok, errors, stats in results:
+                Stats.merge(stats)
+                written += ok
+                failed += len(errors)
+                for key, err in errors[:3]:
+                    tqdm.write(f"⚠️ 에러 발생 (key: {key}): {err}")
+                bar.update(ok + len(errors))
+                bar.set_postfix(keys_per_sec=f"{written / max(time.time() - started, 1e-9):,.0f}")
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+    elapsed = time.time() - started
+    print(f"\n🎉 더미 데이터 생성 완료! 총 {written:,}회 쓰기가 저장되었습니다. "
+          f"({elapsed:.1f}초, {written / max(elapsed, 1e-9):,.0f} keys/sec)")
+    if failed:
+        PrintUtils.warn(f"저장에 실패한 쓰기: {failed:,}회")
+
+
+# 배치 워커(프로세스)별 상태: 슬롯 소유 정보, 비밀번호, 워크로드
+_worker_state = {}
+
+
+def init_batch_worker(slot_owners, password, workload, collect_stats=False):
+    """
+    배치 워커 초기화 (프로세스 풀의 initializer)
+    - collect_stats: 워커 프로세스에서 실행 통계를 모아 배치 결과와 함께 부모 프로세스로 전달
+    """
+    _worker_state["slot_owners"] = slot_owners
+    _worker_state["password"] = password
+    _worker_state["workload"] = workload
+    _worker_state["collect_stats"] = collect_stats
+    if collect_stats:
+        Stats.enabled = True
+        Stats.drain()  # fork로 물려받은 부모 프로세스의 기록은 버림
+
+
+def get_worker_conn(addr):
+    """
+    워커에서 사용할 마스터 연결 (연결 레지스트리를 통해 프로세스마다 한 번만 생성)
+    """
+    return RedisUtils.connect_node(*StringUtils.parse_node(addr), _worker_state["password"])
+
+
+def write_batch(task):
+    """
+    [start, end) 범위의 쓰기를 생성해 소유 마스터별 파이프라인으로 저장.
+    (저장된 쓰기 수, [(key, 오류)], 워커 프로세스의 실행 통계 또는 None) 반환
+    """
+    start, end = task
+    slot_owners = _worker_state["slot_owners"]
+
+    # 마스터별로 {슬롯: MSET 매핑}과 개별 명령 목록을 모음
+    # uniform/zipf 분포에서 같은 키가 배치 안에 다시 나오면 MSET 매핑에 합쳐지지 않도록
+    # 이후 쓰기는 개별 명령으로 보냄 (쓰기 수가 유지되고, MSET 다음에 실행되므로 마지막 값이 남음)
+    msets = defaultdict(lambda: defaultdict(dict))
+    commands = defaultdict(list)
+    individual = set()
+    errors = []
+    for key, data_type, elements, ttl in _worker_state["workload"].batch(start, end):
+        slot = key_slot(key.encode())
+        owner = slot_owners[slot]
+        if owner is None:
+            errors.append((key, "할당되지 않은 슬롯"))
+        elif data_type == "string" and ttl is None and key not in individual and key not in msets[owner][slot]:
+            msets[owner][slot][key] = elements[0]
+        else:
+            individual.add(key)
+            commands[owner].append((key, build_commands(key, data_type, elements, ttl)))
+
+    written = 0
+    for addr in set(msets) | set(commands):
+        pipe = get_worker_conn(addr).pipeline(transaction=False)
+        by_slot = msets.get(addr, {})
+        for mapping in by_slot.values():
+            pipe.mset(mapping)
+        for _, cmds in commands.get(addr, []):
+            for cmd in cmds:
+                pipe.execute_command(*cmd)
+        results = iter(pipe.execute(raise_on_error=False))
+
+        for mapping in by_slot.values():
+            result = next(results)
+            if isinstance(result, Exception):
+                errors += [(key, result) for key in mapping]
+            else:
+                written += len(mapping)
+        for key, cmds in commands.get(addr, []):
+            failed = [r for r in (next(results) for _ in cmds) if isinstance(r, Exception)]
+            if failed:
+                errors.append((key, failed[0]))
+            else:
+                written += 1
+    return written, errors, Stats.drain() if _worker_state["collect_stats"] else None
+
+
+def build_commands(key, data_type, elements, ttl):
+    """
+    워크로드 레코드 하나를 저장할 Redis 명령 목록으로 변환
+    """
+    if data_type == "string":
+        return [("SET", key, elements[0]) + (("PX", ttl) if ttl is not None else ())]
+    if data_type == "hash":
+        cmds = [("HSET", key, *[part for pair in elements for part in pair])]
+    elif data_type == "list":
+        cmds = [("RPUSH", key, *elements)]
+    elif data_type == "zset":
+        cmds = [("ZADD", key, *[part for member, score in elements for part in (score, member)])]
+    else:
+        cmds = [("XADD", key, "*", "v", value) for value in elements]
+    if ttl is not None:
+        cmds.append(("PEXPIRE", key, ttl))
+    return cmds
@@ -0,0 +1,229 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from command.reshard import migrate_slots, print_failures, rate
+
+
+def rebalance(access_node, password, weights=None, pipeline=10, parallel=1, threshold=2.0, dry_run=False):
+    """
+    모든 마스터의 슬롯 수를 균등(또는 가중치 비율)하게 맞추는 메인 함수.
+    - 토폴로지는 한 번만 조회하고, 최소 이동량의 슬롯 이동 계획을 계산
+    - 서로 겹치지 않는 소스/대상 쌍의 이동은 같은 라운드에서 동시에 수행
+    - 각 슬롯은 reshard와 동일한 migrate_slot 절차(IMPORTING → MIGRATING → NODE)로 이동
+
+    (인자)
+    - weights (list, optional): "node_id=가중치" 문자열 목록, 지정하지 않은 마스터는 1
+    - parallel (int): 한 이동 안에서 동시에 이동할 슬롯 수
+    - threshold (float): 목표 대비 편차가 이 비율(%) 이하이면 리밸런스 생략
+    - dry_run (bool): 계획만 출력하고 종료
+    """
+    host, port = StringUtils.parse_node(access_node)
+    PrintUtils.info(f"{access_node}를 통해 클러스터에 연결 중...")
+    with Stats.phase("토폴로지 조회"):
+        r = RedisUtils.connect_node(host, port, password)
+        nodes_dict = RedisUtils.cluster_nodes(r)
+
+    masters = get_masters(nodes_dict)
+    weights = validate_weights(parse_weights(weights or []), masters)
+    slot_map = SlotMap.from_cluster_nodes(nodes_dict)
+    slots_of = {node_id: slot_map.slots_of(node_id) for node_id in masters}
+    targets = compute_targets(slots_of, weights)
+
+    print_balance(masters, slots_of, targets, weights)
+    if max_deviation(slots_of, targets) <= threshold:
+        PrintUtils.success(f"모든 마스터의 슬롯 편차가 {threshold}% 이하입니다. 리밸런스가 필요하지 않습니다.")
+        return
+
+    moves = plan_moves(slots_of, targets)
+    rounds = schedule_rounds(moves)
+    print_plan(rounds, masters)
+
+    if dry_run:
+        PrintUtils.info("--dry-run 지정으로 계획만 출력하고 종료합니다.")
+        return
+
+    started = time.time()
+    total_keys = 0
+    failures = []
+    for idx, moves_in_round in enumerate(rounds, start=1):
+        print(f"\n🔀 라운드 {idx}/{len(rounds)}: 이동 {len(moves_in_round)}건 동시 수행")
+        with Stats.phase(f"라운드 {idx}"):
+            keys, round_failures = run_round(moves_in_round, masters, pipeline, password, parallel)
+        total_keys += keys
+        failures += round_failures
+
+    elapsed = time.time() - started
+    if failures:
+        print_failures(failures)
+        sys.exit(1)
+    print(f"\n✅ 리밸런스 완료! 총 {total_keys:,}개 키 이동 ({elapsed:.1f}초, 평균 {rate(total_keys, elapsed):,.0f} keys/sec)")
+
+
+def get_masters(nodes_dict):
+    """
+    정상 상태의 마스터 노드 {node_id: addr} 반환 (슬롯이 없는 빈 마스터 포함)
+    """
+    masters = {}
+    for addr, info in nodes_dict.items():
+        flags = info["flags"]
+        if "master" in flags and "fail" not in flags and "noaddr" not in flags:
+            masters[info["node_id"]] = addr
+    if not masters:
+        PrintUtils.error("클러스터에서 마스터 노드를 찾을 수 없습니다.")
+        sys.exit(1)
+    return masters
+
+
+def parse_weights(weight_args):
+    """
+    "node_id=가중치" 형식 문자열 목록을 {node_id: 가중치}로 변환
+    """
+    weights = {}
+    for arg in weight_args:
+        try:
+            node_id, weight = arg.split("=")
+            weights[node_id] = float(weight)
+        except ValueError:
+            PrintUtils.error(f"잘못된 가중치 형식입니다: {arg} (형식: node_id=weight)")
+            sys.exit(1)
+    return weights
+
+
+def validate_weights(weights, masters):
+    """
+    가중치 대상 노드가 마스터인지, 값이 0 이상인지 검증 후 모든 마스터의 가중치 반환
+    """
+    errors = []
+    for node_id, weight in weights.items():
+        if node_id not in masters:
+            errors.append(f"가중치를 지정한 노드 {node_id}는 클러스터의 마스터가 아닙니다.")
+        elif weight < 0:
+            errors.append(f"노드 {node_id}의 가중치({weight})는 0 이상이어야 합니다.")
+    result = {node_id: weights.get(node_id, 1.0) for node_id in masters}
+    if not errors and sum(result.values()) <= 0:
+        errors.append("가중치 합계가 0보다 커야 합니다.")
+    if errors:
+        PrintUtils.error("유효성 검사 실패:")
+        for err in errors:
+            print(f" - {err}")
+        sys.exit(1)
+    return result
+
+
+def compute_targets(slots_of, weights):
+    """
+    현재 할당된 전체 슬롯을 가중치 비율로 나눈 마스터별 목표 슬롯 수.
+    나머지는 소수점 이하가 큰 노드부터 1개씩 배분 (최대 잉여 방식)
+    """
+    total = sum(len(slots) for slots in slots_of.values())
+    weight_sum = sum(weights.values())
+    exact = {node_id: total * weights[node_id] / weight_sum for node_id in slots_of}
+    targets = {node_id: int(value) for node_id, value in exact.items()}
+    remain = total - sum(targets.values())
+    for node_id in sorted(exact, key=lambda n: (targets[n] - exact[n], n))[:remain]:
+        targets[node_id] += 1
+    return targets
+
+
+def max_deviation(slots_of, targets):
+    """
+    목표 슬롯 수 대비 가장 큰 편차(%)
+    """
+    deviation = 0.0
+    for node_id, target in targets.items():
+        diff = abs(len(slots_of[node_id]) - target)
+        if diff:
+            deviation = max(deviation, 100.0 * diff / target if target else 100.0)
+    return deviation
+
+
+def plan_moves(slots_of, targets):
+    """
+    잉여 슬롯을 가진 노드(donor)에서 부족한 노드(receiver)로의 이동 계획 계산.
+    잉여가 큰 donor와 부족분이 큰 receiver를 차례로 짝지어, 이동 슬롯 수는 잉여 합계(최소 이동량)와 같고
+    이동 건수는 (donor 수 + receiver 수 - 1) 이하.
+    [(src_id, dst_id, [slot, ...])] 반환
+    """
+    surplus = {n: len(slots_of[n]) - targets[n] for n in targets}
+    donors = sorted((n for n in surplus if surplus[n] > 0), key=lambda n: -surplus[n])
+    receivers = sorted((n for n in surplus if surplus[n] < 0), key=lambda n: surplus[n])
+    # donor는 보유 슬롯의 뒤쪽부터 내보냄 (reshard와 동일)
+    remaining = {n: list(slots_of[n]) for n in donors}
+
+    moves = []
+    d = r = 0
+    while d < len(donors) and r < len(receivers):
+        src, dst = donors[d], receivers[r]
+        count = min(surplus[src], -surplus[dst])
+        slots = remaining[src][-count:]
+        del remaining[src][-count:]
+        moves.append((src, dst, slots))
+        surplus[src] -= count
+        surplus[dst] += count
+        if surplus[src] == 0:
+            d += 1
+        if surplus[dst] == 0:
+            r += 1
+    return moves
+
+
+def schedule_rounds(moves):
+    """
+    한 라운드 안에서 각 노드가 최대 한 번만 참여하도록 이동을 라운드로 묶음.
+    슬롯 수가 많은 이동부터 배치해 라운드별 소요 시간을 비슷하게 맞춤.
+    """
+    rounds = []
+    for move in sorted(moves, key=lambda m: -len(m[2])):
+        src, dst, _ = move
+        for moves_in_round in rounds:
+            busy = {n for m in moves_in_round for n in m[:2]}
+            if src not in busy and dst not in busy:
+                moves_in_round.append(move)
+                break
+        else:
+            rounds.append([move])
+    return rounds
+
+
+def run_round(moves_in_round, masters, pipeline, password, parallel):
+    """
+    한 라운드의 이동들을 동시에 수행. (총 이동 키 수, [(slot, 오류)]) 반환
+    """
+    with ThreadPoolExecutor(max_workers=len(moves_in_round)) as executor:
+        futures = [
+            executor.submit(
+                migrate_slots, slots, masters[src], masters[dst], src, dst, pipeline, password, parallel,
+                desc=f"{masters[src]} -> {masters[dst]}", position=pos,
+            )
+            for pos, (src, dst, slots) in enumerate(moves_in_round)
+        ]
+        results = [future.result() for future in futures]
+    return sum(keys for keys, _ in results), [f for _, failures in results for f in failures]
+
+
+def print_balance(masters, slots_of, targets, weights):
+    """
+    마스터별 현재/목표 슬롯 수 출력
+    """
+    print("\n📊 마스터별 슬롯 현황:")
+    for node_id, addr in sorted(masters.items(), key=lambda x: x[1]):
+        current, target = len(slots_of[node_id]), targets[node_id]
+        print(f"    - {addr} ({node_id[:8]}) 가중치 {weights[node_id]:g}: {current} → {target} ({target - current:+d})")
+
+
+def print_plan(rounds, masters):
+    """
+    라운드별 슬롯 이동 계획 출력
+    """
+    total = sum(len(m[2]) for moves_in_round in rounds for m in moves_in_round)
+    count = sum(len(moves_in_round) for moves_in_round in rounds)
+    print(f"\n📝 이동 계획: 슬롯 {total}개, 이동 {count}건, 라운드 {len(rounds)}개")
+    for idx, moves_in_round in enumerate(rounds, start=1):
+        print(f"  [라운드 {idx}]")
+        for src, dst, slots in moves_in_round:
+            print(f"    - {masters[src]} -> {masters[dst]}: 슬롯 {len(slots)}개 ({StringUtils.format_slot_ranges(slots)})")
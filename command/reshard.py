@@ -1,70 +1,517 @@
+import contextlib
+import os
 import redis
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from utils.string_utils import StringUtils
 from utils.redis_utils import RedisUtils
+from utils.journal_utils import SlotJournal
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from utils.throttle_utils import AdaptiveThrottle, LatencyProbe
 
-def reshard(from_id, to_id, slots, pipeline, access_node, password):
+def reshard(from_id, to_id, slots, pipeline, access_node, password, parallel=1, resume=False, journal_path=None,
+            strategy="tail", dry_run=False, max_latency_ms=None, max_mbps=None, probe=False, big_key_bytes=None,
+            force=False):
     """
     지정된 슬롯 수만큼 from_id 노드에서 to_id 노드로 슬롯을 이동(리샤딩)하는 메인 함수.
+    - parallel: 동시에 이동할 슬롯 수 (워커마다 별도의 소스/대상 연결 사용)
+    - resume: 저널을 읽어 중단된 리샤딩을 이어서 수행 (slots 무시)
+    - journal_path: 계획/완료 슬롯을 기록할 저널 파일 경로 (기본: logs/reshard-<from>-<to>.journal)
+    - strategy: 이동할 슬롯 선택 방식 (tail, fewest-keys, most-keys, contiguous)
+    - dry_run: 선택된 슬롯과 사전 예상치만 출력하고 종료
+    - max_latency_ms / max_mbps: 지정 시 배치 크기와 배치 간 대기 시간을 AIMD로 조절해 MIGRATE 지연 / 전송량을 목표 이하로 유지
+      (pipeline은 시작 배치 크기가 됨)
+    - probe: 소스/대상 노드에 백그라운드 PING을 보내 그 지연도 max_latency_ms 판단에 포함
+    - big_key_bytes: 지정 시 이 크기(MEMORY USAGE) 이상인 키를 슬롯의 마지막에 키 하나씩 크기에 비례한 timeout으로 이동하고 결과에 목록 출력
+    - force: 끝나지 않은 저널이나 MIGRATING/IMPORTING 상태로 남은 슬롯이 있어도 새 리샤딩 시작 (저널 덮어씀)
     """
+    if parallel < 1:
+        print("❌ --parallel 값은 1 이상이어야 합니다.")
+        sys.exit(1)
+    if not resume and not slots:
+        print("❌ --slots 옵션은 필수입니다. (--resume 제외)")
+        sys.exit(1)
+    if probe and not max_latency_ms:
+        print("❌ --probe 옵션은 --max-latency-ms 와 함께 사용해야 합니다.")
+        sys.exit(1)
+    journal_path = journal_path or default_journal_path(from_id, to_id)
+
     print(f"🔍 {access_node}를 통해 클러스터에 연결 중...")
-    ip, port = StringUtils.parse_node(access_node)
-    r = RedisUtils.connect_node(ip, port, password)
+    with Stats.phase("토폴로지 조회"):
+        ip, port = StringUtils.parse_node(access_node)
+        r = RedisUtils.connect_node(ip, port, password)
+        nodes_dict = RedisUtils.cluster_nodes(r)
+        slot_map = SlotMap.from_cluster_nodes(nodes_dict)
+        validate_from_to_nodes(nodes_dict, slot_map, from_id, to_id, 0 if resume else slots, require_slots=not resume)
+
+    from_addr = slot_map.addrs[from_id]
+    to_addr = slot_map.addrs[to_id]
+
+    print(f"🔗 소스 노드: {from_addr}, 대상 노드: {to_addr}")
+
+    if resume:
+        with Stats.phase("저널 복구"):
+            journal, slots_to_move = resume_journal(journal_path, from_id, to_id, from_addr, to_addr, password)
+    else:
+        if not dry_run and not force:
+            check_unfinished(journal_path, from_id, to_id, from_addr, to_addr, password)
+        with Stats.phase("슬롯 선택 및 예상치"):
+            from_conn = RedisUtils.connect_node(*StringUtils.parse_node(from_addr), password)
+            to_conn = RedisUtils.connect_node(*StringUtils.parse_node(to_addr), password)
+            available_slots = slot_map.slots_of(from_id)
+            slots_to_move, key_counts = select_slots(from_conn, available_slots, slots, strategy)
+            estimate_reshard(from_conn, to_conn, slots_to_move, key_counts, pipeline, parallel)
+        if dry_run:
+            print("🔍 --dry-run 지정으로 예상치만 출력하고 종료합니다.")
+            return
+        journal = SlotJournal.create(journal_path, {"from": from_id, "to": to_id}, slots_to_move)
+        print(f"📝 리샤딩 저널 기록: {journal_path}")
+
+    print(f"🔀 슬롯 {len(slots_to_move)}개를 노드 {from_addr} -> {to_addr} 로 이동 시작 (동시 이동 슬롯 수: {parallel})")
+    throttle = None
+    if max_latency_ms or max_mbps:
+        throttle = AdaptiveThrottle(pipeline, max_latency_ms, max_mbps)
+        targets = [f"MIGRATE 지연 {max_latency_ms}ms" if max_latency_ms else "", f"{max_mbps}MB/s" if max_mbps else ""]
+        print(f"🚦 적응형 스로틀: {' / '.join(filter(None, targets))} 이하 유지 (시작 배치 {pipeline}"
+              f"{', PING 프로브' if probe else ''})")
+
+    if big_key_bytes:
+        print(f"🐘 {format_bytes(big_key_bytes)} 이상인 키는 슬롯마다 마지막에 따로 이동")
+
+    big_keys = []
+    started = time.time()
+    try:
+        with Stats.phase("슬롯 이동"), probe_nodes(probe, [from_addr, to_addr], password, throttle):
+            total_keys, failures = migrate_slots(slots_to_move, from_addr, to_addr, from_id, to_id, pipeline, password, parallel,
+                                                 on_done=journal.mark_done, throttle=throttle, big_key_bytes=big_key_bytes,
+                                                 big_keys=big_keys)
+    finally:
+        journal.close()
+    elapsed = time.time() - started
+
+    if big_keys:
+        print_big_keys(big_keys)
+    if failures:
+        print_failures(failures)
+        print(f"↩️ 문제 해결 후 --resume 옵션으로 이어서 진행할 수 있습니다. (저널: {journal_path})")
+        sys.exit(1)
+    print(f"✅ 리샤딩 완료! 총 {total_keys:,}개 키 이동 ({elapsed:.1f}초, 평균 {rate(total_keys, elapsed):,.0f} keys/sec)")
+    if throttle:
+        print(f"🚦 스로틀: 최종 배치 {throttle.batch_size()}, 배치 간 대기 {throttle.delay * 1000:.0f}ms, "
+              f"감속 {throttle.decreases}회")
+
+
+def print_big_keys(big_keys, limit=20):
+    """
+    따로 이동한 큰 키를 크기 순으로 출력
+    """
+    big_keys = sorted(big_keys, key=lambda entry: entry[2], reverse=True)
+    print(f"🐘 큰 키 {len(big_keys)}개 개별 이동 (합계 {format_bytes(sum(entry[2] for entry in big_keys))}):")
+    for slot, key, size, seconds in big_keys[:limit]:
+        print(f" - 슬롯 {slot:<5} {format_bytes(size):>10}  {seconds:.2f}초  {key}")
+    if len(big_keys) > limit:
+        print(f" - ... 외 {len(big_keys) - limit}개")
+
+
+def probe_nodes(enabled, addrs, password, throttle):
+    """
+    enabled이면 addrs 노드에 PING을 보내는 LatencyProbe, 아니면 아무것도 하지 않는 컨텍스트 반환
+    """
+    if not enabled:
+        return contextlib.nullcontext()
+    conns = [RedisUtils.connect_node(*StringUtils.parse_node(addr), password) for addr in addrs]
+    return LatencyProbe(conns, throttle)
+
+
+def select_slots(from_conn, available_slots, count, strategy):
+    """
+    strategy에 따라 이동할 슬롯 count개 선택.
+    - tail: 보유 슬롯의 뒤에서부터 선택 (기존 방식)
+    - fewest-keys / most-keys: 키가 가장 적은 / 많은 슬롯부터 선택
+    - contiguous: 번호가 연속된 보유 슬롯 구간 안에서 키 합계가 가장 적은 count개 선택 (슬롯 범위가 쪼개지지 않음,
+      count개 이상인 구간이 없으면 종료)
+    키 개수는 CLUSTER COUNTKEYSINSLOT 파이프라인으로 조회.
+    (선택된 슬롯 목록, {slot: 키 개수}) 반환
+    """
+    if strategy == "tail":
+        selected = available_slots[-count:]
+        return selected, RedisUtils.count_keys_in_slots(from_conn, selected)
+
+    print(f"🔢 보유 슬롯 {len(available_slots)}개의 키 개수 조회 중... (strategy: {strategy})")
+    counts = RedisUtils.count_keys_in_slots(from_conn, available_slots)
+    if strategy == "fewest-keys":
+        selected = sorted(available_slots, key=lambda slot: (counts[slot], slot))[:count]
+    elif strategy == "most-keys":
+        selected = sorted(available_slots, key=lambda slot: (-counts[slot], slot))[:count]
+    elif strategy == "contiguous":
+        selected, best = None, None
+        for run in contiguous_runs(available_slots):
+            if len(run) < count:
+                continue
+            window = sum(counts[slot] for slot in run[:count])
+            if best is None or window < best:
+                selected, best = run[:count], window
+            for start in range(1, len(run) - count + 1):
+                window += counts[run[start + count - 1]] - counts[run[start - 1]]
+                if window < best:
+                    selected, best = run[start:start + count], window
+        if selected is None:
+            longest = max(map(len, contiguous_runs(available_slots)), default=0)
+            print(f"❌ 연속된 보유 슬롯 구간 중 {count}개 이상인 구간이 없습니다. (가장 긴 구간: {longest}개)")
+            sys.exit(1)
+    else:
+        print(f"❌ 알 수 없는 strategy: {strategy}")
+        sys.exit(1)
+    selected.sort()
+    return selected, {slot: counts[slot] for slot in selected}
+
+
+def contiguous_runs(slots):
+    """
+    슬롯 목록을 번호가 연속된 구간별 목록으로 나눔. [0, 1, 2, 5, 6] → [[0, 1, 2], [5, 6]]
+    """
+    runs = []
+    for slot in sorted(slots):
+        if runs and slot == runs[-1][-1] + 1:
+            runs[-1].append(slot)
+        else:
+            runs.append([slot])
+    return runs
+
+
+def estimate_reshard(from_conn, to_conn, slots_to_move, key_counts, pipeline, parallel, sample_size=100):
+    """
+    리샤딩 사전 예상치(총 키 수, 바이트, 소요 시간) 출력.
+    - 바이트: 키가 있는 슬롯에서 최대 sample_size개 키를 뽑아 MEMORY USAGE 평균 × 총 키 수
+    - 시간: 샘플 키를 pipeline 단위로 DUMP 하는 시간(MIGRATE의 직렬화 비용)과 소스/대상 PING 왕복 시간을 측정해
+      배치 수와 슬롯당 SETSLOT 왕복 수에 곱해 계산
+    MIGRATE는 IMPORTING 상태가 아닌 슬롯으로 보낼 수 없어, 클러스터를 바꾸지 않도록 DUMP로 측정.
+    """
+    total_keys = sum(key_counts.values())
+    sample = []
+    for slot in slots_to_move:
+        if len(sample) >= sample_size:
+            break
+        if key_counts[slot]:
+            sample += RedisUtils.get_keys_in_slot(from_conn, slot, sample_size - len(sample))
+
+    avg_bytes = 0
+    dump_per_key = 0.0
+    if sample:
+        avg_bytes = sum(RedisUtils.memory_usage_keys(from_conn, sample)) / len(sample)
+        started = time.time()
+        for i in range(0, len(sample), pipeline):
+            pipe = from_conn.pipeline(transaction=False)
+            for key in sample[i:i + pipeline]:
+                pipe.dump(key)
+            pipe.execute()
+        dump_per_key = (time.time() - started) / len(sample)
+
+    from_rtt = measure_rtt(from_conn)
+    to_rtt = measure_rtt(to_conn)
+    batches = sum(-(-count // pipeline) for count in key_counts.values())
+    # 배치당: GETKEYSINSLOT + MIGRATE(소스 직렬화, 전송, 대상 복원), 슬롯당: SETSLOT 4회 + 마지막 빈 GETKEYSINSLOT
+    seconds = batches * (from_rtt * 2 + to_rtt) + total_keys * dump_per_key * 2
+    seconds += len(slots_to_move) * (from_rtt * 3 + to_rtt * 2)
+    seconds /= min(parallel, max(len(slots_to_move), 1))
+
+    print("📋 리샤딩 사전 예상치:")
+    print(f" - 이동할 슬롯: {len(slots_to_move)}개 ({StringUtils.format_slot_ranges(slots_to_move)})")
+    print(f" - 총 키 수: {total_keys:,}개 (MIGRATE 배치 {batches:,}회)")
+    print(f" - 예상 데이터 크기: {format_bytes(avg_bytes * total_keys)} (샘플 {len(sample)}개 평균 {avg_bytes:,.0f} bytes/key)")
+    print(f" - 예상 소요 시간: 약 {seconds:,.1f}초 (RTT 소스 {from_rtt * 1000:.2f}ms / 대상 {to_rtt * 1000:.2f}ms)")
+
+
+def measure_rtt(conn, count=5):
+    """
+    PING 왕복 시간의 최솟값(초)
+    """
+    best = None
+    for _ in range(count):
+        started = time.time()
+        conn.ping()
+        elapsed = time.time() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def format_bytes(num):
+    """
+    바이트 수를 사람이 읽기 쉬운 단위로 변환
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if num < 1024:
+            return f"{num:,.1f}{unit}"
+        num /= 1024
+    return f"{num:,.1f}TB"
+
+
+def default_journal_path(from_id, to_id):
+    """
+    FROM/TO 노드 ID로 기본 저널 경로 생성
+    """
+    return os.path.join("logs", f"reshard-{from_id[:8]}-{to_id[:8]}.journal")
 
-    nodes_dict = RedisUtils.cluster_nodes(r)
-    validate_from_to_nodes(nodes_dict, from_id, to_id, slots)
 
-    node_id_to_addr = {info['node_id']: addr for addr, info in nodes_dict.items()}
-    from_addr = node_id_to_addr[from_id]
-    to_addr = node_id_to_addr[to_id]
-    from_ip, from_port = from_addr.split(":")
-    to_ip, to_port = to_addr.split(":")
-    from_port = int(from_port)
-    to_port = int(to_port)
+def check_unfinished(journal_path, from_id, to_id, from_addr, to_addr, password):
+    """
+    새 리샤딩을 시작하기 전에 이전 리샤딩이 끝나지 않았는지 확인.
+    - journal_path에 완료되지 않은 슬롯이 남은 저널이 있거나
+    - 소스/대상 노드 자신의 CLUSTER NODES에 MIGRATING/IMPORTING 상태로 남은 슬롯이 있으면
+    저널을 덮어쓰지 않고 --resume(또는 --force) 안내 후 종료.
+    """
+    problems = []
+    if os.path.exists(journal_path):
+        try:
+            pending = SlotJournal.load(journal_path).pending()
+        except (OSError, ValueError, KeyError):
+            pending = []
+        if pending:
+            problems.append(f"저널 {journal_path} 에 완료되지 않은 슬롯 {len(pending)}개 "
+                            f"({StringUtils.format_slot_ranges(pending)})")
+
+    for node_id, addr in ((from_id, from_addr), (to_id, to_addr)):
+        conn = RedisUtils.connect_node(*StringUtils.parse_node(addr), password)
+        view = SlotMap.from_cluster_nodes({addr: myself_info(RedisUtils.cluster_nodes(conn))})
+        for slot, state in sorted(view.open_slots.items()):
+            problems.append(f"노드 {addr} 의 슬롯 {slot}: {state['state'].upper()} (상대 노드 {state['peer']})")
+
+    if problems:
+        print("❌ 이전 리샤딩이 끝나지 않았습니다:")
+        for problem in problems:
+            print(f" - {problem}")
+        print("↩️ --resume 옵션으로 이어서 진행하거나, 무시하고 새로 시작하려면 --force 옵션을 지정하세요.")
+        sys.exit(1)
+
+
+def resume_journal(journal_path, from_id, to_id, from_addr, to_addr, password):
+    """
+    저널을 읽어 남은 슬롯을 확인하고, 소스/대상 노드 자신의 CLUSTER NODES 정보로 각 슬롯 상태를 분류.
+    - 저널에 완료로 기록된 슬롯: 건너뜀
+    - 대상 노드가 이미 소유한 슬롯: 소유권 확정(SETSLOT NODE)만 마무리 후 완료 처리
+    - 소스 노드가 소유 중인 슬롯 (MIGRATING/IMPORTING 상태 포함): 이동 대상
+    - 그 외 (다른 노드 소유 등): 경고 후 건너뜀
+    (저널, 이동할 슬롯 목록) 반환
+    """
+    if not os.path.exists(journal_path):
+        print(f"❌ 저널 파일을 찾을 수 없습니다: {journal_path}")
+        sys.exit(1)
+    journal = SlotJournal.load(journal_path)
+    if journal.meta.get("from") != from_id or journal.meta.get("to") != to_id:
+        print(f"❌ 저널의 FROM/TO 노드({journal.meta.get('from')} -> {journal.meta.get('to')})가 요청과 다릅니다.")
+        sys.exit(1)
+
+    from_conn = RedisUtils.connect_node(*StringUtils.parse_node(from_addr), password)
+    to_conn = RedisUtils.connect_node(*StringUtils.parse_node(to_addr), password)
+    from_view = SlotMap.from_cluster_nodes({from_addr: myself_info(RedisUtils.cluster_nodes(from_conn))})
+    to_view = SlotMap.from_cluster_nodes({to_addr: myself_info(RedisUtils.cluster_nodes(to_conn))})
+    from_owned = set(from_view.slots_of(from_id))
+    to_owned = set(to_view.slots_of(to_id))
+    open_slots = set(from_view.open_slots) | set(to_view.open_slots)
+
+    pending = journal.pending()
+    finalized, to_move, skipped = [], [], []
+    for slot in pending:
+        if slot in to_owned:
+            RedisUtils.set_slot_node(from_conn, slot, to_id)
+            RedisUtils.set_slot_node(to_conn, slot, to_id)
+            journal.mark_done(slot)
+            finalized.append(slot)
+        elif slot in from_owned or slot in open_slots:
+            to_move.append(slot)
+        else:
+            skipped.append(slot)
+
+    print(f"↩️ 저널 {journal_path} 에서 이어서 진행:")
+    print(f" - 계획된 슬롯: {len(journal.planned)}개, 이미 완료: {len(journal.planned) - len(pending)}개")
+    print(f" - 소유권 확정만 마무리한 슬롯: {len(finalized)}개")
+    print(f" - 이동 중(MIGRATING/IMPORTING)이던 슬롯: {len(open_slots & set(to_move))}개, 이동할 슬롯 합계: {len(to_move)}개")
+    if skipped:
+        print(f"⚠️ 소스/대상 노드 어느 쪽도 소유하지 않아 건너뛴 슬롯: {StringUtils.format_slot_ranges(skipped)}")
 
-    print(f"🔗 소스 노드: {from_ip}:{from_port}, 대상 노드: {to_ip}:{to_port}")
+    # 중단 시점에 열려 있던 슬롯을 먼저 마무리
+    to_move.sort(key=lambda slot: slot not in open_slots)
+    return journal, to_move
 
-    from_conn = RedisUtils.connect_node(from_ip, from_port, password)
-    to_conn = RedisUtils.connect_node(to_ip, to_port, password)
 
-    available_slots = get_node_slots(nodes_dict, from_id)
-    slots_to_move = available_slots[-slots:]  # 뒤에서 slots 개 만큼 선택
+def myself_info(nodes_dict):
+    """
+    CLUSTER NODES 결과에서 응답한 노드 자신(myself)의 정보 반환.
+    MIGRATING/IMPORTING 슬롯은 자기 자신의 줄에만 표시됨.
+    """
+    for info in nodes_dict.values():
+        if "myself" in info["flags"]:
+            return info
+    return {}
 
-    print(f"🔀 슬롯 {slots}개를 노드 {from_addr} -> {to_addr} 로 이동 시작")
 
-    for slot in tqdm(slots_to_move, desc="슬롯 이동 진행", unit="slot"):
-        migrate_slot(from_conn, to_conn, slot, from_id, to_id, pipeline, to_ip, to_port, password)
+def migrate_slots(slots_to_move, from_addr, to_addr, from_id, to_id, pipeline, password, parallel=1, desc="슬롯 이동 진행",
+                  on_done=None, position=None, throttle=None, big_key_bytes=None, big_keys=None):
+    """
+    여러 슬롯을 최대 parallel 개씩 동시에 이동.
+    - 소스/대상 노드 클라이언트는 커넥션 풀을 공유하므로 동시에 실행되는 슬롯마다 서로 다른 연결을 사용
+    - 각 슬롯은 migrate_slot 안에서 IMPORTING → MIGRATING → NODE 순서를 그대로 따름
+    - 한 슬롯의 실패가 다른 슬롯 이동을 멈추지 않도록 슬롯별로 오류를 모아 반환
+    - on_done: 슬롯 이동이 끝날 때마다 호출할 콜백 (메인 스레드에서 호출)
+    - position: 여러 이동을 동시에 실행할 때 진행바 표시 줄 위치
+    - throttle: 지정 시 배치 크기 / 배치 간 대기 시간을 AdaptiveThrottle이 정함 (진행바에 현재 상태 표시)
+    - big_key_bytes / big_keys: 이 크기 이상인 키는 슬롯의 마지막에 따로 이동하고 big_keys 목록에 기록 (migrate_slot 참고)
+    - 진행바에는 전체 누적 keys/sec와 함께 마지막으로 완료된 슬롯의 키 수 / keys/sec를 표시
+    (총 이동 키 수, [(slot, 오류)]) 반환
+    """
+    from_host, from_port = StringUtils.parse_node(from_addr)
+    to_host, to_port = StringUtils.parse_node(to_addr)
+    from_conn = RedisUtils.connect_node(from_host, from_port, password)
+    to_conn = RedisUtils.connect_node(to_host, to_port, password)
+
+    def run(slot):
+        slot_started = time.time()
+        keys = migrate_slot(from_conn, to_conn, slot, from_id, to_id, pipeline, to_host, to_port, password, throttle,
+                            big_key_bytes, big_keys)
+        return keys, time.time() - slot_started
 
-    print("✅ 리샤딩 완료!")
+    total_keys = 0
+    failures = []
+    last_slot = {}  # 마지막으로 완료된 슬롯의 키 수 / keys/sec (진행바 표시용)
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=parallel) as executor, \
+            tqdm(total=len(slots_to_move), desc=desc, unit="slot", position=position) as bar:
+        futures = {executor.submit(run, slot): slot for slot in slots_to_move}
+        for future in as_completed(futures):
+            slot = futures[future]
+            try:
+                keys, elapsed = future.result()
+                total_keys += keys
+                last_slot = {"slot": slot, "slot_keys": keys, "slot_keys_per_sec": f"{rate(keys, elapsed):,.0f}"}
+                if on_done:
+                    on_done(slot)
+            except (Exception, SystemExit) as e:
+                failures.append((slot, e))
+                tqdm.write(f"❌ 슬롯 {slot} 이동 실패: {e}")
+            bar.update(1)
+            bar.set_postfix(keys=total_keys, keys_per_sec=f"{rate(total_keys, time.time() - started):,.0f}", **last_slot,
+                            failed=len(failures), **(throttle.status() if throttle else {}))
 
+    return total_keys, sorted(failures, key=lambda f: f[0])
 
-def migrate_slot(from_conn, to_conn, slot, from_id, to_id, pipeline_size, to_host, to_port, password):
+
+def print_failures(failures):
+    """
+    이동에 실패한 슬롯과 오류 출력.
+    실패한 슬롯은 MIGRATING/IMPORTING 상태로 남아있을 수 있음.
+    """
+    print(f"❌ 슬롯 {len(failures)}개 이동 실패 (MIGRATING/IMPORTING 상태로 남아있을 수 있습니다):")
+    for slot, err in failures:
+        print(f" - 슬롯 {slot}: {err}")
+
+
+def migrate_slot(from_conn, to_conn, slot, from_id, to_id, pipeline_size, to_host, to_port, password, throttle=None,
+                 big_key_bytes=None, big_keys=None):
     """
     특정 슬롯에 속한 모든 키를 소스 노드에서 대상 노드로 MIGRATE함.
+    throttle이 있으면 배치마다 스로틀이 정한 크기만큼 가져오고, 대기 후 이동한 뒤 소요 시간(과 --max-mbps 시 MEMORY USAGE 합계)을 알려줌.
+    big_key_bytes가 있으면 배치마다 MEMORY USAGE 파이프라인으로 큰 키를 골라 슬롯의 마지막에 키 하나씩,
+    크기에 비례한 timeout으로 이동 (작은 키 배치가 큰 키 하나에 막히지 않도록). 이동한 큰 키는 big_keys 목록에 추가.
+    이동한 키 개수를 반환.
     """
     # 슬롯 상태를 각각 대상 노드에 IMPORTING, 소스 노드에 MIGRATING 으로 설정
     RedisUtils.set_slot_importing(to_conn, slot, from_id)
     RedisUtils.set_slot_migrating(from_conn, slot, to_id)
 
-    # 슬롯 내 키를 pipeline_size 단위로 반복적으로 MIGRATE
+    # 슬롯 내 키를 pipeline_size 단위로 가져와 배치마다 MIGRATE 한 번으로 이동
+    moved = 0
+    deferred = {}  # 큰 키 → bytes (슬롯에 남아 있으므로 다음 GETKEYSINSLOT에서 그만큼 더 가져와 제외)
+    measure = big_key_bytes or (throttle and throttle.max_mbps)
     while True:
-        keys = RedisUtils.get_keys_in_slot(from_conn, slot, pipeline_size)
+        count = throttle.batch_size() if throttle else pipeline_size
+        keys = [key for key in RedisUtils.get_keys_in_slot(from_conn, slot, count + len(deferred)) if key not in deferred]
         if not keys:
             break
-        for key in keys:
-            RedisUtils.migrate_key(from_conn, to_host, to_port, key, password, 60000)
+        sizes = RedisUtils.memory_usage_keys(from_conn, keys) if measure else [0] * len(keys)
+        if big_key_bytes:
+            small = [(key, size) for key, size in zip(keys, sizes) if size < big_key_bytes]
+            deferred.update((key, size) for key, size in zip(keys, sizes) if size >= big_key_bytes)
+            keys, sizes = [key for key, _ in small], [size for _, size in small]
+        if keys:
+            move_keys(from_conn, keys, sum(sizes), to_host, to_port, password, throttle)
+            moved += len(keys)
+
+    # 큰 키는 키 하나씩, 크기에 비례한 timeout으로 이동
+    for key, size in sorted(deferred.items(), key=lambda item: item[1]):
+        if throttle:
+            throttle.pace(size if throttle.max_mbps else 0)
+        started = time.perf_counter()
+        timeout = big_key_timeout(size)
+        try:
+            RedisUtils.migrate_key(from_conn, to_host, to_port, key, password, timeout)
+        except redis.exceptions.RedisError as e:
+            raise RuntimeError(f"큰 키 MIGRATE 실패 (key: {key}, {format_bytes(size)}, timeout {timeout}ms): {e}") from e
+        if big_keys is not None:
+            big_keys.append((slot, key, size, time.perf_counter() - started))
+        moved += 1
 
     # 슬롯 소유권을 대상 노드로 변경
     RedisUtils.set_slot_node(to_conn, slot, to_id)
     RedisUtils.set_slot_node(from_conn, slot, from_id)
+    return moved
 
 
-def validate_from_to_nodes(nodes_dict, from_id, to_id, slots):
+def move_keys(from_conn, keys, nbytes, to_host, to_port, password, throttle):
+    """
+    키 묶음을 MIGRATE 한 번으로 이동 (throttle이 있으면 대기 후 이동하고 소요 시간을 알려줌)
+    """
+    if not throttle:
+        migrate_batch(from_conn, keys, to_host, to_port, password)
+        return
+    throttle.pace(nbytes)
+    started = time.perf_counter()
+    migrate_batch(from_conn, keys, to_host, to_port, password)
+    throttle.observe(time.perf_counter() - started, nbytes)
+
+
+def big_key_timeout(nbytes):
+    """
+    큰 키 MIGRATE timeout(ms): 기본 60000ms + 10MB/s 기준 전송 시간
+    """
+    return 60000 + nbytes // 10000
+
+
+def migrate_batch(from_conn, keys, to_host, to_port, password):
+    """
+    GETKEYSINSLOT으로 가져온 키 묶음을 다중 키 MIGRATE 한 번으로 이동.
+    실패 시(BUSYKEY, 너무 큰 키로 인한 timeout 등) 키 하나씩 MIGRATE로 재시도하며,
+    이미 이동된 키는 소스에서 NOKEY로 응답하므로 중복 이동되지 않음.
+    키 단위 재시도마저 실패하면 해당 키를 알리고 예외를 그대로 전달 (슬롯에 키가 남으면 소유권 변경 불가).
+    """
+    try:
+        RedisUtils.migrate_keys(from_conn, to_host, to_port, keys, password, 60000)
+        return
+    except redis.exceptions.RedisError as e:
+        tqdm.write(f"⚠️ 다중 키 MIGRATE 실패 ({len(keys)}개): {e} → 키 단위 MIGRATE로 재시도")
+
+    for key in keys:
+        try:
+            RedisUtils.migrate_key(from_conn, to_host, to_port, key, password, 60000)
+        except redis.exceptions.RedisError as e:
+            tqdm.write(f"❌ 키 MIGRATE 실패 (key: {key}): {e}")
+            raise
+
+
+def rate(count, elapsed):
+    """
+    초당 처리량 계산 (elapsed가 0이면 0 반환)
+    """
+    return count / elapsed if elapsed > 0 else 0.0
+
+
+def validate_from_to_nodes(nodes_dict, slot_map, from_id, to_id, slots, require_slots=True):
     """
     from_id, to_id 노드 및 슬롯 이동 개수의 유효성 검사 수행.
     - 노드 존재 여부, 마스터 여부, 슬롯 보유 개수 등 체크.
+    - require_slots=False 이면 슬롯 보유 여부 검사 생략 (--resume)
     """
     errors = []
     warnings = []
@@ -86,20 +533,11 @@ def validate_from_to_nodes(nodes_dict, from_id, to_id, slots):
     if from_node:
         if 'master' not in from_node['flags']:
             errors.append(f"FROM 노드 {from_id}는 마스터가 아닙니다.")
-        if not from_node.get('slots'):
+        from_slots_count = slot_map.count_of(from_id)
+        if require_slots and not from_slots_count:
             errors.append(f"FROM 노드 {from_id}는 슬롯을 보유하고 있지 않습니다.")
-        else:
-            # 보유한 슬롯 개수 합산
-            from_slots_count = 0
-            for slot_range in from_node['slots']:
-                if isinstance(slot_range, list):
-                    start = int(slot_range[0])
-                    end = int(slot_range[1])
-                    from_slots_count += (end - start + 1)
-                else:
-                    from_slots_count += 1
-            if from_slots_count < slots:
-                errors.append(f"FROM 노드가 보유한 슬롯 개수({from_slots_count})가 이동 요청 슬롯 수({slots})보다 적습니다.")
+        elif require_slots and from_slots_count < slots:
+            errors.append(f"FROM 노드가 보유한 슬롯 개수({from_slots_count})가 이동 요청 슬롯 수({slots})보다 적습니다.")
 
     if to_node and 'master' not in to_node['flags']:
         errors.append(f"TO 노드 {to_id}는 마스터가 아닙니다.")
@@ -116,23 +554,3 @@ def validate_from_to_nodes(nodes_dict, from_id, to_id, slots):
         sys.exit(1)
 
     print("✅ FROM/TO 노드 유효성 검사 통과")
-
-
-def get_node_slots(nodes_dict, from_id):
-    """
-    from_id 노드가 보유한 슬롯 번호 리스트 반환
-    """
-    for addr, info in nodes_dict.items():
-        if info["node_id"] == from_id or info.get("id") == from_id:
-            slots = []
-            for slot_range in info.get("slots", []):
-                if isinstance(slot_range, list):
-                    if len(slot_range) == 2:
-                        start, end = map(int, slot_range)
-                        slots.extend(range(start, end + 1))
-                    elif len(slot_range) == 1:
-                        slots.append(int(slot_range[0]))
-                else:
-                    slots.append(int(slot_range))
-            return slots
-    return []
\ No newline at end of file
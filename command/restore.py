@@ -0,0 +1,169 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from utils.string_utils import StringUtils
+from utils.print_utils import PrintUtils
+from utils.redis_utils import RedisUtils
+from utils.slot_utils import SlotMap
+from utils.stats_utils import Stats
+from utils.dump_utils import DumpReader
+from command.reshard import rate
+
+
+def restore(access_node, password, input_path, slots=None, replace=False, pipeline=100, parallel=4):
+    """
+    dump 파일을 현재 클러스터에 복원하는 메인 함수.
+    - 파일을 mmap으로 열고 인덱스에서 복원할 슬롯의 청크 위치만 찾아 읽음 (--slots로 일부 슬롯만 복원 가능)
+    - 슬롯마다 현재 소유 마스터를 찾아 RESTORE 파이프라인 전송 (dump 당시와 토폴로지가 달라도 됨)
+    - 이미 존재하는 키는 BUSYKEY로 건너뜀 (--replace 지정 시 덮어씀)
+    - TTL은 dump 시점에 기록한 절대 만료 시각으로 설정 (RESTORE ... ABSTTL), 이미 만료된 키는 건너뜀
+
+    (인자)
+    - input_path (str): dump 파일 경로
+    - slots (str, optional): 복원할 슬롯 범위 ("0-100,200", 기본: 파일의 모든 슬롯)
+    - replace (bool): 이미 존재하는 키를 덮어쓸지 여부
+    - pipeline (int): RESTORE 파이프라인 한 번에 보낼 키 수
+    - parallel (int): 동시에 복원할 슬롯 수
+    """
+    if pipeline < 1 or parallel < 1:
+        PrintUtils.error("--pipeline, --parallel 값은 1 이상이어야 합니다.")
+        sys.exit(1)
+    try:
+        reader = DumpReader(input_path)
+    except (OSError, ValueError) as e:
+        PrintUtils.error(f"dump 파일을 열 수 없습니다: {e}")
+        sys.exit(1)
+
+    try:
+        index = reader.index
+        print(f"📦 {input_path}: {index.get('created_at')} dump, 키 {index.get('keys', 0):,}개, "
+              f"슬롯 {len(reader.chunks)}개 (원본 {index.get('source')})")
+        selected = reader.slots()
+        if slots:
+            requested = set(StringUtils.parse_slot_ranges(slots))
+            selected = [slot for slot in selected if slot in requested]
+        if not selected:
+            PrintUtils.warn("복원할 키가 있는 슬롯이 없습니다.")
+            return
+
+        host, port = StringUtils.parse_node(access_node)
+        PrintUtils.info(f"{access_node}를 통해 클러스터 토폴로지 조회 중...")
+        with Stats.phase("토폴로지 조회"):
+            r = RedisUtils.connect_node(host, port, password)
+            slot_map = SlotMap.from_cluster_nodes(RedisUtils.get_cluster_nodes(r))
+        unowned = [slot for slot in selected if not slot_map.owner_addr(slot)]
+        if unowned:
+            PrintUtils.error(f"현재 소유 노드가 없는 슬롯이 있어 복원할 수 없습니다: {StringUtils.format_slot_ranges(unowned)}")
+            sys.exit(1)
+
+        total_keys = sum(reader.key_count(slot) for slot in selected)
+        owners = sorted({slot_map.owner_addr(slot) for slot in selected})
+        print(f"♻️ 슬롯 {len(selected)}개, 키 {total_keys:,}개를 마스터 {len(owners)}개로 복원 "
+              f"(파이프라인 {pipeline}, 동시 슬롯 {parallel}{', REPLACE' if replace else ''})")
+        started = time.time()
+        with Stats.phase("RESTORE"):
+            restored, busy, expired, failures = restore_slots(reader, selected, slot_map, password, replace, pipeline, parallel, total_keys)
+        elapsed = time.time() - started
+    finally:
+        reader.close()
+
+    print(f"\n✅ 복원 완료: 키 {restored:,}개, {elapsed:.1f}초 ({rate(restored, elapsed):,.0f} keys/s)")
+    if busy:
+        PrintUtils.warn(f"이미 존재하여 건너뛴 키: {busy:,}개 (덮어쓰려면 --replace)")
+    if expired:
+        PrintUtils.info(f"dump 이후 만료되어 건너뛴 키: {expired:,}개")
+    if failures:
+        PrintUtils.error(f"복원에 실패한 슬롯 {len(failures)}개:")
+        for slot, err in failures:
+            print(f" - 슬롯 {slot}: {err}")
+        sys.exit(1)
+
+
+def restore_slots(reader, slots, slot_map, password, replace, pipeline, parallel, total_keys):
+    """
+    슬롯들을 최대 parallel 개씩 동시에 복원.
+    - 마스터별 클라이언트는 커넥션 풀을 공유하므로 동시에 실행되는 슬롯마다 서로 다른 연결을 사용
+    - 한 마스터에 몰리지 않도록 마스터별 슬롯 목록을 번갈아 가며 제출
+    (복원한 키 수, BUSYKEY로 건너뛴 키 수, 만료되어 건너뛴 키 수, [(slot, 오류)]) 반환
+    """
+    conns = {}
+    by_owner = {}
+    for slot in slots:
+        addr = slot_map.owner_addr(slot)
+        if addr not in conns:
+            conns[addr] = RedisUtils.connect_node(*StringUtils.parse_node(addr), password, decode_responses=False)
+        by_owner.setdefault(addr, []).append(slot)
+    order = [slot for group in zip_longest_slots(by_owner.values()) for slot in group]
+
+    restored = busy = expired = 0
+    failures = []
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=parallel) as executor, \
+            tqdm(total=total_keys, desc="복원 진행", unit="key") as bar:
+        def run(slot):
+            return restore_slot(conns[slot_map.owner_addr(slot)], reader, slot, replace, pipeline, bar)
+
+        futures = {executor.submit(run, slot): slot for slot in order}
+        for future in as_completed(futures):
+            slot = futures[future]
+            try:
+                ok, skipped, gone = future.result()
+                restored += ok
+                busy += skipped
+                expired += gone
+            except Exception as e:
+                failures.append((slot, e))
+                tqdm.write(f"❌ 슬롯 {slot} 복원 실패: {e}")
+            bar.set_postfix(keys_per_sec=f"{rate(bar.n, time.time() - started):,.0f}", busy=busy, failed=len(failures))
+    return restored, busy, expired, sorted(failures, key=lambda f: f[0])
+
+
+def zip_longest_slots(groups):
+    """
+    [[a1, a2], [b1]] → [[a1, b1], [a2]] (마스터별 슬롯 목록을 번갈아 배치)
+    """
+    groups = [list(group) for group in groups]
+    return [[group[i] for group in groups if i < len(group)] for i in range(max(map(len, groups), default=0))]
+
+
+def restore_slot(conn, reader, slot, replace, pipeline, bar):
+    """
+    한 슬롯의 레코드를 pipeline개씩 RESTORE.
+    BUSYKEY 외의 오류가 있으면 슬롯 전체를 실패로 처리 (첫 오류를 예외로 전달)
+    (복원한 키 수, BUSYKEY로 건너뛴 키 수, 만료되어 건너뛴 키 수) 반환
+    """
+    restored = busy = expired = 0
+    batch = []
+    for record in reader.records(slot):
+        batch.append(record)
+        if len(batch) >= pipeline:
+            ok, skipped, gone = restore_batch(conn, batch, replace)
+            restored, busy, expired = restored + ok, busy + skipped, expired + gone
+            bar.update(len(batch))
+            batch = []
+    if batch:
+        ok, skipped, gone = restore_batch(conn, batch, replace)
+        restored, busy, expired = restored + ok, busy + skipped, expired + gone
+        bar.update(len(batch))
+    return restored, busy, expired
+
+
+def restore_batch(conn, batch, replace):
+    """
+    레코드 묶음을 RESTORE 파이프라인 한 번으로 전송. (성공 수, BUSYKEY 수, 만료 수) 반환
+    만료 시각이 이미 지난 레코드는 보내지 않음 (RESTORE ABSTTL은 과거 시각이면 키를 만들지 않고 OK 응답)
+    """
+    now_ms = int(time.time() * 1000)
+    live = [record for record in batch if record[1] == RedisUtils.NO_EXPIRY or record[1] > now_ms]
+    ok = busy = 0
+    if not live:
+        return ok, busy, len(batch)
+    for (key, _, _), result in zip(live, RedisUtils.restore_keys(conn, live, replace)):
+        if not isinstance(result, Exception):
+            ok += 1
+        elif "BUSYKEY" in str(result):
+            busy += 1
+        else:
+            raise RuntimeError(f"{key!r}: {result}")
+    return ok, busy, len(batch) - len(live)
@@ -2,6 +2,11 @@ import argparse
 import sys
 
 from command import *
+from utils.workload_utils import WorkloadGenerator
+from utils.redis_utils import RedisUtils
+from utils.print_utils import PrintUtils
+from utils.stats_utils import Stats
+from utils.string_utils import StringUtils
 
 # 서브 커맨드 핸들러 import (아직 미구현 시, 임시 패스)
 # from commands import create, add_node, reshard, del_node, check, populate, help_cmd
@@ -21,6 +26,9 @@ def subcommand_handler():
     # 공통 옵션 (global)
     parser.add_argument("--user", type=str, default="default", help="Redis 사용자 이름 (기본: default)")
     parser.add_argument("--password", type=str, help="Redis 노드 비밀번호")
+    parser.add_argument("--conn-stats", action="store_true", help="실행 후 연결 생성/재사용 통계 출력")
+    parser.add_argument("--stats", action="store_true", help="실행 후 단계별 시간/명령 수/왕복/바이트/이동 키/연결 통계 출력")
+    parser.add_argument("--stats-json", metavar="FILE", help="단계별 실행 통계를 JSON 파일로 저장 (--stats 포함)")
 
     # 서브 커맨드 파서
     subparsers = parser.add_subparsers(dest="command", help="서브 커맨드 목록")     
@@ -31,11 +39,13 @@ def subcommand_handler():
     # create
     create_parser = subparsers.add_parser("create", help="Redis 클러스터 생성")
     create_parser.add_argument("--replicas", type=int, default=0, help="각 마스터 당 리플리카 수 (기본: 0)")
+    create_parser.add_argument("--wait-timeout", type=float, default=30.0, help="클러스터 상태 수렴 최대 대기 시간(초) (기본: 30)")
     create_parser.add_argument("nodes", nargs='+', help="클러스터에 사용할 노드들 (ip:port 형식)") # nargs필드는 한 개 이상의 인자를 받을 수 있음.
 
     # add-node
     add_node_parser = subparsers.add_parser("add-node", help="노드 추가")
     add_node_parser.add_argument("--master-id", type=str, help="리플리카일 경우, 연결할 마스터의 ID")
+    add_node_parser.add_argument("--wait-timeout", type=float, default=30.0, help="MEET 전파 최대 대기 시간(초) (기본: 30)")
     add_node_parser.add_argument("new_node", help="추가할 노드 (ip:port)")
     add_node_parser.add_argument("existing_node", help="기존 클러스터 노드 (ip:port)")
 
@@ -43,24 +53,133 @@ def subcommand_handler():
     reshard_parser = subparsers.add_parser("reshard", help="슬롯 리샤딩")
     reshard_parser.add_argument("--from", dest="from_node", required=True, help="슬롯 이동할 원본 노드 ID")
     reshard_parser.add_argument("--to", dest="to_node", required=True, help="슬롯이 이동될 대상 노드 ID")
-    reshard_parser.add_argument("--slots", type=int, required=True, help="이동할 슬롯 개수")
+    reshard_parser.add_argument("--slots", type=int, help="이동할 슬롯 개수 (--resume 시 생략)")
     reshard_parser.add_argument("--pipeline", type=int, default=10, help="한 번에 이동할 키 수 (기본: 10)")
+    reshard_parser.add_argument("--parallel", type=int, default=1, help="동시에 이동할 슬롯 수 (기본: 1)")
+    reshard_parser.add_argument("--resume", action="store_true", help="저널을 읽어 중단된 리샤딩을 이어서 수행")
+    reshard_parser.add_argument("--journal", type=str, help="리샤딩 저널 파일 경로 (기본: logs/reshard-<from>-<to>.journal)")
+    reshard_parser.add_argument("--force", action="store_true",
+                                help="끝나지 않은 저널이나 MIGRATING/IMPORTING 슬롯이 있어도 새로 시작 (저널 덮어씀)")
+    reshard_parser.add_argument("--strategy", choices=["tail", "fewest-keys", "most-keys", "contiguous"], default="tail",
+                                help="이동할 슬롯 선택 방식 (기본: tail, 보유 슬롯의 뒤에서부터)")
+    reshard_parser.add_argument("--dry-run", action="store_true", help="선택된 슬롯과 사전 예상치만 출력")
+    reshard_parser.add_argument("--max-latency-ms", type=float, help="MIGRATE 배치 지연 목표(ms), 넘으면 배치를 줄이고 간격을 둠 (적응형 스로틀)")
+    reshard_parser.add_argument("--max-mbps", type=float, help="이동 전송량 상한(MB/s, MEMORY USAGE 기준) (적응형 스로틀)")
+    reshard_parser.add_argument("--probe", action="store_true", help="소스/대상 노드에 백그라운드 PING을 보내 그 지연도 --max-latency-ms 판단에 포함")
+    reshard_parser.add_argument("--big-key-bytes", type=StringUtils.parse_size,
+                                help="이 크기 이상인 키를 슬롯 마지막에 따로, 크기에 비례한 timeout으로 이동 (예: 16MB, 기본: 사용 안 함)")
     reshard_parser.add_argument("target_node", help="명령 실행을 위한 클러스터 노드 (ip:port)")
 
+    # rebalance
+    rebalance_parser = subparsers.add_parser("rebalance", help="마스터 간 슬롯 균등 재분배")
+    rebalance_parser.add_argument("--weight", action="append", default=[], help="마스터별 가중치 (node_id=weight, 여러 번 지정 가능, 기본: 1)")
+    rebalance_parser.add_argument("--pipeline", type=int, default=10, help="한 번에 이동할 키 수 (기본: 10)")
+    rebalance_parser.add_argument("--parallel", type=int, default=1, help="이동 한 건당 동시에 이동할 슬롯 수 (기본: 1)")
+    rebalance_parser.add_argument("--threshold", type=float, default=2.0, help="목표 대비 편차가 이 비율(%%) 이하이면 생략 (기본: 2)")
+    rebalance_parser.add_argument("--dry-run", action="store_true", help="이동 계획만 출력")
+    rebalance_parser.add_argument("target_node", help="명령 실행을 위한 클러스터 노드 (ip:port)")
+
     # del-node
     del_node_parser = subparsers.add_parser("del-node", help="노드 제거")
+    del_node_parser.add_argument("--drain", action="store_true", help="슬롯을 나머지 마스터에 분산 이동하고 리플리카를 옮긴 뒤 제거")
+    del_node_parser.add_argument("--pipeline", type=int, default=10, help="drain 시 MIGRATE 배치 크기 (기본: 10)")
+    del_node_parser.add_argument("--parallel", type=int, default=1, help="drain 시 대상 마스터별 동시 이동 슬롯 수 (기본: 1)")
+    del_node_parser.add_argument("--wait-timeout", type=float, default=30.0, help="drain 후 상태 수렴 최대 대기 시간(초) (기본: 30)")
     del_node_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
     del_node_parser.add_argument("node_id", help="제거할 노드 ID")
 
     # check
     check_parser = subparsers.add_parser("check", help="클러스터 상태 확인")
+    check_parser.add_argument("--connect-timeout", type=float, default=2.0, help="노드별 연결 제한 시간(초) (기본: 2)")
+    check_parser.add_argument("--read-timeout", type=float, default=5.0, help="노드별 응답 대기 제한 시간(초) (기본: 5)")
+    check_parser.add_argument("--workers", type=int, default=32, help="노드 정보를 동시에 조회할 최대 노드 수 (기본: 32)")
     check_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
 
     # populate-test-data
     populate_parser = subparsers.add_parser("populate-test-data", help="테스트 데이터 생성")
     populate_parser.add_argument("--num-of-keys", type=int, default=1000, help="생성할 키 수 (기본: 1000)")
+    populate_parser.add_argument("--batch-size", type=int, default=1000, help="파이프라인 한 번에 저장할 키 수, 1이면 키마다 SET (기본: 1000)")
+    populate_parser.add_argument("--workers", type=int, default=1, help="데이터 생성에 사용할 프로세스 수 (기본: 1)")
+    populate_parser.add_argument("--type", dest="data_type", choices=["string", "hash", "list", "zset", "stream", "mixed"], default="string",
+                                 help="데이터 타입 (기본: string)")
+    populate_parser.add_argument("--value-size", type=str, help="값 크기 분포 (fixed:N, uniform:MIN-MAX, exp:MEAN / 기본: val:NNNNNNNNNN)")
+    populate_parser.add_argument("--elements", type=int, default=1, help="컬렉션 타입에서 쓰기 한 번에 추가할 원소 수 (기본: 1)")
+    populate_parser.add_argument("--key-dist", choices=["sequential", "uniform", "zipf"], default="sequential",
+                                 help="쓰기마다 키를 고르는 방식 (기본: sequential)")
+    populate_parser.add_argument("--zipf-s", type=float, default=1.0, help="zipf 분포 지수, 클수록 소수 키에 집중 (기본: 1.0)")
+    populate_parser.add_argument("--hot-tags", type=int, default=0, help="hot 키에 사용할 해시 태그 수 (기본: 0)")
+    populate_parser.add_argument("--hot-ratio", type=float, default=0.0, help="해시 태그로 hot 슬롯에 모을 키 비율 0~1 (기본: 0)")
+    populate_parser.add_argument("--ttl-ratio", type=float, default=0.0, help="TTL을 부여할 쓰기 비율 0~1 (기본: 0)")
+    populate_parser.add_argument("--ttl", type=str, default="60-3600", help="TTL 범위(초) MIN-MAX (기본: 60-3600)")
+    populate_parser.add_argument("--seed", type=int, default=0, help="워크로드 생성 seed (기본: 0)")
     populate_parser.add_argument("node_addr", help="Redis 노드 주소 (ip:port)")
 
+    # bench
+    bench_parser = subparsers.add_parser("bench", help="클러스터 성능 측정 (마스터별 처리량/지연 시간)")
+    bench_parser.add_argument("--clients", type=int, default=50, help="동시 클라이언트 수 (기본: 50)")
+    bench_parser.add_argument("--duration", type=float, default=10, help="측정 시간(초) (기본: 10)")
+    bench_parser.add_argument("--get-ratio", type=float, default=0.8, help="GET 비율 0~1, 나머지는 SET (기본: 0.8)")
+    bench_parser.add_argument("--pipeline", type=int, default=1, help="요청 한 번에 보낼 명령 수 (기본: 1)")
+    bench_parser.add_argument("--value-size", type=int, default=64, help="SET 값 크기 bytes (기본: 64)")
+    bench_parser.add_argument("--keyspace", type=int, default=100000, help="마스터별 키 개수 (기본: 100000)")
+    bench_parser.add_argument("--seed", type=int, default=0, help="키 선택 seed (기본: 0)")
+    bench_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
+
+    # monitor
+    monitor_parser = subparsers.add_parser("monitor", help="클러스터 상태 주기 수집 (NDJSON / Prometheus)")
+    monitor_parser.add_argument("--interval", type=float, default=1.0, help="수집 간격(초) (기본: 1)")
+    monitor_parser.add_argument("--count", type=int, help="수집 횟수 (기본: Ctrl+C까지 계속)")
+    monitor_parser.add_argument("--format", dest="output_format", choices=["ndjson", "prometheus"], default="ndjson",
+                                help="출력 형식 (기본: ndjson)")
+    monitor_parser.add_argument("--listen", default="127.0.0.1:9121", help="prometheus 형식의 HTTP 주소 (기본: 127.0.0.1:9121)")
+    monitor_parser.add_argument("--nodes-every", type=int, default=10, help="CLUSTER NODES를 조회할 수집 주기 (기본: 10회마다)")
+    monitor_parser.add_argument("--output", help="NDJSON을 기록할 파일 (기본: 표준 출력)")
+    monitor_parser.add_argument("--timeout", type=float, help="노드별 응답 제한 시간(초) (기본: --interval)")
+    monitor_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
+
+    # analyze
+    analyze_parser = subparsers.add_parser("analyze", help="키 분포 분석 (큰 키, 비싼 슬롯, 해시 태그 쏠림)")
+    analyze_parser.add_argument("--count", type=int, default=1000, help="SCAN COUNT (기본: 1000)")
+    analyze_parser.add_argument("--top", type=int, default=20, help="출력할 큰 키 / 슬롯 / 해시 태그 수 (기본: 20)")
+    analyze_parser.add_argument("--samples", type=int, default=5, help="MEMORY USAGE SAMPLES (기본: 5, 0이면 전체 원소)")
+    analyze_parser.add_argument("--tag-capacity", type=int, default=1000, help="추적할 해시 태그 카운터 수 (기본: 1000)")
+    analyze_parser.add_argument("--max-keys", type=int, help="마스터별 최대 분석 키 수 (기본: 전체)")
+    analyze_parser.add_argument("--hot-share", type=float, default=1.0, help="쏠림으로 표시할 해시 태그의 전체 바이트 비율(%%) (기본: 1)")
+    analyze_parser.add_argument("--json", dest="json_path", help="분석 결과를 저장할 JSON 파일")
+    analyze_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
+
+    # dump
+    dump_parser = subparsers.add_parser("dump", help="클러스터 데이터를 슬롯 인덱스가 있는 파일로 저장")
+    dump_parser.add_argument("--output", required=True, help="저장할 dump 파일 경로")
+    dump_parser.add_argument("--slots", help="저장할 슬롯 범위 (예: 0-100,200, 기본: 전체)")
+    dump_parser.add_argument("--batch", type=int, default=100, help="DUMP 파이프라인 한 번에 보낼 키 수 (기본: 100)")
+    dump_parser.add_argument("--compress-level", type=int, default=6, help="zlib 압축 수준 0~9, 0이면 압축 안 함 (기본: 6)")
+    dump_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
+
+    # restore
+    restore_parser = subparsers.add_parser("restore", help="dump 파일을 현재 슬롯 소유 노드로 복원")
+    restore_parser.add_argument("--slots", help="복원할 슬롯 범위 (예: 0-100,200, 기본: 파일의 모든 슬롯)")
+    restore_parser.add_argument("--replace", action="store_true", help="이미 존재하는 키를 덮어씀")
+    restore_parser.add_argument("--pipeline", type=int, default=100, help="RESTORE 파이프라인 한 번에 보낼 키 수 (기본: 100)")
+    restore_parser.add_argument("--parallel", type=int, default=4, help="동시에 복원할 슬롯 수 (기본: 4)")
+    restore_parser.add_argument("input", help="dump 파일 경로")
+    restore_parser.add_argument("target_node", help="클러스터 노드 (ip:port)")
+
+    # copy-cluster
+    copy_parser = subparsers.add_parser("copy-cluster", help="다른 클러스터로 키 복사 (슬롯 단위, 이어서 수행 가능)")
+    copy_parser.add_argument("--dst-password", help="대상 클러스터 비밀번호 (기본: --password)")
+    copy_parser.add_argument("--slots", help="복사할 슬롯 범위 (예: 0-100,200, 기본: 전체)")
+    copy_parser.add_argument("--batch", type=int, default=100, help="MIGRATE / RESTORE 한 번에 보낼 키 수 (기본: 100)")
+    copy_parser.add_argument("--parallel", type=int, default=4, help="소스 마스터마다 동시에 복사할 슬롯 수 (기본: 4)")
+    copy_parser.add_argument("--window", type=int, default=4, help="대상 노드마다 동시에 보낼 수 있는 배치 수 (기본: 4)")
+    copy_parser.add_argument("--method", choices=["migrate", "restore"], default="migrate",
+                             help="migrate: 소스가 대상으로 직접 MIGRATE COPY, restore: CLI가 DUMP → RESTORE 중계 (기본: migrate)")
+    copy_parser.add_argument("--replace", action="store_true", help="대상에 이미 있는 키를 덮어씀")
+    copy_parser.add_argument("--resume", action="store_true", help="저널을 읽어 중단된 복사를 이어서 수행")
+    copy_parser.add_argument("--journal", help="저널 파일 경로 (기본: logs/copy-<src>-<dst>.journal)")
+    copy_parser.add_argument("src_node", help="소스 클러스터 노드 (ip:port)")
+    copy_parser.add_argument("dst_node", help="대상 클러스터 노드 (ip:port)")
+
 
 
     # 파싱 및 실행
@@ -78,21 +197,63 @@ def subcommand_handler():
 
 
 
-    # 서브커맨드 매핑
+    # 단계별 실행 통계 (실패로 종료해도 출력)
+    Stats.enabled = args.stats or bool(args.stats_json)
+    try:
+        with Stats.phase(args.command):
+            run_subcommand(parser, args)
+    finally:
+        if Stats.enabled:
+            Stats.report()
+            if args.stats_json:
+                Stats.write_json(args.stats_json)
+
+    if args.conn_stats:
+        PrintUtils.connection_stats(RedisUtils.connection_stats())
+
+
+def run_subcommand(parser, args):
+    """
+    서브커맨드 이름에 맞는 커맨드 함수 실행
+    """
     if args.command == "help":
         parser.print_help()
     elif args.command == "create":
-        create(args.nodes, args.replicas, args.password)
+        create(args.nodes, args.replicas, args.password, args.wait_timeout)
     elif args.command == "add-node":
-        add_node(args.new_node, args.existing_node, args.password, args.master_id)
+        add_node(args.new_node, args.existing_node, args.password, args.master_id, args.wait_timeout)
     elif args.command == "reshard":
-        reshard(args.from_node, args.to_node, args.slots, args.pipeline, args.target_node, args.password)
+        reshard(args.from_node, args.to_node, args.slots, args.pipeline, args.target_node, args.password, args.parallel,
+                args.resume, args.journal, args.strategy, args.dry_run, args.max_latency_ms, args.max_mbps, args.probe,
+                args.big_key_bytes, args.force)
+    elif args.command == "rebalance":
+        rebalance(args.target_node, args.password, args.weight, args.pipeline, args.parallel, args.threshold, args.dry_run)
     elif args.command == "del-node":
-        del_node(args.target_node, args.node_id, args.password)
+        del_node(args.target_node, args.node_id, args.password, args.drain, args.pipeline, args.parallel, args.wait_timeout)
     elif args.command == "check":
-        check(args.target_node, args.password)
+        check(args.target_node, args.password, args.connect_timeout, args.read_timeout, args.workers)
     elif args.command == "populate-test-data":
-        populate_test_data(args.node_addr, args.password, args.num_of_keys)
+        workload = WorkloadGenerator(
+            args.num_of_keys, args.data_type, WorkloadGenerator.parse_value_size(args.value_size), args.key_dist, args.zipf_s,
+            args.hot_tags, args.hot_ratio, args.ttl_ratio, WorkloadGenerator.parse_ttl_range(args.ttl), args.elements, args.seed,
+        )
+        populate_test_data(args.node_addr, args.password, args.num_of_keys, args.batch_size, args.workers, workload)
+    elif args.command == "bench":
+        bench(args.target_node, args.password, args.clients, args.duration, args.get_ratio, args.pipeline,
+              args.value_size, args.keyspace, args.seed)
+    elif args.command == "analyze":
+        analyze(args.target_node, args.password, args.count, args.top, args.samples, args.tag_capacity, args.max_keys,
+                args.hot_share, args.json_path)
+    elif args.command == "monitor":
+        monitor(args.target_node, args.password, args.interval, args.count, args.output_format, args.listen,
+                args.nodes_every, args.output, args.timeout)
+    elif args.command == "dump":
+        dump(args.target_node, args.password, args.output, args.slots, args.batch, args.compress_level)
+    elif args.command == "restore":
+        restore(args.target_node, args.password, args.input, args.slots, args.replace, args.pipeline, args.parallel)
+    elif args.command == "copy-cluster":
+        copy_cluster(args.src_node, args.dst_node, args.password, args.dst_password, args.slots, args.batch, args.parallel,
+                     args.window, args.method, args.replace, args.resume, args.journal)
     else:
         print(f"Unknown command: {args.command}")
         sys.exit(1)
\ No newline at end of file
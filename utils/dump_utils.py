@@ -0,0 +1,165 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+
+class DumpFormat:
+    """
+    dump 파일 형식 (모든 정수는 big-endian)
+    - 헤더: MAGIC (8 bytes)
+    - 청크 반복: 청크 헤더(slot, raw_len, stored_len, flags) + 페이로드(stored_len bytes, flags & 1 이면 zlib 압축)
+      페이로드는 레코드의 연속: (key_len, value_len, expire_at) + key + value(DUMP 결과)
+      expire_at은 절대 만료 시각(unix ms), 만료 없음은 -1 (RedisUtils.NO_EXPIRY)
+    - 인덱스: JSON {"slots": {slot: [[offset, stored_len, raw_len, flags, keys], ...]}, ...작업 정보}
+    - 푸터: (인덱스 시작 위치, 인덱스 길이, END_MAGIC)
+    한 슬롯이 여러 청크로 나뉠 수 있으며, 인덱스만 읽으면 원하는 슬롯의 청크로 바로 이동 가능.
+    """
+    MAGIC = b"RCDUMP02"  # 01: 레코드에 남은 TTL(상대 시간) 기록, 02: 절대 만료 시각
+    END_MAGIC = b"RCDUMPIX"
+    CHUNK_HEADER = struct.Struct(">HIIB")
+    RECORD_HEADER = struct.Struct(">IIq")
+    FOOTER = struct.Struct(">QI8s")
+    FLAG_ZLIB = 1
+
+
+class DumpWriter:
+    """
+    여러 스레드에서 슬롯별 레코드 묶음(청크)을 추가하는 dump 파일 작성기.
+    - 인코딩/압축은 호출한 스레드에서 하고, 파일 쓰기와 인덱스 갱신만 잠금 안에서 수행
+    - <path>.part 에 기록 후 close 시 인덱스/푸터를 쓰고 원래 경로로 교체 (중단된 dump가 완성본처럼 보이지 않도록)
+    """
+
+    def __init__(self, path, compress_level=6):
+        self.path = path
+        self.compress_level = compress_level
+        self.slots = {}     # slot → [[offset, stored_len, raw_len, flags, keys]]
+        self.keys = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path + ".part", "wb")
+        self._file.write(DumpFormat.MAGIC)
+
+    def add_chunk(self, slot, records):
+        """
+        [(key, expire_at, value)] 를 slot의 청크 하나로 기록 (key, value는 bytes, expire_at은 unix ms, 만료 없음은 -1)
+        """
+        if not records:
+            return
+        raw = DumpWriter.encode_records(records)
+        payload, flags = raw, 0
+        if self.compress_level:
+            compressed = zlib.compress(raw, self.compress_level)
+            if len(compressed) < len(raw):
+                payload, flags = compressed, DumpFormat.FLAG_ZLIB
+        header = DumpFormat.CHUNK_HEADER.pack(slot, len(raw), len(payload), flags)
+        with self._lock:
+            offset = self._file.tell() + len(header)
+            self._file.write(header)
+            self._file.write(payload)
+            self.slots.setdefault(slot, []).append([offset, len(payload), len(raw), flags, len(records)])
+            self.keys += len(records)
+            self.raw_bytes += len(raw)
+            self.stored_bytes += len(payload)
+
+    @staticmethod
+    def encode_records(records):
+        parts = []
+        for key, expire_at, value in records:
+            parts.append(DumpFormat.RECORD_HEADER.pack(len(key), len(value), expire_at))
+            parts.append(key)
+            parts.append(value)
+        return b"".join(parts)
+
+    def close(self, meta):
+        """
+        인덱스와 푸터를 기록하고 파일 완성. meta는 인덱스에 함께 저장할 작업 정보
+        """
+        index = dict(
+            meta,
+            created_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            compress_level=self.compress_level,
+            keys=self.keys,
+            raw_bytes=self.raw_bytes,
+            slots={str(slot): chunks for slot, chunks in sorted(self.slots.items())},
+        )
+        data = json.dumps(index).encode()
+        with self._lock:
+            index_offset = self._file.tell()
+            self._file.write(data)
+            self._file.write(DumpFormat.FOOTER.pack(index_offset, len(data), DumpFormat.END_MAGIC))
+            self._file.close()
+        os.replace(self.path + ".part", self.path)
+
+    def abort(self):
+        """
+        작성 중이던 .part 파일을 남겨둔 채 닫음 (원래 경로의 기존 파일은 건드리지 않음)
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class DumpReader:
+    """
+    dump 파일을 mmap으로 열어 인덱스를 읽고 슬롯 단위로 레코드를 꺼내는 리더.
+    - 파일 전체를 메모리에 올리지 않고 필요한 청크만 페이지 단위로 읽음
+    - 여러 스레드가 서로 다른 슬롯을 동시에 읽어도 안전 (읽기 전용 매핑)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 파일입니다: {path}")
+        size = len(self._map)
+        if self._map[:len(DumpFormat.MAGIC)] == b"RCDUMP01":
+            self.close()
+            raise ValueError(f"이전 형식(남은 TTL 기록)의 dump 파일은 TTL을 정확히 복원할 수 없어 지원하지 않습니다. 다시 dump 하세요: {path}")
+        if size < len(DumpFormat.MAGIC) + DumpFormat.FOOTER.size or self._map[:len(DumpFormat.MAGIC)] != DumpFormat.MAGIC:
+            self.close()
+            raise ValueError(f"rcctl dump 파일이 아닙니다: {path}")
+        index_offset, index_len, end_magic = DumpFormat.FOOTER.unpack_from(self._map, size - DumpFormat.FOOTER.size)
+        if end_magic != DumpFormat.END_MAGIC or index_offset + index_len > size:
+            self.close()
+            raise ValueError(f"dump 파일의 인덱스가 손상되었습니다 (기록 도중 중단된 파일일 수 있음): {path}")
+        self.index = json.loads(self._map[index_offset:index_offset + index_len])
+        self.chunks = {int(slot): chunks for slot, chunks in self.index.pop("slots").items()}
+
+    def slots(self):
+        return sorted(self.chunks)
+
+    def key_count(self, slot):
+        return sum(chunk[4] for chunk in self.chunks.get(slot, ()))
+
+    def records(self, slot):
+        """
+        slot의 (key, expire_at, value) 를 기록 순서대로 반환하는 제너레이터
+        """
+        for offset, stored_len, raw_len, flags, _ in self.chunks.get(slot, ()):
+            payload = self._map[offset:offset + stored_len]
+            if flags & DumpFormat.FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            if len(payload) != raw_len:
+                raise ValueError(f"슬롯 {slot} 청크(offset {offset})의 길이가 인덱스와 다릅니다.")
+            pos = 0
+            while pos < raw_len:
+                key_len, value_len, expire_at = DumpFormat.RECORD_HEADER.unpack_from(payload, pos)
+                pos += DumpFormat.RECORD_HEADER.size
+                key = payload[pos:pos + key_len]
+                pos += key_len
+                value = payload[pos:pos + value_len]
+                pos += value_len
+                yield key, expire_at, value
+
+    def close(self):
+        self._map.close()
+        self._file.close()
@@ -0,0 +1,71 @@
+class LatencyHistogram:
+    """
+    HDR 방식의 로그-선형 지연 시간 히스토그램 (단위: 마이크로초).
+    - 2의 거듭제곱 구간마다 2^(precision_bits-1)개의 하위 버킷 → 상대 오차 약 1/2^(precision_bits-1)
+    - 기록 개수와 무관하게 메모리 사용량 고정 (버킷 수는 최대값의 로그에 비례)
+    """
+
+    def __init__(self, precision_bits=7):
+        self.bits = precision_bits
+        self.sub = 1 << precision_bits
+        self.half = self.sub >> 1
+        self.counts = []
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.sum = 0
+
+    def record(self, value_us, count=1):
+        value = max(0, int(value_us))
+        idx = self._index(value)
+        if idx >= len(self.counts):
+            self.counts.extend([0] * (idx + 1 - len(self.counts)))
+        self.counts[idx] += count
+        self.total += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """
+        다른 히스토그램의 기록을 합침 (precision_bits가 같아야 함)
+        """
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for idx, count in enumerate(other.counts):
+            self.counts[idx] += count
+        self.total += other.total
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """
+        p(0~100) 백분위 값. 해당 버킷의 대표값(중간값)을 반환하며 실제 최대값을 넘지 않음
+        """
+        if not self.total:
+            return 0
+        target = max(1, -(-self.total * p // 100))
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(idx), self.max)
+        return self.max
+
+    def mean(self):
+        return self.sum / self.total if self.total else 0.0
+
+    def _index(self, value):
+        if value < self.sub:
+            return value
+        shift = value.bit_length() - self.bits
+        return shift * self.half + (value >> shift)
+
+    def _value(self, idx):
+        if idx < self.sub:
+            return idx
+        shift = idx // self.half - 1
+        low = (idx - shift * self.half) << shift
+        return low + (1 << shift) // 2
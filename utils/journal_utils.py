@@ -0,0 +1,73 @@
+import json
+import os
+from utils.string_utils import StringUtils
+
+
+class SlotJournal:
+    """
+    슬롯 단위 작업의 계획/완료 기록 파일.
+    - 첫 줄: 작업 정보와 계획된 슬롯 범위를 담은 JSON 헤더
+    - 이후 줄: 완료된 슬롯 번호 (한 줄에 하나, 완료 즉시 flush)
+    중단된 작업을 다시 실행할 때 이미 끝난 슬롯을 건너뛰기 위해 사용.
+    """
+
+    def __init__(self, path, meta, planned, done=None):
+        self.path = path
+        self.meta = meta
+        self.planned = planned
+        self.done = set(done or [])
+        self._file = None
+
+    @staticmethod
+    def create(path, meta, planned):
+        """
+        새 저널 파일을 만들고 계획된 슬롯을 기록 (기존 파일은 덮어씀)
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        journal = SlotJournal(path, meta, list(planned))
+        header = dict(meta, slots=StringUtils.format_slot_ranges(journal.planned))
+        with open(path, "w") as f:
+            f.write(json.dumps(header) + "\n")
+        return journal
+
+    @staticmethod
+    def load(path):
+        """
+        저널 파일을 읽어 계획/완료 슬롯 복원.
+        마지막 줄이 기록 도중 끊긴 경우(줄바꿈 없음) 해당 줄은 무시하고 파일에서 잘라냄
+        ("123\n"이 "12"까지만 기록되면 슬롯 12를 완료로 오인하고, 이어 쓰는 기록이 끊긴 줄에 붙기 때문)
+        """
+        with open(path, "r+", newline="") as f:
+            header = f.readline()
+            meta = json.loads(header)
+            done, valid = [], len(header)
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                if line[:-1].isdigit():
+                    done.append(int(line[:-1]))
+                valid += len(line)
+            f.truncate(valid)
+        planned = StringUtils.parse_slot_ranges(meta.pop("slots"))
+        return SlotJournal(path, meta, planned, done)
+
+    def pending(self):
+        """
+        계획된 슬롯 중 아직 완료되지 않은 슬롯 (계획 순서 유지)
+        """
+        return [slot for slot in self.planned if slot not in self.done]
+
+    def mark_done(self, slot):
+        """
+        슬롯 완료 기록
+        """
+        if self._file is None:
+            self._file = open(self.path, "a")
+        self._file.write(f"{slot}\n")
+        self._file.flush()
+        self.done.add(slot)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -11,12 +11,25 @@ class PrintUtils:
             print(f"    - {idx}/{total}. Redis node at {host}:{port}")
             pool.release(connection)  # 커넥션 반환
 
+    @staticmethod
+    def print_addrs_info(addrs, label):
+        total = len(addrs)
+        print(f"  {label}로 지정될 노드 (총 {total}개):")
+        for idx, addr in enumerate(addrs, start=1):
+            print(f"    - {idx}/{total}. Redis node at {addr}")
+
     @staticmethod
     def node_str(node):
         host = node.connection_pool.connection_kwargs["host"]
         port = node.connection_pool.connection_kwargs["port"]
         return f"{host}:{port}"
 
+    @staticmethod
+    def connection_stats(stats):
+        print(f"\n🔌 연결 통계: 노드 {stats['nodes']}개, 클라이언트 생성 {stats['clients_created']}회 / 재사용 {stats['clients_reused']}회, "
+              f"헬스 체크 {stats['health_checks']}회, broadcast 클라이언트 생성 {stats['async_clients_created']}회 / "
+              f"재사용 {stats['async_clients_reused']}회, TCP 연결 {stats['connections_opened']}개")
+
 
 
 
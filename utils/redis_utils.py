@@ -1,6 +1,17 @@
+import asyncio
+import atexit
+import os
 import redis
+import redis.asyncio as aioredis
 import sys
+import threading
+import time
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
 from utils.print_utils import PrintUtils
+from utils.string_utils import StringUtils
+from utils.stats_utils import Stats
+from tqdm import tqdm
 
 class RedisUtils:
     TOTAL_SLOTS = 16384  # Redis 클러스터에서 사용할 수 있는 총 슬롯 개수
@@ -8,14 +19,23 @@ class RedisUtils:
     CLUSTER_MYID = "CLUSTER MYID"
     CLUSTER_REPLICATE = "CLUSTER REPLICATE"
     CLUSTER_ADDSLOTS = "CLUSTER ADDSLOTS"
+    CLUSTER_ADDSLOTSRANGE = "CLUSTER ADDSLOTSRANGE"
     CLUSTER_NODES = "CLUSTER NODES"
+    CLUSTER_INFO = "CLUSTER INFO"
     CLUSTER_FORGET = "CLUSTER FORGET"
     CLUSTER_RESET = "CLUSTER RESET"
     CLUSTER_RESET_HARD = "CLUSTER RESET HARD"
     CLUSTER_FAILOVER = "CLUSTER FAILOVER"
     CLUSTER_SETSLOT = "CLUSTER SETSLOT"
     CLUSTER_GETKEYSINSLOT = "CLUSTER GETKEYSINSLOT"
+    CLUSTER_COUNTKEYSINSLOT = "CLUSTER COUNTKEYSINSLOT"
+    MEMORY_USAGE = "MEMORY USAGE"
+    TYPE = "TYPE"
     MIGRATE = "MIGRATE"
+    DUMP = "DUMP"
+    PTTL = "PTTL"
+    RESTORE = "RESTORE"
+    NO_EXPIRY = -1  # dump_keys / restore_keys의 만료 시각 자리에서 "만료 없음"
     
     # Command
     @staticmethod
@@ -38,6 +58,10 @@ class RedisUtils:
     def cluster_nodes(r):
         return r.execute_command(RedisUtils.CLUSTER_NODES)
     
+    @staticmethod
+    def cluster_info(r):
+        return r.execute_command(RedisUtils.CLUSTER_INFO)
+    
     @staticmethod
     def cluster_forget(r, node_id):
         return r.execute_command(RedisUtils.CLUSTER_FORGET, node_id)
@@ -85,6 +109,108 @@ class RedisUtils:
         """
         return conn.execute_command(RedisUtils.CLUSTER_GETKEYSINSLOT, slot, count)
     
+    @staticmethod
+    def get_raw_keys_in_slot(conn, slot, count):
+        """
+        get_keys_in_slot과 같지만 키를 bytes 그대로 반환 (decode_responses=False 연결에서 바이너리 키 보존용).
+        "CLUSTER GETKEYSINSLOT" 이름에 등록된 redis-py 응답 콜백이 키를 str로 바꾸므로 명령 이름을 나눠 전송
+        """
+        return conn.execute_command("CLUSTER", "GETKEYSINSLOT", slot, count)
+
+    @staticmethod
+    def count_keys_in_slots(conn, slots, batch_size=1000):
+        """
+        여러 슬롯의 키 개수를 파이프라인으로 조회 (batch_size개 슬롯당 왕복 1회)
+        {slot: 키 개수} 반환
+        """
+        counts = {}
+        slots = list(slots)
+        for i in range(0, len(slots), batch_size):
+            chunk = slots[i:i + batch_size]
+            pipe = conn.pipeline(transaction=False)
+            for slot in chunk:
+                pipe.execute_command(RedisUtils.CLUSTER_COUNTKEYSINSLOT, slot)
+            counts.update(zip(chunk, pipe.execute()))
+        return counts
+
+    @staticmethod
+    def memory_usage_keys(conn, keys):
+        """
+        여러 키의 MEMORY USAGE(bytes)를 파이프라인으로 조회. 그 사이 삭제된 키는 0
+        """
+        pipe = conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command(RedisUtils.MEMORY_USAGE, key)
+        return [usage or 0 for usage in pipe.execute()]
+
+    @staticmethod
+    def memory_usage_and_types(conn, keys, samples=5):
+        """
+        여러 키의 MEMORY USAGE(bytes, SAMPLES samples)와 TYPE을 파이프라인 한 번으로 조회.
+        [(bytes, type)] 반환, 그 사이 삭제되었거나 조회에 실패한 키는 (None, None)
+        """
+        pipe = conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command(RedisUtils.MEMORY_USAGE, key, "SAMPLES", samples)
+            pipe.execute_command(RedisUtils.TYPE, key)
+        results = pipe.execute(raise_on_error=False)
+        pairs = []
+        for usage, key_type in zip(results[0::2], results[1::2]):
+            if isinstance(usage, Exception) or isinstance(key_type, Exception) or usage is None or key_type == "none":
+                pairs.append((None, None))
+            else:
+                pairs.append((usage, key_type))
+        return pairs
+
+    @staticmethod
+    def dump_keys(conn, keys):
+        """
+        여러 키의 DUMP 페이로드와 PTTL을 파이프라인 한 번으로 조회.
+        [(key, expire_at, payload)] 반환, 그 사이 삭제/만료된 키는 제외
+        - expire_at: 절대 만료 시각(unix ms, 파이프라인 전송 직전 시각 + PTTL), 만료 없음은 NO_EXPIRY
+        파일에 보관하거나 복사하는 동안 흐른 시간만큼 TTL이 늘어나지 않도록 절대 시각으로 기록.
+        """
+        now_ms = int(time.time() * 1000)
+        pipe = conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.execute_command(RedisUtils.DUMP, key)
+            pipe.execute_command(RedisUtils.PTTL, key)
+        results = pipe.execute()
+        records = []
+        for key, payload, pttl in zip(keys, results[0::2], results[1::2]):
+            if payload is None or pttl == -2:
+                continue
+            records.append((key, RedisUtils.NO_EXPIRY if pttl < 0 else now_ms + pttl, payload))
+        return records
+
+    @staticmethod
+    def restore_keys(conn, records, replace=False):
+        """
+        [(key, expire_at, payload)] 를 RESTORE 파이프라인 한 번으로 복원.
+        expire_at(unix ms)은 RESTORE ... ABSTTL 로 그대로 설정하고, NO_EXPIRY는 만료 없이 복원.
+        키별 결과("OK" 또는 예외 객체) 목록 반환 (이미 만료된 키는 호출 측에서 걸러서 전달)
+        """
+        pipe = conn.pipeline(transaction=False)
+        for key, expire_at, payload in records:
+            if expire_at == RedisUtils.NO_EXPIRY:
+                cmd = [RedisUtils.RESTORE, key, 0, payload]
+            else:
+                cmd = [RedisUtils.RESTORE, key, expire_at, payload, "ABSTTL"]
+            if replace:
+                cmd.append("REPLACE")
+            pipe.execute_command(*cmd)
+        return pipe.execute(raise_on_error=False)
+
+    @staticmethod
+    def exists_keys(conn, keys):
+        """
+        여러 키의 존재 여부를 파이프라인 한 번으로 조회. [bool] 반환
+        """
+        pipe = conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(key)
+        return [bool(n) for n in pipe.execute()]
+
     @staticmethod
     def migrate_key(from_conn, to_host, to_port, key, password, timeout=60000): 
         """
@@ -101,7 +227,34 @@ class RedisUtils:
         ]
         if password:
             migrate_cmd += ["AUTH", password]
-        from_conn.execute_command(*migrate_cmd)
+        if from_conn.execute_command(*migrate_cmd) != "NOKEY":
+            Stats.record(keys_moved=1)
+
+    @staticmethod
+    def migrate_keys(from_conn, to_host, to_port, keys, password, timeout=60000, copy=False, replace=False):
+        """
+        여러 키를 한 번의 MIGRATE 호출로 대상 Redis로 이동 (MIGRATE host port "" 0 timeout [COPY] [REPLACE] [AUTH pw] KEYS k1..kn)
+        - 키 수와 무관하게 왕복(RTT) 1회
+        - 중간 키에서 실패하면 그 이전 키들은 이미 이동된 상태로 예외 발생
+        - copy: 소스의 키를 지우지 않음, replace: 대상에 같은 키가 있으면 덮어씀 (없으면 BUSYKEY 오류)
+        """
+        migrate_cmd = [
+            RedisUtils.MIGRATE,
+            to_host,
+            to_port,
+            "",  # 다중 키 모드에서는 key 자리에 빈 문자열
+            0, # db
+            timeout
+        ]
+        if copy:
+            migrate_cmd.append("COPY")
+        if replace:
+            migrate_cmd.append("REPLACE")
+        if password:
+            migrate_cmd += ["AUTH", password]
+        migrate_cmd += ["KEYS", *keys]
+        if from_conn.execute_command(*migrate_cmd) not in ("NOKEY", b"NOKEY"):
+            Stats.record(keys_moved=len(keys))
 
     @staticmethod
     def force_failover(conn):
@@ -119,29 +272,51 @@ class RedisUtils:
 
     # redis 연결 객체 생성
     @staticmethod   
-    def create_redis_with_pool(host, port, password):
-        pool = redis.ConnectionPool(host=host, port=port, password=password, decode_responses=True)
+    def create_redis_with_pool(host, port, password, connect_timeout=None, read_timeout=None, decode_responses=True):
+        pool = redis.ConnectionPool(
+            connection_class=InstrumentedConnection,
+            host=host,
+            port=port,
+            password=password,
+            socket_connect_timeout=connect_timeout,
+            socket_timeout=read_timeout,
+            decode_responses=decode_responses
+        )
         return redis.Redis(connection_pool=pool)
     
     @staticmethod
-    def connect_node(host, port, password):
+    def connect_node(host, port, password, connect_timeout=None, read_timeout=None, decode_responses=True):
         """
         주어진 호스트, 포트, 비밀번호를 사용하여 Redis 노드에 연결 + Redis 인스턴스(= Redis Client) 반환
+        - connect_timeout / read_timeout: 연결 / 응답 대기 제한 시간(초), None이면 제한 없음
+        - decode_responses: False이면 응답을 bytes 그대로 반환 (DUMP 페이로드, 바이너리 키 처리용)
         """
-        r = redis.Redis(
-            host=host,
-            port=port,
-            password=password,
-            decode_responses=True  # Redis에서 조회한 문자열을 bytes가 아닌 str로 반환
-        )
-        
         try:
-            r.ping()
+            return RedisUtils.try_connect_node(host, port, password, connect_timeout, read_timeout, decode_responses)
         except redis.exceptions.RedisError as e:
             print(f"❌ Redis 연결 실패: {e}")
             sys.exit(1)
-        
-        return r
+
+    @staticmethod
+    def try_connect_node(host, port, password, connect_timeout=None, read_timeout=None, decode_responses=True):
+        """
+        connect_node와 같지만 연결 실패 시 종료하지 않고 RedisError를 그대로 발생
+        (여러 노드를 점검하며 실패한 노드만 따로 보고할 때 사용)
+
+        프로세스 안에서 host:port마다 커넥션 풀을 가진 Redis 인스턴스를 하나만 만들어 재사용 (ConnectionRegistry).
+        - PING 헬스 체크는 노드당 처음 한 번만 수행
+        - 타임아웃은 해당 노드에 처음 연결할 때의 값을 사용
+        - 여러 스레드에서 같은 인스턴스를 써도 명령마다 풀에서 서로 다른 연결을 사용
+        - decode_responses 값이 다르면 같은 노드라도 별도 인스턴스
+        """
+        return ConnectionRegistry.get(host, port, password, connect_timeout, read_timeout, decode_responses)
+
+    @staticmethod
+    def connection_stats():
+        """
+        이번 실행에서 생성/재사용한 연결 통계
+        """
+        return ConnectionRegistry.stats()
 
     
     @staticmethod
@@ -166,10 +341,393 @@ class RedisUtils:
             sys.exit(1)
         
     
-    # 버전 체크
+    # 여러 노드에 같은 명령 동시 실행
+    @staticmethod
+    def broadcast(nodes, command, password, timeout=5.0, retries=1, concurrency=256, connect_timeout=None):
+        """
+        broadcast_async의 동기 버전 (동기 커맨드 코드에서 호출)
+        AsyncClientPool의 이벤트 루프에서 실행하므로 호출이 여러 번이어도 노드별 연결을 재사용
+        """
+        return AsyncClientPool.run(RedisUtils.broadcast_async(nodes, command, password, timeout, retries, concurrency, connect_timeout))
+
+    @staticmethod
+    async def broadcast_async(nodes, command, password, timeout=5.0, retries=1, concurrency=256, connect_timeout=None):
+        """
+        여러 노드에 명령을 redis.asyncio로 동시에 실행 (노드 수와 관계없이 약 RTT 1회)
+        - nodes: "ip:port" 목록
+        - command: 모든 노드에 보낼 명령 인자 튜플, 또는 노드 주소를 받아 인자 튜플을 돌려주는 함수 (노드마다 인자가 다를 때)
+        - timeout: 노드별 응답 제한 시간(초), connect_timeout: 연결 제한 시간(초, 기본: timeout)
+        - retries: 연결·타임아웃 오류 시 재시도 횟수 (응답 오류는 재시도 안 함)
+        - concurrency: 동시에 연결할 최대 노드 수
+        노드별 클라이언트는 AsyncClientPool에서 가져오므로 AsyncClientPool의 이벤트 루프에서 실행해야 함 (broadcast 사용).
+        nodes 순서대로 BroadcastResult 목록 반환 (실패해도 예외를 던지지 않음)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        connect_timeout = timeout if connect_timeout is None else connect_timeout
+
+        async def run(addr):
+            args = command(addr) if callable(command) else command
+            host, port = StringUtils.parse_node(addr)
+            started = time.perf_counter()
+            error = None
+            attempts = 0
+            async with semaphore:
+                client = AsyncClientPool.get(host, port, password, connect_timeout)
+                while attempts <= retries:
+                    attempts += 1
+                    try:
+                        # 비동기 클라이언트는 InstrumentedConnection을 거치지 않으므로 직접 기록 (바이트는 RESP 크기 추정치)
+                        Stats.record([Stats.command_name(args)], round_trips=1, bytes_sent=RedisUtils._resp_size(args))
+                        # 시간 초과로 취소되면 redis-py가 연결을 끊으므로, 다음 명령은 새 연결로 보냄
+                        value = await asyncio.wait_for(client.execute_command(*args), connect_timeout + timeout)
+                        Stats.record(bytes_received=len(str(value)))
+                        return BroadcastResult(addr, value, None, time.perf_counter() - started, attempts)
+                    except redis.exceptions.ResponseError as e:
+                        error = e
+                        break
+                    except (redis.exceptions.RedisError, asyncio.TimeoutError, OSError) as e:
+                        error = e if str(e) else TimeoutError(f"{connect_timeout + timeout}초 안에 응답 없음")
+            return BroadcastResult(addr, None, error, time.perf_counter() - started, attempts)
+
+        return await asyncio.gather(*(run(addr) for addr in nodes))
+
+    # 클러스터 상태 수렴 대기
+    @staticmethod
+    def wait_for_convergence(nodes, password, expected_nodes=None, require_ok=True, timeout=30.0, interval=0.1):
+        """
+        모든 노드에 CLUSTER INFO를 반복 전송해 클러스터 상태가 수렴할 때까지 대기
+        - 모든 노드의 cluster_known_nodes가 expected_nodes(기본: len(nodes))와 같고
+        - require_ok이면 모든 노드의 cluster_state가 ok이며
+        - 모든 노드의 cluster_current_epoch, cluster_slots_assigned가 서로 같으면 수렴으로 판단
+        - timeout(초) 안에 수렴하지 않으면 마지막 상태를 출력하고 False 반환
+        폴링마다 broadcast의 노드별 클라이언트(AsyncClientPool)를 재사용하므로 노드당 연결은 한 번만 맺음.
+        fail/noaddr 노드는 응답하지 않으므로 nodes에서 빼고 expected_nodes에는 포함해 전달 (reachable_nodes 참고)
+        """
+        expected_nodes = len(nodes) if expected_nodes is None else expected_nodes
+        started = time.perf_counter()
+        deadline = started + timeout
+        lagging = []
+        with tqdm(total=len(nodes), desc="    - 수렴 대기", ncols=70) as bar:
+            while True:
+                results = RedisUtils.broadcast(nodes, (RedisUtils.CLUSTER_INFO,), password, timeout=min(5.0, timeout), retries=0)
+                lagging = RedisUtils._lagging_nodes(results, expected_nodes, require_ok)
+                bar.n = len(nodes) - len(lagging)
+                bar.refresh()
+                if not lagging:
+                    break
+                if time.perf_counter() + interval > deadline:
+                    break
+                time.sleep(interval)
+
+        elapsed = time.perf_counter() - started
+        if lagging:
+            PrintUtils.warn(f"{timeout}초 안에 클러스터 상태가 수렴하지 않았습니다 (미수렴 노드 {len(lagging)}개)")
+            for addr, reason in lagging[:10]:
+                print(f"    - {addr}: {reason}")
+            return False
+        print(f"    - 클러스터 상태 수렴 완료 ({elapsed:.2f}초)")
+        return True
+
+    @staticmethod
+    def reachable_nodes(nodes_dict):
+        """
+        CLUSTER NODES 결과에서 수렴 대기에 포함할 노드 주소 목록
+        fail, fail?, noaddr 플래그가 있거나 링크가 disconnected인 노드는 응답하지 않으므로 제외
+        """
+        addrs = []
+        for addr, info in nodes_dict.items():
+            flags = info.get("flags", "")
+            flags = flags.split(",") if isinstance(flags, str) else list(flags)
+            if any(flag in ("fail", "fail?", "noaddr") for flag in flags) or not info.get("connected", True):
+                continue
+            addrs.append(addr)
+        return addrs
+
+    @staticmethod
+    def _lagging_nodes(results, expected_nodes, require_ok):
+        """
+        CLUSTER INFO 결과 중 수렴 조건을 만족하지 않는 노드의 [(addr, 이유)] 목록
+        epoch/슬롯 수는 가장 많은 노드가 가진 값을 기준으로 비교
+        """
+        infos = {r.addr: r.value for r in results if r.ok}
+        lagging = [(r.addr, f"응답 없음 ({r.error})") for r in results if not r.ok]
+        if not infos:
+            return lagging
+        values = [(str(info.get("cluster_current_epoch")), str(info.get("cluster_slots_assigned"))) for info in infos.values()]
+        majority = max(set(values), key=values.count)
+        for addr, info in infos.items():
+            known = int(info.get("cluster_known_nodes", 0))
+            if known != expected_nodes:
+                lagging.append((addr, f"인식 노드 {known}/{expected_nodes}"))
+            elif require_ok and info.get("cluster_state") != "ok":
+                lagging.append((addr, f"cluster_state:{info.get('cluster_state')}"))
+            elif (str(info.get("cluster_current_epoch")), str(info.get("cluster_slots_assigned"))) != majority:
+                lagging.append((addr, f"epoch {info.get('cluster_current_epoch')} / 슬롯 {info.get('cluster_slots_assigned')} 불일치"))
+        return lagging
+
+    @staticmethod
+    def _resp_size(args):
+        """
+        명령 인자를 RESP 배열로 보냈을 때의 바이트 수
+        """
+        size = len(f"*{len(args)}\r\n")
+        for arg in args:
+            length = len(arg if isinstance(arg, bytes) else str(arg).encode())
+            size += len(f"${length}\r\n") + length + 2
+        return size
+
+        # 버전 체크
     @staticmethod
     def redis_version():
         """
         현재 설치된 redis-py 라이브러리의 버전을 출력합니다.
         """
-        print(redis.__version__)
\ No newline at end of file
+        print(redis.__version__)
+
+
+class BroadcastResult:
+    """
+    RedisUtils.broadcast의 노드별 결과 (addr, 응답 value 또는 error, 소요 시간 elapsed(초), 시도 횟수 attempts)
+    """
+
+    def __init__(self, addr, value, error, elapsed, attempts):
+        self.addr = addr
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+        self.attempts = attempts
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class InstrumentedConnection(redis.Connection):
+    """
+    실제로 맺어진 TCP(+AUTH) 연결 수를 세고, Stats가 켜져 있으면 명령/왕복/송수신 바이트를 기록하는 Connection
+    - 연결: 소켓을 새로 만들 때(_connect) 1회 (redis-py 버전에 따라 on_connect를 거치지 않으므로 소켓 기준)
+    - 명령: send_command / pack_commands에서 명령 이름별로 집계 (파이프라인은 명령마다 1회)
+    - 왕복: send_packed_command 1회 = 1회 (파이프라인 전체가 1회)
+    - 바이트: 소켓의 sendall / recv 크기
+    """
+    opened = 0
+    _lock = threading.Lock()
+
+    def _connect(self):
+        sock = super()._connect()
+        with InstrumentedConnection._lock:
+            InstrumentedConnection.opened += 1
+        if not Stats.enabled:
+            return sock
+        Stats.record(connections_opened=1)
+        return CountingSocket(sock)
+
+    def send_command(self, *args, **kwargs):
+        if Stats.enabled:
+            Stats.record([Stats.command_name(args)])
+        return super().send_command(*args, **kwargs)
+
+    def pack_commands(self, commands):
+        if Stats.enabled:
+            Stats.record([Stats.command_name(args) for args in commands])
+        return super().pack_commands(commands)
+
+    def send_packed_command(self, command, check_health=True):
+        if Stats.enabled:
+            Stats.record(round_trips=1)
+        return super().send_packed_command(command, check_health)
+
+
+class InstrumentedAsyncConnection(aioredis.Connection):
+    """
+    broadcast용 비동기 연결. 실제로 맺어진 TCP(+AUTH) 연결 수를 셈 (명령/바이트는 broadcast_async가 기록)
+    """
+    opened = 0
+
+    async def _connect(self):
+        await super()._connect()
+        InstrumentedAsyncConnection.opened += 1  # AsyncClientPool의 루프 스레드에서만 호출되므로 잠금 불필요
+        Stats.record(connections_opened=1)
+
+
+class CountingSocket:
+    """
+    송수신 바이트를 Stats에 기록하는 소켓 래퍼 (나머지 속성은 원래 소켓에 위임)
+    """
+
+    def __init__(self, sock):
+        self._sock = sock
+
+    def sendall(self, data, *args):
+        Stats.record(bytes_sent=len(data))
+        return self._sock.sendall(data, *args)
+
+    def recv(self, *args):
+        data = self._sock.recv(*args)
+        Stats.record(bytes_received=len(data))
+        return data
+
+    def recv_into(self, buffer, *args):
+        n = self._sock.recv_into(buffer, *args)
+        Stats.record(bytes_received=n)
+        return n
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+class ConnectionRegistry:
+    """
+    프로세스 단위 Redis 클라이언트 레지스트리 ("host:port" 또는 바이트 응답용 "host:port/raw" → redis.Redis)
+    """
+    _clients = {}
+    _locks = {}
+    _lock = threading.Lock()
+    _counters = {"clients_created": 0, "clients_reused": 0, "health_checks": 0}
+
+    @staticmethod
+    def get(host, port, password, connect_timeout=None, read_timeout=None, decode_responses=True):
+        key = f"{host}:{port}" if decode_responses else f"{host}:{port}/raw"
+        with ConnectionRegistry._lock:
+            client = ConnectionRegistry._clients.get(key)
+            if client is not None:
+                ConnectionRegistry._counters["clients_reused"] += 1
+                return client
+            node_lock = ConnectionRegistry._locks.setdefault(key, threading.Lock())
+
+        # 같은 노드에 대한 생성/헬스 체크는 한 스레드만 수행 (다른 노드는 동시에 진행)
+        with node_lock:
+            with ConnectionRegistry._lock:
+                client = ConnectionRegistry._clients.get(key)
+                if client is not None:
+                    ConnectionRegistry._counters["clients_reused"] += 1
+                    return client
+                ConnectionRegistry._counters["health_checks"] += 1
+
+            client = RedisUtils.create_redis_with_pool(host, port, password, connect_timeout, read_timeout, decode_responses)
+            client.ping()  # 실패하면 등록하지 않으므로 다음 호출에서 다시 시도
+
+            with ConnectionRegistry._lock:
+                ConnectionRegistry._clients[key] = client
+                ConnectionRegistry._counters["clients_created"] += 1
+            return client
+
+    @staticmethod
+    def stats():
+        """
+        동기 클라이언트와 broadcast용 비동기 클라이언트(AsyncClientPool)를 합친 연결 통계
+        """
+        async_stats = AsyncClientPool.stats()
+        with ConnectionRegistry._lock:
+            nodes = {key.split("/")[0] for key in ConnectionRegistry._clients} | async_stats.pop("addrs")
+            return dict(ConnectionRegistry._counters, nodes=len(nodes), **async_stats,
+                        connections_opened=InstrumentedConnection.opened + InstrumentedAsyncConnection.opened)
+
+    @staticmethod
+    def reset():
+        """
+        등록된 클라이언트의 연결을 모두 닫고 비움 (같은 주소로 노드를 다시 띄우는 벤치마크 등에서 사용)
+        """
+        with ConnectionRegistry._lock:
+            clients = list(ConnectionRegistry._clients.values())
+            ConnectionRegistry._clients.clear()
+        for client in clients:
+            client.connection_pool.disconnect()
+        AsyncClientPool.close()
+
+
+class AsyncClientPool:
+    """
+    broadcast용 프로세스 단위 redis.asyncio 클라이언트 풀 ("host:port" → 단일 연결 클라이언트)
+    - 전용 스레드의 이벤트 루프 하나에서 모든 broadcast를 실행하므로, 호출이 달라도 노드별 연결(TCP+AUTH)을 재사용
+    - 연결은 처음 명령을 보낼 때 맺고, 오류로 끊긴 연결은 다음 명령에서 다시 맺음
+    - 연결 제한 시간은 해당 노드에 처음 연결할 때의 값을 사용 (응답 제한 시간은 broadcast 호출마다 적용)
+    - 프로그램 종료 시(atexit)와 ConnectionRegistry.reset()에서 모두 닫음
+    """
+    _loop = None
+    _thread = None
+    _clients = {}
+    _lock = threading.Lock()
+    _counters = {"async_clients_created": 0, "async_clients_reused": 0}
+
+    @staticmethod
+    def run(coro):
+        """
+        코루틴을 풀의 이벤트 루프에서 실행하고 결과 반환 (루프 스레드는 처음 호출 시 시작)
+        """
+        with AsyncClientPool._lock:
+            if AsyncClientPool._loop is None:
+                AsyncClientPool._loop = asyncio.new_event_loop()
+                AsyncClientPool._thread = threading.Thread(target=AsyncClientPool._loop.run_forever,
+                                                           name="broadcast-loop", daemon=True)
+                AsyncClientPool._thread.start()
+            loop = AsyncClientPool._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    @staticmethod
+    def get(host, port, password, connect_timeout=None):
+        """
+        host:port 노드의 클라이언트 반환 (없으면 생성). 풀의 이벤트 루프 안에서만 호출
+        """
+        key = f"{host}:{port}"
+        client = AsyncClientPool._clients.get(key)
+        if client is not None:
+            AsyncClientPool._counters["async_clients_reused"] += 1
+            return client
+        pool = aioredis.ConnectionPool(
+            connection_class=InstrumentedAsyncConnection,
+            host=host,
+            port=port,
+            password=password,
+            socket_connect_timeout=connect_timeout,
+            retry=Retry(NoBackoff(), 0),
+            decode_responses=True
+        )
+        client = aioredis.Redis(connection_pool=pool, single_connection_client=True)
+        AsyncClientPool._clients[key] = client
+        AsyncClientPool._counters["async_clients_created"] += 1
+        return client
+
+    @staticmethod
+    def stats():
+        with AsyncClientPool._lock:
+            return dict(AsyncClientPool._counters, addrs=set(AsyncClientPool._clients))
+
+    @staticmethod
+    def close():
+        """
+        모든 클라이언트의 연결을 닫고 루프 스레드 종료
+        """
+        with AsyncClientPool._lock:
+            loop, thread = AsyncClientPool._loop, AsyncClientPool._thread
+            if loop is None:
+                return
+            clients = list(AsyncClientPool._clients.values())
+            AsyncClientPool._clients = {}
+            AsyncClientPool._loop = AsyncClientPool._thread = None
+
+        async def close_all():
+            for client in clients:
+                await client.aclose()
+                await client.connection_pool.disconnect()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout=5)
+        except Exception:
+            pass  # 종료 중 닫기 실패는 무시
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+
+    @staticmethod
+    def _after_fork():
+        # fork된 자식 프로세스(populate 워커 등)에는 루프 스레드가 없고, 부모의 잠금이 잡힌 채 복사됐을 수 있으므로
+        # 부모의 루프/클라이언트는 버리고 처음 호출 시 새로 시작
+        AsyncClientPool._lock = threading.Lock()
+        AsyncClientPool._loop = AsyncClientPool._thread = None
+        AsyncClientPool._clients = {}
+
+
+atexit.register(AsyncClientPool.close)
+os.register_at_fork(after_in_child=AsyncClientPool._after_fork)
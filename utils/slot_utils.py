@@ -0,0 +1,149 @@
+from array import array
+
+
+class SlotMap:
+    """
+    16384개 슬롯의 소유 노드를 담는 고정 크기 배열 기반 슬롯 맵.
+    - 슬롯마다 소유 노드 인덱스(2 bytes)만 저장하고, 인덱스 → node_id / 주소는 별도 목록으로 관리
+    - 범위 압축, 커버리지/중복 소유 조회, MIGRATING/IMPORTING 슬롯 추적, 두 맵의 차이 계산 지원
+    check, reshard, rebalance, create 등 모든 커맨드가 같은 방식으로 슬롯 소유 정보를 해석하기 위해 사용.
+    """
+    TOTAL_SLOTS = 16384
+    UNASSIGNED = -1
+
+    def __init__(self):
+        self.owners = array("h", [SlotMap.UNASSIGNED]) * SlotMap.TOTAL_SLOTS
+        self.node_ids = []      # 인덱스 → node_id
+        self.addrs = {}         # node_id → "ip:port"
+        self.overlaps = {}      # slot → 먼저 기록된 소유자 외에 같은 슬롯을 주장한 node_id 집합
+        self.open_slots = {}    # slot → {"state": migrating/importing, "node_id": 보고한 노드, "peer": 상대 노드}
+        self._index = {}        # node_id → 인덱스
+
+    @staticmethod
+    def from_cluster_nodes(nodes_dict):
+        """
+        CLUSTER NODES 결과(dict)로 슬롯 맵 생성.
+        MIGRATING/IMPORTING 정보는 각 노드 자신의 줄(myself)에만 표시되므로, 응답한 노드의 것만 기록됨.
+        """
+        slot_map = SlotMap()
+        for addr, info in nodes_dict.items():
+            node_id = info.get("node_id")
+            slot_map.add_node(node_id, addr)
+            for slot_range in info.get("slots", []):
+                slot_map.assign(int(slot_range[0]), int(slot_range[-1]), node_id)
+            for migration in info.get("migrations", []):
+                slot_map.open_slots[int(migration["slot"])] = {
+                    "state": migration["state"],
+                    "node_id": node_id,
+                    "peer": migration["node_id"],
+                }
+        return slot_map
+
+    def add_node(self, node_id, addr=None):
+        """
+        노드를 등록하고 인덱스 반환 (이미 있으면 기존 인덱스)
+        """
+        if node_id not in self._index:
+            self._index[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+        if addr:
+            self.addrs[node_id] = addr
+        return self._index[node_id]
+
+    def assign(self, start, end, node_id):
+        """
+        [start, end] 슬롯을 node_id 소유로 기록. 이미 다른 노드가 소유한 슬롯은 overlaps에 기록
+        """
+        idx = self.add_node(node_id)
+        owners = self.owners
+        for slot in range(start, end + 1):
+            current = owners[slot]
+            if current == SlotMap.UNASSIGNED:
+                owners[slot] = idx
+            elif current != idx:
+                self.overlaps.setdefault(slot, set()).add(node_id)
+
+    def owner(self, slot):
+        """
+        슬롯 소유 node_id (미할당이면 None)
+        """
+        idx = self.owners[slot]
+        return None if idx == SlotMap.UNASSIGNED else self.node_ids[idx]
+
+    def owner_addr(self, slot):
+        """
+        슬롯 소유 노드 주소 (미할당이면 None)
+        """
+        return self.addrs.get(self.owner(slot))
+
+    def owner_addrs(self):
+        """
+        슬롯 번호로 바로 조회할 수 있는 소유 노드 주소 리스트 (길이 16384, 미할당은 None)
+        """
+        addr_of = [self.addrs.get(node_id) for node_id in self.node_ids]
+        return [None if idx == SlotMap.UNASSIGNED else addr_of[idx] for idx in self.owners]
+
+    def slots_of(self, node_id):
+        """
+        node_id가 소유한 슬롯 번호 리스트 (오름차순)
+        """
+        idx = self._index.get(node_id)
+        if idx is None:
+            return []
+        return [slot for slot, owner in enumerate(self.owners) if owner == idx]
+
+    def count_of(self, node_id):
+        idx = self._index.get(node_id)
+        return 0 if idx is None else self.owners.count(idx)
+
+    def counts(self):
+        """
+        {node_id: 소유 슬롯 수} (슬롯이 없는 노드 포함)
+        """
+        counts = [0] * len(self.node_ids)
+        for idx in self.owners:
+            if idx != SlotMap.UNASSIGNED:
+                counts[idx] += 1
+        return dict(zip(self.node_ids, counts))
+
+    def ranges_of(self, node_id):
+        """
+        node_id가 소유한 슬롯을 [(start, end)] 범위로 압축
+        """
+        return [(start, end) for start, end, owner in self.ranges() if owner == node_id]
+
+    def ranges(self):
+        """
+        전체 슬롯을 같은 소유자끼리 연속 구간으로 압축한 [(start, end, node_id 또는 None)]
+        """
+        result = []
+        start = 0
+        for slot in range(1, SlotMap.TOTAL_SLOTS + 1):
+            if slot == SlotMap.TOTAL_SLOTS or self.owners[slot] != self.owners[start]:
+                result.append((start, slot - 1, self.owner(start)))
+                start = slot
+        return result
+
+    def unassigned(self):
+        """
+        어느 노드도 소유하지 않은 슬롯 번호 리스트
+        """
+        return [slot for slot, owner in enumerate(self.owners) if owner == SlotMap.UNASSIGNED]
+
+    def is_fully_covered(self):
+        return SlotMap.UNASSIGNED not in self.owners
+
+    def diff(self, other):
+        """
+        self → other 로 소유자가 바뀐 슬롯을 [(start, end, 이전 node_id, 새 node_id)] 범위로 반환
+        """
+        result = []
+        for slot in range(SlotMap.TOTAL_SLOTS):
+            before, after = self.owner(slot), other.owner(slot)
+            if before == after:
+                continue
+            if result and result[-1][1] == slot - 1 and result[-1][2:] == (before, after):
+                result[-1] = (result[-1][0], slot, before, after)
+            else:
+                result.append((slot, slot, before, after))
+        return result
@@ -0,0 +1,176 @@
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class PhaseStats:
+    """
+    한 단계(phase)의 계측 결과
+    - wall: 소요 시간(초), commands: 명령 이름별 호출 수, round_trips: 서버 왕복 수
+    - bytes_sent / bytes_received: 소켓으로 주고받은 바이트 수
+    - keys_moved: MIGRATE로 옮긴 키 수, connections_opened: 새로 맺은 TCP 연결 수
+    하위 단계의 값은 상위 단계에도 함께 더해짐 (상위 단계 값 = 하위 단계 포함 합계)
+    """
+
+    COUNTERS = ("round_trips", "bytes_sent", "bytes_received", "keys_moved", "connections_opened")
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.wall = 0.0
+        self.commands = Counter()
+        self.counters = dict.fromkeys(PhaseStats.COUNTERS, 0)
+
+    def add(self, delta):
+        self.commands.update(delta["commands"])
+        for field in PhaseStats.COUNTERS:
+            self.counters[field] += delta.get(field, 0)
+
+    def to_dict(self):
+        return dict(
+            name=self.name,
+            depth=self.depth,
+            wall_seconds=round(self.wall, 6),
+            commands=dict(self.commands.most_common()),
+            **self.counters,
+        )
+
+
+class Stats:
+    """
+    실행 단계별 Redis 사용량 계측 (전역 옵션 --stats / --stats-json)
+    - RedisUtils의 Connection(InstrumentedConnection)과 broadcast가 기록하므로 커맨드 코드는 단계만 표시
+    - 단계는 메인 스레드에서만 열고(with Stats.phase(...)), 그 안의 워커 스레드 기록은 현재 단계에 합산
+    - 꺼져 있으면(enabled=False) 기록하지 않고 phase는 소요 시간만 측정
+    """
+    enabled = False
+    _lock = threading.Lock()
+    _stack = []    # 열려 있는 단계 (바깥 → 안쪽)
+    _phases = []   # 시작 순서대로의 모든 단계
+    _delta = None  # 마지막 drain 이후의 기록 (프로세스 풀 워커 → 부모로 전달)
+
+    @staticmethod
+    @contextmanager
+    def phase(name):
+        """
+        with 블록을 하나의 단계로 계측. PhaseStats를 yield하며 블록이 끝나면 wall이 채워짐
+        """
+        with Stats._lock:
+            phase = PhaseStats(name, len(Stats._stack))
+            if Stats.enabled:
+                Stats._phases.append(phase)
+                Stats._stack.append(phase)
+        started = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            phase.wall = time.perf_counter() - started
+            with Stats._lock:
+                if phase in Stats._stack:
+                    Stats._stack.remove(phase)
+
+    @staticmethod
+    def command_name(args):
+        """
+        명령 인자에서 집계용 이름 추출 ("CLUSTER SETSLOT", "MIGRATE" 등)
+        """
+        if not args:
+            return "?"
+        words = [a.decode() if isinstance(a, bytes) else str(a) for a in args[:2]]
+        name = words[0].upper()
+        if " " not in name and name in ("CLUSTER", "CLIENT", "MEMORY", "CONFIG", "INFO") and len(words) > 1:
+            name = f"{name} {words[1].upper()}"
+        return name
+
+    @staticmethod
+    def record(commands=(), **counters):
+        """
+        현재 열린 모든 단계에 명령 이름 목록과 카운터 증가분을 더함
+        """
+        if not Stats.enabled:
+            return
+        delta = {"commands": Counter(commands), **counters}
+        with Stats._lock:
+            Stats._apply(delta)
+
+    @staticmethod
+    def drain():
+        """
+        마지막 drain 이후의 기록을 반환하고 비움 (프로세스 풀 워커에서 결과와 함께 부모로 보낼 때 사용)
+        """
+        with Stats._lock:
+            delta, Stats._delta = Stats._delta, None
+        if delta is None:
+            return None
+        return {"commands": dict(delta.commands), **delta.counters}
+
+    @staticmethod
+    def merge(delta):
+        """
+        다른 프로세스에서 drain한 기록을 현재 단계들에 더함
+        """
+        if not Stats.enabled or not delta:
+            return
+        with Stats._lock:
+            Stats._apply(delta)
+
+    @staticmethod
+    def _apply(delta):
+        if Stats._delta is None:
+            Stats._delta = PhaseStats("delta", 0)
+        for phase in Stats._stack + [Stats._delta]:
+            phase.add(delta)
+
+    @staticmethod
+    def report():
+        """
+        단계별 계측 결과 표 출력
+        """
+        print("\n📈 단계별 실행 통계")
+        print(f"  {'단계':<28}{'시간(s)':>9}{'명령':>10}{'왕복':>9}{'송신':>11}{'수신':>11}{'이동 키':>10}{'연결':>6}")
+        for phase in Stats._phases:
+            c = phase.counters
+            name = ("  " * phase.depth + phase.name)[:28]
+            print(f"  {name:<28}{phase.wall:>9.2f}{sum(phase.commands.values()):>10,}{c['round_trips']:>9,}"
+                  f"{Stats.format_bytes(c['bytes_sent']):>11}{Stats.format_bytes(c['bytes_received']):>11}"
+                  f"{c['keys_moved']:>10,}{c['connections_opened']:>6,}")
+            top = ", ".join(f"{cmd} {count:,}" for cmd, count in phase.commands.most_common(5))
+            if top:
+                print(f"  {'':<{2 * phase.depth}}  └ {top}")
+
+    @staticmethod
+    def write_json(path):
+        """
+        단계별 계측 결과를 JSON 파일로 저장
+        """
+        data = {
+            "argv": Stats._masked_argv(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "phases": [phase.to_dict() for phase in Stats._phases],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"📝 실행 통계 저장: {path}")
+
+    @staticmethod
+    def _masked_argv():
+        """
+        --password 값을 가린 실행 인자
+        """
+        argv = list(sys.argv[1:])
+        for i, arg in enumerate(argv):
+            if arg == "--password" and i + 1 < len(argv):
+                argv[i + 1] = "***"
+            elif arg.startswith("--password="):
+                argv[i] = "--password=***"
+        return argv
+
+    @staticmethod
+    def format_bytes(n):
+        for unit in ("B", "KB", "MB", "GB"):
+            if n < 1024 or unit == "GB":
+                return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+            n /= 1024
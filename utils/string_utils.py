@@ -14,3 +14,53 @@ class StringUtils:
         except Exception:
             print(f"잘못된 노드 주소 형식입니다: {host_port} (형식: ip:port)")
             sys.exit(1)
+
+    @staticmethod
+    def format_slot_ranges(slots):
+        """
+        슬롯 번호 목록을 "start-end" 범위 문자열로 압축.
+        example: [0, 1, 2, 5, 7, 8] -> "0-2,5,7-8"
+        """
+        ranges = []
+        for slot in sorted(set(slots)):
+            if ranges and ranges[-1][1] == slot - 1:
+                ranges[-1][1] = slot
+            else:
+                ranges.append([slot, slot])
+        return ",".join(f"{s}-{e}" if s != e else f"{s}" for s, e in ranges)
+
+    @staticmethod
+    def parse_slot_ranges(text):
+        """
+        "start-end" 범위 문자열을 슬롯 번호 리스트로 변환 (format_slot_ranges의 역변환).
+        example: "0-2,5" -> [0, 1, 2, 5]
+        """
+        slots = []
+        for part in filter(None, (p.strip() for p in text.split(","))):
+            try:
+                if "-" in part:
+                    start, end = map(int, part.split("-"))
+                    slots.extend(range(start, end + 1))
+                else:
+                    slots.append(int(part))
+            except ValueError:
+                print(f"잘못된 슬롯 범위 형식입니다: {part} (형식: 0-100,200)")
+                sys.exit(1)
+        return slots
+
+    @staticmethod
+    def parse_size(text):
+        """
+        바이트 크기 문자열을 정수로 변환 (단위: B, KB, MB, GB, 1024 기준, 단위 생략 시 B).
+        example: "64MB" -> 67108864, "512" -> 512
+        """
+        units = {"GB": 1 << 30, "MB": 1 << 20, "KB": 1 << 10, "B": 1}
+        value = text.strip().upper()
+        try:
+            for unit, factor in units.items():
+                if value.endswith(unit):
+                    return int(float(value[:-len(unit)]) * factor)
+            return int(value)
+        except ValueError:
+            print(f"잘못된 크기 형식입니다: {text} (형식: 512, 64KB, 16MB, 1GB)")
+            sys.exit(1)
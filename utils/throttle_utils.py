@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+
+
+class AdaptiveThrottle:
+    """
+    키 이동 속도를 조절하는 스로틀 (reshard --max-latency-ms / --max-mbps).
+    - 지연 목표(max_latency_ms가 있을 때만): 배치마다 MIGRATE 소요 시간(과 선택적으로 PING 프로브 지연)을 관찰해 AIMD로 조절
+      목표를 넘으면(혼잡) 배치 크기를 절반으로 줄이고, 이미 최소 배치이면 배치 사이 대기 시간을 두 배로 늘림
+      목표 안이면 대기 시간부터 10%씩 줄이고, 대기 시간이 0이면 배치 크기를 1씩 늘림
+    - 전송량 상한: 배치 크기는 그대로 두고, 배치마다 바이트 수만큼 전송 시각을 예약해 (GCRA) 워커 합계가 상한을 넘지 않도록 배치 시작을 늦춤
+    - 여러 슬롯을 동시에 이동하는 워커들이 하나의 스로틀을 공유
+    """
+    MIN_DELAY = 0.005       # 혼잡 시 처음 두는 배치 간 대기 시간(초)
+    MAX_DELAY = 1.0
+    WINDOW = 1.0            # 전송량(MB/s) 계산 구간(초)
+
+    def __init__(self, batch, max_latency_ms=None, max_mbps=None, min_batch=1, max_batch=1000):
+        self.batch = float(batch)
+        self.max_latency_ms = max_latency_ms
+        self.max_mbps = max_mbps
+        self.min_batch = min_batch
+        self.max_batch = max(max_batch, batch)
+        self.delay = 0.0
+        self.latency_ms = 0.0   # 최근 MIGRATE 배치 지연 (EWMA)
+        self.probe_ms = 0.0     # 최근 PING 프로브 지연 (최댓값 기준)
+        self.decreases = 0
+        self._sent = deque()    # (시각, bytes)
+        self._last_decrease = 0.0
+        self._next_send = 0.0   # 전송량 상한 기준 다음 배치를 시작할 수 있는 시각
+        self._lock = threading.Lock()
+
+    def batch_size(self):
+        return int(self.batch)
+
+    def pace(self, nbytes=0):
+        """
+        다음 배치 전에 현재 대기 시간만큼 쉬고, 전송량 상한이 있으면 nbytes를 보낼 차례가 될 때까지 기다림
+        """
+        wait = self.delay
+        if self.max_mbps:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_send)
+                self._next_send = start + nbytes / (self.max_mbps * 1e6)
+            wait = max(wait, start - now)
+        if wait > 0:
+            time.sleep(wait)
+
+    def observe(self, elapsed, nbytes=0):
+        """
+        배치 하나의 MIGRATE 소요 시간(초)과 전송 바이트 수(표시용)를 반영해 배치 크기 / 대기 시간 조정
+        """
+        now = time.monotonic()
+        with self._lock:
+            latency_ms = elapsed * 1000
+            self.latency_ms = latency_ms if not self.latency_ms else 0.8 * self.latency_ms + 0.2 * latency_ms
+            self._sent.append((now, nbytes))
+            while self._sent and now - self._sent[0][0] > AdaptiveThrottle.WINDOW:
+                self._sent.popleft()
+
+            if not self.max_latency_ms:
+                # 전송량 상한만 있으면 배치 크기는 --pipeline 그대로 두고 pace에서 시작 시각만 늦춤
+                return
+            if max(latency_ms, self.probe_ms) > self.max_latency_ms:
+                # 동시에 도착한 여러 워커의 관찰로 한 번의 혼잡에 여러 번 줄이지 않도록 간격을 둠
+                if now - self._last_decrease >= max(elapsed, self.delay, 0.05):
+                    self._last_decrease = now
+                    self.decreases += 1
+                    if self.batch > self.min_batch:
+                        self.batch = max(self.min_batch, self.batch / 2)
+                    else:
+                        self.delay = min(AdaptiveThrottle.MAX_DELAY, max(self.delay * 2, AdaptiveThrottle.MIN_DELAY))
+            elif self.delay:
+                self.delay = self.delay * 0.9 if self.delay * 0.9 >= AdaptiveThrottle.MIN_DELAY else 0.0
+            else:
+                self.batch = min(self.max_batch, self.batch + 1)
+
+    def mbps(self):
+        """
+        최근 WINDOW초 동안의 전송량 (MB/s)
+        """
+        return sum(nbytes for _, nbytes in self._sent) / AdaptiveThrottle.WINDOW / 1e6
+
+    def report_probe(self, latency_ms):
+        with self._lock:
+            self.probe_ms = latency_ms
+
+    def status(self):
+        """
+        진행바 표시용 현재 상태
+        """
+        status = {"batch": self.batch_size(), "lat_ms": f"{self.latency_ms:.1f}"}
+        if self.delay:
+            status["pace_ms"] = f"{self.delay * 1000:.0f}"
+        if self.max_mbps:
+            status["MBps"] = f"{self.mbps():.1f}"
+        if self.probe_ms:
+            status["ping_ms"] = f"{self.probe_ms:.1f}"
+        return status
+
+
+class LatencyProbe:
+    """
+    이동 중인 노드들에 주기적으로 PING을 보내 가장 느린 응답 시간을 스로틀에 알려주는 백그라운드 스레드.
+    MIGRATE 지연만으로는 보이지 않는, 같은 노드를 쓰는 다른 클라이언트가 겪는 지연을 근사하기 위해 사용.
+    with 블록 동안만 동작.
+    """
+
+    def __init__(self, conns, throttle, interval=0.1):
+        self.conns = conns
+        self.throttle = throttle
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            worst = 0.0
+            for conn in self.conns:
+                started = time.perf_counter()
+                try:
+                    conn.ping()
+                    worst = max(worst, (time.perf_counter() - started) * 1000)
+                except Exception:
+                    # 응답하지 못한 노드는 혼잡으로 간주
+                    worst = float("inf")
+            self.throttle.report_probe(worst)
+            self._stop.wait(self.interval)
@@ -0,0 +1,83 @@
+import heapq
+
+
+class TopK:
+    """
+    가중치(weight)가 가장 큰 k개 항목만 유지하는 스트리밍 top-K (크기 k의 최소 힙, 메모리 O(k))
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+
+    def add(self, weight, item):
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, (weight, item))
+        elif weight > self.heap[0][0]:
+            heapq.heapreplace(self.heap, (weight, item))
+
+    def merge(self, other):
+        for weight, item in other.heap:
+            self.add(weight, item)
+
+    def items(self):
+        """
+        [(weight, item)] 큰 순서대로
+        """
+        return sorted(self.heap, key=lambda entry: entry[0], reverse=True)
+
+
+class SpaceSaving:
+    """
+    Space-Saving 알고리즘으로 가중 빈도가 높은 항목을 capacity개 카운터 안에서 추정.
+    - 카운터가 가득 차면 가장 작은 카운터를 새 항목에 넘겨주고, 넘겨받은 값을 오차(error)로 기록
+    - 실제 값은 count - error 이상 count 이하이며, 전체 합의 1/capacity보다 큰 항목은 반드시 남음
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counters = {}  # item → [count, error]
+        self.total = 0
+        self._heap = []     # (count, item), 갱신 전 값은 꺼낼 때 버림 (최솟값 카운터 탐색 O(log n))
+
+    def add(self, item, weight=1):
+        self.total += weight
+        counter = self.counters.get(item)
+        if counter is not None:
+            counter[0] += weight
+        elif len(self.counters) < self.capacity:
+            counter = self.counters[item] = [weight, 0]
+        else:
+            floor = self._pop_min()
+            counter = self.counters[item] = [floor + weight, floor]
+        heapq.heappush(self._heap, (counter[0], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, (count, _) in self.counters.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self):
+        """
+        가장 작은 카운터를 제거하고 그 값을 반환
+        """
+        while True:
+            count, item = heapq.heappop(self._heap)
+            counter = self.counters.get(item)
+            if counter is not None and counter[0] == count:
+                del self.counters[item]
+                return count
+
+    def merge(self, other):
+        """
+        다른 SpaceSaving의 카운터를 합침 (합친 뒤 오차는 두 오차의 합 이하)
+        """
+        for item, (count, error) in other.counters.items():
+            self.add(item, count)
+            self.counters[item][1] += error
+        self.total += other.total - sum(count for count, _ in other.counters.values())
+
+    def top(self, n):
+        """
+        [(item, count, error)] 추정값이 큰 순서대로 n개
+        """
+        ranked = sorted(self.counters.items(), key=lambda entry: entry[1][0], reverse=True)
+        return [(item, count, error) for item, (count, error) in ranked[:n]]
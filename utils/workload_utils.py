@@ -0,0 +1,177 @@
+import random
+import sys
+
+
+class WorkloadGenerator:
+    """
+    populate-test-data에서 사용할 결정적(deterministic) 워크로드 생성기.
+    같은 seed와 옵션이면 배치 분할, 워커 수와 관계없이 항상 같은 키/값을 생성.
+
+    - data_type: string, hash, list, zset, stream, mixed (mixed는 키마다 타입을 고정적으로 섞음)
+    - value_size: 값 크기 분포 (None이면 기존 "val:NNNNNNNNNN" 형식)
+    - key_dist: 쓰기마다 키를 고르는 방식
+        sequential(기존 방식, i번째 쓰기 → i번째 키), uniform(무작위), zipf(소수의 키에 쓰기 집중 → big key)
+    - hot_tags / hot_ratio: hot_ratio 비율의 키에 hot_tags개 중 하나의 해시 태그를 붙여 일부 슬롯에 집중
+    - ttl_ratio / ttl_range: ttl_ratio 비율의 쓰기에 ttl_range(초) 범위의 TTL 부여
+    - elements: 컬렉션 타입에서 쓰기 한 번에 추가할 원소 수
+    """
+    TYPES = ("string", "hash", "list", "zset", "stream")
+    BLOCK = 64  # 난수 초기화 단위 (쓰기 수)
+
+    def __init__(self, num_keys, data_type="string", value_size=None, key_dist="sequential", zipf_s=1.0,
+                 hot_tags=0, hot_ratio=0.0, ttl_ratio=0.0, ttl_range=(60, 3600), elements=1, seed=0):
+        self.num_keys = num_keys
+        self.data_type = data_type
+        self.value_size = value_size
+        self.key_dist = key_dist
+        self.zipf_s = zipf_s
+        self.hot_tags = hot_tags
+        self.hot_ratio = hot_ratio
+        self.ttl_ratio = ttl_ratio
+        self.ttl_range = ttl_range
+        self.elements = elements
+        self.seed = seed
+
+    def is_legacy(self):
+        """
+        기존 key:NNNNNNNNNN → val:NNNNNNNNNN 형식 그대로인지 여부
+        """
+        return (self.data_type == "string" and self.value_size is None and self.key_dist == "sequential"
+                and not self.hot_ratio and not self.ttl_ratio)
+
+    def describe(self):
+        value = "val:NNNNNNNNNN" if self.value_size is None else ":".join(map(str, self.value_size))
+        return (f"type={self.data_type}, value-size={value}, key-dist={self.key_dist}, "
+                f"hot-tags={self.hot_tags}x{self.hot_ratio:g}, ttl-ratio={self.ttl_ratio:g}, seed={self.seed}")
+
+    def batch(self, start, end):
+        """
+        [start, end) 번째 쓰기 생성.
+        (key, type, elements, ttl_ms) 튜플을 차례로 반환.
+        - string: [value], hash: [(field, value)], list/stream: [value], zset: [(member, score)]
+        난수는 배치 크기와 무관한 BLOCK개 단위 블록마다 (seed, 블록 번호)로 초기화하므로,
+        배치 경계가 어디든 i번째 쓰기는 항상 같은 결과 (블록 중간에서 시작하면 앞부분은 생성 후 버림).
+        """
+        i = start
+        while i < end:
+            block_start = i - i % self.BLOCK
+            block_end = min(end, block_start + self.BLOCK)
+            rng = random.Random(f"{self.seed}:{block_start // self.BLOCK}")
+            for j in range(block_start, block_end):
+                record = self._record(j, rng)
+                if j >= i:
+                    yield record
+            i = block_end
+
+    def _record(self, i, rng):
+        index = self._key_index(i, rng)
+        key = self.key_name(index)
+        data_type = self._type_of(index)
+        ttl = None
+        if self.ttl_ratio and rng.random() < self.ttl_ratio:
+            ttl = rng.randint(*self.ttl_range) * 1000
+        return key, data_type, self._elements(data_type, i, rng), ttl
+
+    def key_name(self, index):
+        """
+        키 번호로 키 이름 생성. hot 키는 해시 태그로 같은 슬롯에 모임
+        """
+        if self.hot_ratio and self.hot_tags:
+            h = self._hash(index, 1)
+            if h / 2 ** 32 < self.hot_ratio:
+                return f"key:{{hot:{h % self.hot_tags}}}:{index:010d}"
+        return f"key:{index:010d}"
+
+    def _key_index(self, i, rng):
+        if self.key_dist == "sequential":
+            return i
+        if self.key_dist == "uniform":
+            return rng.randint(1, self.num_keys)
+        return self._zipf(rng)
+
+    def _zipf(self, rng):
+        """
+        1..num_keys 범위의 zipf 근사 샘플 (연속 멱법칙 분포의 역함수, 메모리 O(1))
+        """
+        n, s, u = self.num_keys, self.zipf_s, rng.random()
+        if abs(s - 1.0) < 1e-9:
+            x = (n + 1) ** u
+        else:
+            x = (((n + 1) ** (1 - s) - 1) * u + 1) ** (1 / (1 - s))
+        return min(n, max(1, int(x)))
+
+    def _type_of(self, index):
+        if self.data_type != "mixed":
+            return self.data_type
+        return self.TYPES[self._hash(index, 2) % len(self.TYPES)]
+
+    def _elements(self, data_type, i, rng):
+        if data_type == "string":
+            return [self._value(i, rng)]
+        elements = []
+        for n in range(self.elements):
+            member = f"m:{i:010d}:{n}"
+            if data_type == "hash":
+                elements.append((member, self._value(i, rng)))
+            elif data_type == "zset":
+                elements.append((member, rng.random()))
+            else:
+                elements.append(self._value(i, rng))
+        return elements
+
+    def _value(self, i, rng):
+        base = f"val:{i:010d}"
+        if self.value_size is None:
+            return base
+        kind, *params = self.value_size
+        if kind == "fixed":
+            size = params[0]
+        elif kind == "uniform":
+            size = rng.randint(*params)
+        else:  # exp: 평균 크기 params[0]의 지수 분포 (긴 꼬리)
+            size = max(1, int(rng.expovariate(1 / params[0])))
+        return (base * (size // len(base) + 1))[:size]
+
+    def _hash(self, index, salt):
+        # 키 번호별로 고정된 값 (hot 여부, mixed 타입 결정용)
+        return (index * 2654435761 + self.seed * 40503 + salt * 2246822519) % 2 ** 32
+
+    @staticmethod
+    def parse_value_size(spec):
+        """
+        값 크기 분포 문자열 파싱
+        example: "fixed:128", "uniform:16-1024", "exp:512", "128"(= fixed:128)
+        """
+        if spec is None:
+            return None
+        try:
+            kind, _, params = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+            if kind == "fixed" or kind == "exp":
+                value = int(params)
+                if value < 1:
+                    raise ValueError
+                return kind, value
+            if kind == "uniform":
+                low, high = map(int, params.split("-"))
+                if low < 1 or high < low:
+                    raise ValueError
+                return kind, low, high
+        except ValueError:
+            pass
+        print(f"❌ 잘못된 값 크기 형식입니다: {spec} (형식: fixed:N, uniform:MIN-MAX, exp:MEAN)")
+        sys.exit(1)
+
+    @staticmethod
+    def parse_ttl_range(spec):
+        """
+        TTL 범위(초) 파싱. example: "60-3600", "300"
+        """
+        try:
+            low, _, high = spec.partition("-")
+            low, high = int(low), int(high or low)
+            if 1 <= low <= high:
+                return low, high
+        except ValueError:
+            pass
+        print(f"❌ 잘못된 TTL 범위 형식입니다: {spec} (형식: MIN-MAX, 초 단위)")
+        sys.exit(1)